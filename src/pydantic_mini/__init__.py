@@ -21,9 +21,58 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 __version__ = "1.2.0"
 
+import importlib
+
 from .base import BaseModel
 from .typing import Attrib, MiniAnnotated
 from .exceptions import ValidationError
 
 
-__all__ = ["BaseModel", "Attrib", "MiniAnnotated", "ValidationError"]
+__all__ = [
+    "BaseModel",
+    "Attrib",
+    "MiniAnnotated",
+    "ValidationError",
+    "ModelBatch",
+    "register_type_checker",
+]
+
+# Public names imported from their module on first access
+_LAZY_ATTRIBUTES = {"ModelBatch": "batch", "register_type_checker": "checkers"}
+
+# Submodules imported on first access, so that e.g. the formatters and their
+# dependencies (csv, json, mmap, ...), or the coercers and theirs (datetime,
+# decimal, uuid), are not imported until they are used
+_LAZY_SUBMODULES = frozenset(
+    [
+        "accelerators",
+        "async_validation",
+        "batch",
+        "binary",
+        "cache",
+        "checkers",
+        "coercers",
+        "encoders",
+        "formatters",
+        "json_backends",
+        "projection",
+        "recursive",
+        "schema_cache",
+    ]
+)
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__)
+        value = getattr(module, name)
+    elif name in _LAZY_SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | _LAZY_SUBMODULES)
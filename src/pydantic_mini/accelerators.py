@@ -0,0 +1,202 @@
+import typing
+from array import array
+from dataclasses import fields, is_dataclass
+
+from .base import DEFERRED_CONSTRAINTS, DEFERRED_INSTANCES
+from .typing import get_args, get_forward_type, get_type, is_mini_annotated
+
+if typing.TYPE_CHECKING:
+    from .base import BaseModel
+    from .batch import ModelBatch
+
+__all__ = (
+    "USE_NUMPY",
+    "DEFERRED_CONSTRAINTS",
+    "DEFERRED_INSTANCES",
+    "get_numpy",
+    "ColumnConstraintChecker",
+)
+
+# Set to False to always validate batch constraints row by row in pure Python.
+USE_NUMPY = True
+
+_NUMERIC_CONSTRAINTS = ("gt", "ge", "lt", "le")
+_LENGTH_CONSTRAINTS = ("min_length", "max_length")
+
+_FLOAT_EXACT_INT = 2**53
+
+_numpy = None
+_numpy_checked = False
+
+
+def get_numpy() -> typing.Optional[typing.Any]:
+    """Import numpy on first use. Returns None if numpy is not installed or disabled."""
+    global _numpy, _numpy_checked
+
+    if not USE_NUMPY:
+        return None
+
+    if not _numpy_checked:
+        _numpy_checked = True
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _numpy = numpy
+    return _numpy
+
+
+def _is_flat_model(model: typing.Type["BaseModel"]) -> bool:
+    # Nested instances of the same model are built in the same context as the
+    # batch rows, but they are not stored in the columns. Only models without
+    # nested models can skip row constraints safely.
+    for fd in fields(model):
+        annotation = get_args(fd.type)[0] if is_mini_annotated(fd.type) else fd.type
+        if get_forward_type(annotation) is not None:
+            return False
+        for arg in (annotation, *get_args(annotation)):
+            typ = get_type(arg)
+            if is_dataclass(typ):
+                return False
+    return True
+
+
+class ColumnConstraintChecker:
+    """
+    Checks the ``gt/ge/lt/le`` constraints of numeric columns and the
+    ``min_length/max_length`` constraints of string columns of a ModelBatch
+    with vectorised numpy comparisons.
+
+    Rows that may fail are re-checked with ``Attrib.validate``, so the raised
+    error is the same one that row-by-row validation would raise.
+    """
+
+    __slots__ = ("numpy", "constraints", "deferred")
+
+    def __init__(
+        self, numpy, constraints: typing.List[typing.Tuple[str, typing.Any, str]]
+    ):
+        self.numpy = numpy
+        self.constraints = constraints
+        self.deferred = {
+            name: frozenset(
+                _NUMERIC_CONSTRAINTS if kind == "numeric" else _LENGTH_CONSTRAINTS
+            )
+            for name, _, kind in constraints
+        }
+
+    @classmethod
+    def for_batch(
+        cls, batch: "ModelBatch"
+    ) -> typing.Optional["ColumnConstraintChecker"]:
+        """Return a checker for the batch, or None if nothing can be vectorised."""
+        from .base import BaseModel, PYDANTIC_MINI_EXTRA_MODEL_CONFIG
+
+        model = batch.model
+        config = getattr(model, PYDANTIC_MINI_EXTRA_MODEL_CONFIG, {})
+        if config.get("disable_all_validation"):
+            return None
+
+        # hooks run after the constraints and may change the stored value
+        if model.validate is not BaseModel.validate:
+            return None
+
+        numpy = get_numpy()
+        if numpy is None or not _is_flat_model(model):
+            return None
+
+        constraints = []
+        for fd in fields(model):
+            if not is_mini_annotated(fd.type) or hasattr(model, f"validate_{fd.name}"):
+                continue
+
+            annotation, attrib = get_args(fd.type)[0], fd.type.__metadata__[0]
+            column = batch.column(fd.name)
+            if isinstance(column, array) and column.typecode in ("q", "d"):
+                names = _NUMERIC_CONSTRAINTS
+                kind = "numeric"
+            elif annotation is str:
+                names = _LENGTH_CONSTRAINTS
+                kind = "length"
+            else:
+                continue
+
+            bounds = [getattr(attrib, name) for name in names]
+            if all(bound is None for bound in bounds):
+                continue
+            if all(bound is None or type(bound) in (int, float) for bound in bounds):
+                constraints.append((fd.name, attrib, kind))
+
+        if not constraints:
+            return None
+        return cls(numpy, constraints)
+
+    def _column_values(self, column, kind: str, start: int, stop: int):
+        np = self.numpy
+        if kind == "numeric":
+            if not isinstance(column, array):
+                # the column fell back to a list e.g. for an int that overflows int64
+                return None
+            dtype = np.int64 if column.typecode == "q" else np.float64
+            # copy the slice so that no buffer export keeps the array from growing
+            return np.frombuffer(column, dtype=dtype)[start:stop].copy()
+        try:
+            return np.fromiter(
+                map(len, column[start:stop]), dtype=np.int64, count=stop - start
+            )
+        except TypeError:
+            return None
+
+    def _candidate_rows(self, batch: "ModelBatch", start: int, stop: int):
+        np = self.numpy
+        mask = np.zeros(stop - start, dtype=bool)
+
+        for name, attrib, kind in self.constraints:
+            values = self._column_values(batch.column(name), kind, start, stop)
+            if values is None:
+                mask[:] = True
+                break
+
+            # Attrib.validate replaces falsy values with the field default,
+            # so those rows are always re-checked in Python.
+            mask |= values == 0
+            if values.dtype == np.int64:
+                # int64 values beyond float precision may compare differently
+                # against float bounds
+                mask |= np.abs(values) > _FLOAT_EXACT_INT
+            if kind == "numeric":
+                if attrib.gt is not None:
+                    mask |= ~(values > attrib.gt)
+                if attrib.ge is not None:
+                    mask |= ~(values >= attrib.ge)
+                if attrib.lt is not None:
+                    mask |= ~(values < attrib.lt)
+                if attrib.le is not None:
+                    mask |= ~(values <= attrib.le)
+            else:
+                if attrib.min_length is not None:
+                    mask |= ~(values >= attrib.min_length)
+                if attrib.max_length is not None:
+                    mask |= ~(values <= attrib.max_length)
+
+        return np.flatnonzero(mask) + start
+
+    def check(self, batch: "ModelBatch", start: int, stop: int) -> None:
+        """
+        Check rows ``start`` to ``stop`` of the batch.
+
+        Raises:
+            ValidationError: For the first row that violates a constraint.
+        """
+        if start >= stop:
+            return
+
+        for row in self._candidate_rows(batch, start, stop).tolist():
+            for name, attrib, _ in self.constraints:
+                try:
+                    attrib.validate(batch.column(name)[row], name)
+                except TypeError as e:
+                    # same message as init_class, which creates the batch records
+                    raise TypeError(
+                        f"Failed to instantiate {batch.model.__name__}: {e}"
+                    ) from e
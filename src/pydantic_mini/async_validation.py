@@ -0,0 +1,40 @@
+import asyncio
+import typing
+
+__all__ = ("gather_limited",)
+
+
+async def gather_limited(
+    factories: typing.Sequence[typing.Callable[[], typing.Awaitable[typing.Any]]],
+    max_concurrency: typing.Optional[int] = None,
+) -> typing.List[typing.Any]:
+    """
+    Await the awaitables returned by the factories concurrently, at most
+    ``max_concurrency`` at a time, and return their results in order.
+
+    Exceptions are returned in place of results, so that all the awaitables finish
+    and the caller can report the first error in a deterministic order.
+
+    Raises:
+        ValueError: If ``max_concurrency`` is less than 1.
+    """
+    if max_concurrency is not None and max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be at least 1, not {max_concurrency}")
+
+    semaphore = (
+        asyncio.Semaphore(max_concurrency)
+        if max_concurrency is not None and max_concurrency < len(factories)
+        else None
+    )
+
+    async def run(factory: typing.Callable[[], typing.Awaitable[typing.Any]]):
+        # the awaitable is created once a slot is free, and errors raised by the
+        # factory itself are returned like the errors of the awaitable
+        if semaphore is None:
+            return await factory()
+        async with semaphore:
+            return await factory()
+
+    return await asyncio.gather(
+        *(run(factory) for factory in factories), return_exceptions=True
+    )
@@ -1,12 +1,14 @@
+import copy
 import typing
 import keyword
 import inspect
-from enum import Enum
+import functools
+import contextvars
 from collections import OrderedDict
-from dataclasses import dataclass, fields, Field, field, MISSING, is_dataclass
-from .formatters import BaseModelFormatter
+from dataclasses import dataclass, fields, Field, field, MISSING
 from .typing import (
     is_mini_annotated,
+    is_async_callable,
     get_type,
     get_origin,
     get_args,
@@ -15,16 +17,20 @@ from .typing import (
     Attrib,
     is_collection,
     is_optional_type,
-    is_builtin_type,
     is_initvar_type,
     is_class_var_type,
     ModelConfigWrapper,
     resolve_annotations,
     dataclass_transform,
 )
-from .utils import init_class
+from .utils import get_schema_fingerprint
 from .exceptions import ValidationError
 
+if typing.TYPE_CHECKING:
+    from .batch import ModelBatch
+    from .cache import CacheInfo
+    from .formatters import BaseModelFormatter
+    from .projection import ProjectionPlan
 
 __all__ = ("BaseModel",)
 
@@ -32,6 +38,195 @@ PYDANTIC_MINI_EXTRA_MODEL_CONFIG = "__pydantic_mini_extra_config__"
 
 _RESOLVED_TYPE_CACHE = {}
 
+_FIELD_NAMES_CACHE = {}
+
+_SETATTR_PLAN_CACHE = {}
+
+_ASYNC_VALIDATOR_PLAN_CACHE = {}
+
+# Bump when the layout of pickled models changes
+_PICKLE_VERSION = 1
+
+# Instance state key set once a model that hooks __setattr__ is initialised
+_INITIALISED = "__pydantic_mini_initialised__"
+
+# Instance state key holding the names of the fields changed since the last checkpoint
+_CHANGED_FIELDS = "__pydantic_mini_changed_fields__"
+
+# Instance state keys that are not model attributes
+_INTERNAL_STATE_KEYS = frozenset([_INITIALISED, _CHANGED_FIELDS])
+
+# Constraints that batch validation checks column-wise instead of per row.
+# Maps a model class to {field_name: constraint_names} while a ModelBatch is built.
+DEFERRED_CONSTRAINTS: contextvars.ContextVar[
+    typing.Optional[typing.Dict[type, typing.Dict[str, typing.FrozenSet[str]]]]
+] = contextvars.ContextVar("pydantic_mini_deferred_constraints", default=None)
+
+# The instances created with deferred constraints while a ModelBatch is built, with the
+# fields that were validated. The batch checks the constraints of the ones it does not
+# append, since its column check does not cover them.
+DEFERRED_INSTANCES: contextvars.ContextVar[
+    typing.Optional[typing.List[typing.Tuple["BaseModel", typing.Sequence[Field]]]]
+] = contextvars.ContextVar("pydantic_mini_deferred_instances", default=None)
+
+# The plans of the models being loaded with a projection. Maps a model class to its
+# plan, so that the fields left out are not validated.
+LOAD_PROJECTION: contextvars.ContextVar[
+    typing.Optional[typing.Dict[type, "ProjectionPlan"]]
+] = contextvars.ContextVar("pydantic_mini_load_projection", default=None)
+
+
+# The checkers and coercers, and the modules they use e.g. datetime and decimal, are
+# imported when the first instance is validated. Each stub replaces itself with the
+# function it imports, so later calls cost nothing extra.
+def compile_type_checker(annotation: typing.Any) -> typing.Callable[[typing.Any], bool]:
+    global compile_type_checker
+    from .checkers import compile_type_checker
+
+    return compile_type_checker(annotation)
+
+
+def compile_coercer(
+    annotation: typing.Any, discriminator: typing.Optional[str] = None
+) -> typing.Callable[[typing.Any], typing.Any]:
+    global compile_coercer
+    from .coercers import compile_coercer
+
+    return compile_coercer(annotation, discriminator)
+
+
+def _hooks_setattr(config: typing.Dict[str, typing.Any]) -> bool:
+    return config.get("validate_assignment", False) or config.get(
+        "track_changes", False
+    )
+
+
+def _get_setattr_plan(
+    cls: typing.Type["BaseModel"],
+) -> typing.Tuple[typing.Dict[str, typing.Tuple[Field, typing.Any]], bool, bool]:
+    try:
+        return _SETATTR_PLAN_CACHE[cls]
+    except KeyError:
+        pass
+
+    config = getattr(cls, PYDANTIC_MINI_EXTRA_MODEL_CONFIG, {})
+    resolved_hints = cls._get_resolved_type_hints()
+    plan = (
+        {fd.name: (fd, resolved_hints.get(fd.name, fd.type)) for fd in fields(cls)},
+        config.get("validate_assignment", False),
+        config.get("track_changes", False),
+    )
+    _SETATTR_PLAN_CACHE[cls] = plan
+    return plan
+
+
+def _get_async_validator_plan(
+    cls: typing.Type["BaseModel"],
+) -> typing.Tuple[
+    bool,
+    typing.Dict[str, typing.Tuple[Field, Attrib, typing.Tuple, typing.Optional[str]]],
+]:
+    """
+    Return whether the ``validate`` hook of the model is async, and for each field
+    with async validators: the field, its Attrib, its async Attrib validators and
+    the name of its ``validate_<field>`` hook if that is async.
+    """
+    try:
+        return _ASYNC_VALIDATOR_PLAN_CACHE[cls]
+    except KeyError:
+        pass
+
+    resolved_hints = cls._get_resolved_type_hints()
+    validate_hook = is_async_callable(cls.validate)
+    by_field = {}
+    for fd in fields(cls):
+        annotation = resolved_hints.get(fd.name, fd.type)
+        query = getattr(annotation, "__metadata__", (None,))[0]
+        if not isinstance(query, Attrib):
+            query = None
+        validators = tuple(query._async_validators) if query is not None else ()
+        method_name = f"validate_{fd.name}"
+        if not is_async_callable(getattr(cls, method_name, None)):
+            method_name = None
+        if validators or method_name or validate_hook:
+            by_field[fd.name] = fd, query, validators, method_name
+
+    plan = validate_hook, by_field
+    _ASYNC_VALIDATOR_PLAN_CACHE[cls] = plan
+    return plan
+
+
+def _model_setattr(self: "BaseModel", name: str, value: typing.Any) -> None:
+    """
+    ``__setattr__`` of models configured with ``validate_assignment`` or ``track_changes``.
+
+    With ``validate_assignment``, runs the validation steps of the assigned field only,
+    except its pre-formatter, and restores the previous value if validation fails.
+    With ``track_changes``, records the name of the field if its value changed.
+    """
+    state = self.__dict__
+    field_plan, validate_assignment, track_changes = _get_setattr_plan(self.__class__)
+    field_info = field_plan.get(name)
+    if field_info is None or not state.get(_INITIALISED):
+        object.__setattr__(self, name, value)
+        return
+
+    previous = state.get(name, MISSING)
+    if validate_assignment:
+        # assignments made by the validation steps themselves are not validated again
+        state[_INITIALISED] = False
+        state[name] = value
+        try:
+            self._validate_field(
+                field_info[0],
+                field_info[1],
+                getattr(self, PYDANTIC_MINI_EXTRA_MODEL_CONFIG, {}),
+                run_pre_formatter=False,
+            )
+        except BaseException:
+            if previous is MISSING:
+                state.pop(name, None)
+            else:
+                state[name] = previous
+            raise
+        finally:
+            state[_INITIALISED] = True
+    else:
+        state[name] = value
+
+    if track_changes and (previous is MISSING or previous != state[name]):
+        state[_CHANGED_FIELDS].add(name)
+
+
+def _mark_initialised(instance: "BaseModel") -> None:
+    state = instance.__dict__
+    state[_INITIALISED] = True
+    if getattr(instance, PYDANTIC_MINI_EXTRA_MODEL_CONFIG, {}).get(
+        "track_changes", False
+    ):
+        state[_CHANGED_FIELDS] = set()
+
+
+def _restore_model(
+    cls: typing.Type["BaseModel"],
+    schema: typing.Tuple[int, bytes],
+    values: typing.Tuple[typing.Any, ...],
+    extra: typing.Optional[typing.Dict[str, typing.Any]],
+) -> "BaseModel":
+    """Rebuild a pickled model instance. See BaseModel.__reduce__."""
+    if schema != (_PICKLE_VERSION, get_schema_fingerprint(cls)):
+        import pickle
+
+        raise pickle.UnpicklingError(
+            f"Cannot unpickle '{cls.__name__}': it was pickled with a different "
+            f"schema of the model"
+        )
+
+    instance = cls._build_without_validation(dict(zip(cls._get_field_names(), values)))
+    if extra:
+        instance.__dict__.update(extra)
+    return instance
+
 
 class SchemaMeta(type):
 
@@ -40,9 +235,18 @@ class SchemaMeta(type):
         if not parents:
             return super().__new__(cls, name, bases, attrs)
 
-        new_attrs = cls.build_class_namespace(name, attrs)
+        from .schema_cache import schema_key, load_model_fields, store_model_fields
 
-        cls._prepare_model_fields(new_attrs)
+        key = schema_key(name, attrs)
+        cached_fields = load_model_fields(key)
+        if cached_fields is not None:
+            new_attrs = attrs.copy()
+            cls._apply_cached_fields(new_attrs, cached_fields)
+        else:
+            new_attrs = cls.build_class_namespace(name, attrs)
+
+            cls._prepare_model_fields(new_attrs)
+            store_model_fields(key, new_attrs.get("__annotations__", {}))
 
         new_class = super().__new__(cls, name, bases, new_attrs, **kwargs)
 
@@ -56,7 +260,22 @@ class SchemaMeta(type):
             config.get_non_dataclass_config(),
         )
 
-        return dataclass(new_class, **config.get_dataclass_config())  # type: ignore
+        dataclass_config = config.get_dataclass_config()
+
+        if config.get_config("loads_cache_size") and not dataclass_config["frozen"]:
+            raise TypeError(
+                f"Model '{name}' sets 'loads_cache_size' but is not frozen. "
+                f"Cached instances are shared, so set 'frozen = True' in the model Config."
+            )
+
+        new_class = dataclass(new_class, **dataclass_config)  # type: ignore
+
+        if not dataclass_config["frozen"] and _hooks_setattr(
+            config.get_non_dataclass_config()
+        ):
+            new_class.__setattr__ = _model_setattr
+
+        return new_class
 
     @classmethod
     def build_class_namespace(
@@ -242,6 +461,38 @@ class SchemaMeta(type):
         if ann_without_defaults:
             attrs["__annotations__"] = ann_without_defaults
 
+    @classmethod
+    def _apply_cached_fields(
+        cls,
+        attrs: typing.Dict[str, typing.Any],
+        annotations: typing.Dict[str, typing.Any],
+    ) -> None:
+        """
+        Set the defaults of the fields from annotations prepared by
+        ``_prepare_model_fields`` and read from the schema cache.
+        """
+        for field_name, annotation in annotations.items():
+            value = attrs.get(field_name, MISSING)
+            if not is_mini_annotated(annotation):
+                if value is not MISSING:
+                    attrs[field_name] = (
+                        value.default if isinstance(value, Field) else value
+                    )
+                continue
+
+            attrib = annotation.__metadata__[0]
+            if isinstance(value, Field) and value.default is value.default_factory:
+                # a bare field() of an optional field, which defaults to None
+                value = MISSING
+            if value is MISSING and attrib.has_default():
+                if attrib.default is not MISSING:
+                    attrs[field_name] = field(default=attrib.default)
+                else:
+                    attrs[field_name] = field(default_factory=attrib.default_factory)
+
+        if annotations:
+            attrs["__annotations__"] = annotations
+
 
 class PreventOverridingMixin:
 
@@ -270,9 +521,9 @@ class BaseModel(PreventOverridingMixin, metaclass=SchemaMeta):
     def __model_init__(self, *args, **kwargs) -> None:
         pass
 
-    def __post_init__(self, *args, **kwargs) -> None:
-        cls = self.__class__
-
+    @classmethod
+    def _get_resolved_type_hints(cls) -> typing.Dict[str, typing.Any]:
+        """Return the field annotations of the model with forward references resolved."""
         if cls not in _RESOLVED_TYPE_CACHE:
             try:
                 _RESOLVED_TYPE_CACHE[cls] = resolve_annotations(
@@ -285,124 +536,238 @@ class BaseModel(PreventOverridingMixin, metaclass=SchemaMeta):
                 # or try to use the class's own namespace.
                 _RESOLVED_TYPE_CACHE[cls] = getattr(cls, "__annotations__", {})
 
-        resolved_hints = _RESOLVED_TYPE_CACHE[cls]
-
-        config = getattr(self, PYDANTIC_MINI_EXTRA_MODEL_CONFIG, {})
-        strict_mode = config.get("strict_mode", False)
-        disable_typecheck = config.get("disable_typecheck", False)
-        disable_all_validation = config.get("disable_all_validation", False)
+        return _RESOLVED_TYPE_CACHE[cls]
 
-        for fd in fields(self):
-            resolved_field_type = resolved_hints.get(fd.name, fd.type)
+    @classmethod
+    def _get_field_names(cls) -> typing.Tuple[str, ...]:
+        try:
+            return _FIELD_NAMES_CACHE[cls]
+        except KeyError:
+            names = _FIELD_NAMES_CACHE[cls] = tuple(fd.name for fd in fields(cls))
+            return names
 
-            query: Attrib = (
-                hasattr(resolved_field_type, "__metadata__")
-                and resolved_field_type.__metadata__[0]
-                or None
-            )
+    @classmethod
+    def _build_without_validation(
+        cls,
+        values: typing.Dict[str, typing.Any],
+        init_values: typing.Optional[typing.Sequence[typing.Any]] = None,
+    ) -> "BaseModel":
+        """
+        Create an instance from field values that are already valid, e.g. values
+        taken from another instance, without running ``__init__`` or ``__post_init__``.
+        ``__model_init__`` is called with ``init_values``, the values of the InitVar
+        fields, when they are given.
+        """
+        instance = cls.__new__(cls)
+        instance.__dict__.update(values)
+        if init_values is not None:
+            instance.__model_init__(*init_values)
+        if _hooks_setattr(getattr(cls, PYDANTIC_MINI_EXTRA_MODEL_CONFIG, {})):
+            _mark_initialised(instance)
+        return instance
 
-            if query:
-                # execute the pre-formatters for all the fields
-                query.execute_pre_formatter(self, fd)
-
-            if not disable_all_validation:
-                # no type validation for Any field type and type checking is not disabled
-                if resolved_field_type is not typing.Any and not disable_typecheck:
-                    if not strict_mode:
-                        self._inner_schema_value_preprocessor(fd, resolved_field_type)
-                    self._field_type_validator(fd, resolved_field_type)
-                else:
-                    # run other field validators when type checking is disabled
-                    if query:
-                        value = getattr(self, fd.name, None)
-                        query.execute_field_validators(self, fd)
-                        query.validate(value, fd.name)
-                try:
-                    result = self.validate(getattr(self, fd.name), fd)
-                    if result is not None:
-                        setattr(self, fd.name, result)
-                except NotImplementedError:
-                    pass
+    def __post_init__(self, *args, **kwargs) -> None:
+        cls = self.__class__
 
-                method = getattr(self, f"validate_{fd.name}", None)
-                if method and callable(method):
-                    result = method(getattr(self, fd.name), fd)
-                    if result is not None:
-                        setattr(self, fd.name, result)
+        resolved_hints = cls._get_resolved_type_hints()
 
-        self.__model_init__(*args, **kwargs)
+        config = getattr(self, PYDANTIC_MINI_EXTRA_MODEL_CONFIG, {})
 
-    def _inner_schema_value_preprocessor(
-        self, fd: Field, resolved_field_type: typing.Any
+        deferred_constraints = DEFERRED_CONSTRAINTS.get()
+        if deferred_constraints:
+            deferred_constraints = deferred_constraints.get(cls, {})
+
+        hooks_setattr = _hooks_setattr(config)
+        if hooks_setattr:
+            # assignments made while initialising are neither validated twice
+            # nor recorded as changes
+            self.__dict__.pop(_INITIALISED, None)
+
+        # Only this instance is a batch row. The instances created while it is
+        # validated and initialised, e.g. by validators, check all their constraints.
+        token = DEFERRED_CONSTRAINTS.set(None) if deferred_constraints else None
+        try:
+            projection = LOAD_PROJECTION.get()
+            plan = projection.get(cls) if projection else None
+            if plan is not None:
+                validated = self._validate_projected_fields(
+                    plan, resolved_hints, config, deferred_constraints
+                )
+            else:
+                validated = fields(self)
+                for index, fd in enumerate(validated):
+                    try:
+                        self._validate_field(
+                            fd,
+                            resolved_hints.get(fd.name, fd.type),
+                            config,
+                            skip_constraints=(
+                                deferred_constraints.get(fd.name, ())
+                                if deferred_constraints
+                                else ()
+                            ),
+                        )
+                    except Exception:
+                        if deferred_constraints:
+                            self._check_deferred_constraints(
+                                validated[:index], resolved_hints, deferred_constraints
+                            )
+                        raise
+
+            if deferred_constraints:
+                deferred_instances = DEFERRED_INSTANCES.get()
+                if deferred_instances is not None:
+                    deferred_instances.append((self, validated))
+
+            self.__model_init__(*args, **kwargs)
+        finally:
+            if token is not None:
+                DEFERRED_CONSTRAINTS.reset(token)
+
+        if hooks_setattr:
+            _mark_initialised(self)
+
+    def _validate_projected_fields(
+        self,
+        plan: "ProjectionPlan",
+        resolved_hints: typing.Dict[str, typing.Any],
+        config: typing.Dict[str, typing.Any],
+        deferred_constraints: typing.Optional[typing.Dict[str, typing.Any]],
+    ) -> typing.List[Field]:
+        """
+        Validate the fields selected by a loads projection plan. The other fields
+        are left as they were given. Returns the validated fields.
+        """
+        # models nested in fully selected fields are validated in full
+        token = LOAD_PROJECTION.set(None)
+        try:
+            validated = []
+            for fd in fields(self):
+                if fd.name not in plan.selected:
+                    continue
+                child = plan.children.get(fd.name)
+                nested_token = (
+                    LOAD_PROJECTION.set({child.model: child})
+                    if child is not None
+                    else None
+                )
+                try:
+                    self._validate_field(
+                        fd,
+                        resolved_hints.get(fd.name, fd.type),
+                        config,
+                        skip_constraints=(
+                            deferred_constraints.get(fd.name, ())
+                            if deferred_constraints
+                            else ()
+                        ),
+                    )
+                except Exception:
+                    if deferred_constraints:
+                        self._check_deferred_constraints(
+                            validated, resolved_hints, deferred_constraints
+                        )
+                    raise
+                finally:
+                    if nested_token is not None:
+                        LOAD_PROJECTION.reset(nested_token)
+                validated.append(fd)
+        finally:
+            LOAD_PROJECTION.reset(token)
+        return validated
+
+    def _check_deferred_constraints(
+        self,
+        validated_fields: typing.Sequence[Field],
+        resolved_hints: typing.Dict[str, typing.Any],
+        deferred_constraints: typing.Dict[str, typing.Any],
     ) -> None:
-        value = getattr(self, fd.name)
-
-        actual_annotated_type = resolved_field_type.__args__[0]
-        type_args = (
-            hasattr(actual_annotated_type, "__args__")
-            and actual_annotated_type.__args__
+        """
+        Check the constraints that a batch defers to its column check on the fields
+        validated before a later field failed, so that the row raises the error that
+        row-by-row validation would raise.
+        """
+        for fd in validated_fields:
+            if deferred_constraints.get(fd.name):
+                query = resolved_hints.get(fd.name, fd.type).__metadata__[0]
+                query.validate(getattr(self, fd.name), fd.name)
+
+    def _validate_field(
+        self,
+        fd: Field,
+        resolved_field_type: typing.Any,
+        config: typing.Dict[str, typing.Any],
+        run_pre_formatter: bool = True,
+        skip_constraints: typing.Container[str] = (),
+    ) -> None:
+        """
+        Run the validation steps of one field: the pre-formatter, coercion, type
+        check, Attrib constraints and validators, and the ``validate`` and
+        ``validate_<field>`` hooks.
+        """
+        query: Attrib = (
+            hasattr(resolved_field_type, "__metadata__")
+            and resolved_field_type.__metadata__[0]
             or None
         )
 
-        status, actual_type = is_collection(actual_annotated_type)
-        if status:
-            if type_args and isinstance(value, (dict, list)):
-                value = value if isinstance(value, list) else [value]
-                inner_type: type = type_args[0]
+        if query and run_pre_formatter:
+            # execute the pre-formatters for all the fields
+            query.execute_pre_formatter(self, fd)
 
-                if is_builtin_type(inner_type):
-                    setattr(
-                        self, fd.name, actual_type([inner_type(val) for val in value])
-                    )
-                elif (
-                    (isinstance(inner_type, type) and issubclass(inner_type, BaseModel))
-                    or is_dataclass(inner_type)
-                    or inspect.isclass(inner_type)
-                ):
-                    setattr(
-                        self,
-                        fd.name,
-                        actual_type(
-                            [
-                                (
-                                    init_class(inner_type, val)
-                                    if isinstance(val, dict)
-                                    else val
-                                )
-                                for val in value
-                            ]
-                        ),
-                    )
-        elif actual_annotated_type:
-            actual_type = get_type(actual_annotated_type)
-
-            if isinstance(value, dict):
-                if (
-                    (
-                        isinstance(actual_type, type)
-                        and isinstance(actual_type, BaseModel)
-                    )
-                    or is_dataclass(actual_type)
-                    or inspect.isclass(actual_type)
-                ):
-                    setattr(self, fd.name, init_class(actual_type, value))
-
-            # Enums (Coerce string/int to Enum member)
-            elif isinstance(actual_type, type) and issubclass(actual_type, Enum):
-                if value is not None and not isinstance(value, actual_type):
-                    try:
-                        setattr(self, fd.name, actual_type(value))
-                    except ValueError:
-                        pass
-            # Primitives (Last-ditch coercion for strings to int/float)
-            elif is_builtin_type(actual_type):
-                if value is not None and not isinstance(value, actual_type):
-                    try:
-                        setattr(self, fd.name, actual_type(value))
-                    except (ValueError, TypeError):
-                        pass
+        if config.get("disable_all_validation", False):
+            return
 
-    def _field_type_validator(self, fd: Field, resolved_field_type: typing.Any) -> None:
+        # no type validation for Any field type and type checking is not disabled
+        if resolved_field_type is not typing.Any and not config.get(
+            "disable_typecheck", False
+        ):
+            if not config.get("strict_mode", False):
+                self._inner_schema_value_preprocessor(fd, resolved_field_type)
+            self._field_type_validator(
+                fd, resolved_field_type, skip_constraints=skip_constraints
+            )
+        else:
+            # run other field validators when type checking is disabled
+            if query:
+                value = getattr(self, fd.name, None)
+                query.execute_field_validators(self, fd)
+                query.validate(value, fd.name)
+        # async hooks are run by avalidate
+        async_validate_hook, async_fields = _get_async_validator_plan(self.__class__)
+        if not async_validate_hook:
+            try:
+                result = self.validate(getattr(self, fd.name), fd)
+                if result is not None:
+                    setattr(self, fd.name, result)
+            except NotImplementedError:
+                pass
+
+        method = getattr(self, f"validate_{fd.name}", None)
+        if fd.name in async_fields and async_fields[fd.name][3] is not None:
+            method = None
+        if method and callable(method):
+            result = method(getattr(self, fd.name), fd)
+            if result is not None:
+                setattr(self, fd.name, result)
+
+    def _inner_schema_value_preprocessor(
+        self, fd: Field, resolved_field_type: typing.Any
+    ) -> None:
+        value = getattr(self, fd.name)
+        coerced = compile_coercer(
+            resolved_field_type.__args__[0],
+            resolved_field_type.__metadata__[0].discriminator,
+        )(value)
+        if coerced is not value:
+            setattr(self, fd.name, coerced)
+
+    def _field_type_validator(
+        self,
+        fd: Field,
+        resolved_field_type: typing.Any,
+        skip_constraints: typing.Container[str] = (),
+    ) -> None:
         value = getattr(self, fd.name, None)
         field_type = resolved_field_type
 
@@ -425,30 +790,37 @@ class BaseModel(PreventOverridingMixin, metaclass=SchemaMeta):
         expected_annotated_type = (
             hasattr(field_type, "__args__") and field_type.__args__[0] or None
         )
-        actual_expected_type = (
+
+        if expected_annotated_type and not compile_type_checker(
             expected_annotated_type
-            and self.type_can_be_validated(expected_annotated_type)
-            or None
-        )
+        )(value):
+            from .checkers import find_type_mismatch
 
-        if expected_annotated_type and typing.Any not in actual_expected_type:
-            is_type_collection, _ = is_collection(expected_annotated_type)
-            if is_type_collection:
-                actual_type = expected_annotated_type.__args__[0]
-                if actual_type and actual_type is not typing.Any:
-                    if any([not isinstance(val, actual_type) for val in value]):
-                        raise TypeError(
-                            "Expected a collection of values of type '{}'. Values: {} ".format(
-                                actual_type, value
-                            )
-                        )
-            elif not isinstance(value, actual_expected_type):
+            path, mismatch = find_type_mismatch(expected_annotated_type, value)
+            if query.discriminator and isinstance(mismatch, dict):
                 raise TypeError(
-                    f"Field '{fd.name}' should be of type {actual_expected_type}, "
-                    f"but got {type(value).__name__}."
+                    f"Field '{fd.name}' has no model for {query.discriminator!r} "
+                    f"value {mismatch.get(query.discriminator)!r} at {fd.name}{path}."
                 )
+            if path:
+                raise TypeError(
+                    f"Field '{fd.name}' should be of type {expected_annotated_type}, "
+                    f"but got {type(mismatch).__name__} at {fd.name}{path}."
+                )
+            if get_origin(expected_annotated_type) is typing.Literal:
+                raise TypeError(
+                    f"Field '{fd.name}' should be one of "
+                    f"{', '.join(map(repr, get_args(expected_annotated_type)))}, "
+                    f"but got {value!r}."
+                )
+            is_type_collection, _ = is_collection(expected_annotated_type)
+            raise TypeError(
+                f"Field '{fd.name}' should be of type "
+                f"{expected_annotated_type if is_type_collection else self.type_can_be_validated(expected_annotated_type)}, "
+                f"but got {type(value).__name__}."
+            )
 
-        query.validate(value, fd.name)
+        query.validate(value, fd.name, skip=skip_constraints)
 
     @staticmethod
     def type_can_be_validated(typ) -> typing.Optional[typing.Tuple]:
@@ -462,9 +834,106 @@ class BaseModel(PreventOverridingMixin, metaclass=SchemaMeta):
 
         return None
 
+    def copy(
+        self,
+        update: typing.Optional[typing.Dict[str, typing.Any]] = None,
+        deep: bool = False,
+    ) -> "BaseModel":
+        """
+        Return a new instance with the same field values, changing the fields in ``update``.
+
+        Values that are not updated are already valid, so only the updated fields are
+        validated. Unchanged values are shared with this instance unless ``deep`` is True.
+        Like ``dataclasses.replace``, ``__model_init__`` runs for the new instance, and
+        InitVar fields without a default must be passed in ``update``.
+
+        Args:
+            update: New values by field name.
+            deep: Deep copy the values that are not updated.
+
+        Returns:
+            The new instance.
+        """
+        cls = self.__class__
+        update = update or {}
+        dataclass_fields = cls.__dataclass_fields__
+
+        for name in update:
+            if name not in dataclass_fields or is_class_var_type(
+                dataclass_fields[name].type
+            ):
+                raise TypeError(f"'{cls.__name__}' has no field {name!r}")
+
+        init_values = []
+        for fd in dataclass_fields.values():
+            if not is_initvar_type(fd.type):
+                continue
+            if fd.name in update:
+                init_values.append(update[fd.name])
+            elif fd.default is not MISSING:
+                init_values.append(fd.default)
+            else:
+                raise ValueError(f"InitVar {fd.name!r} must be specified with copy()")
+
+        state = {
+            key: value
+            for key, value in self.__dict__.items()
+            if key not in _INTERNAL_STATE_KEYS and key not in update
+        }
+        if deep:
+            state = copy.deepcopy(state)
+
+        instance = cls.__new__(cls)
+        instance.__dict__.update(state)
+
+        field_names = cls._get_field_names()
+        instance.__dict__.update(
+            (name, value) for name, value in update.items() if name in field_names
+        )
+
+        if update:
+            resolved_hints = cls._get_resolved_type_hints()
+            config = getattr(cls, PYDANTIC_MINI_EXTRA_MODEL_CONFIG, {})
+            for fd in fields(cls):
+                if fd.name in update:
+                    instance._validate_field(
+                        fd, resolved_hints.get(fd.name, fd.type), config
+                    )
+
+        instance.__model_init__(*init_values)
+
+        if _hooks_setattr(getattr(cls, PYDANTIC_MINI_EXTRA_MODEL_CONFIG, {})):
+            _mark_initialised(instance)
+        return instance
+
+    def __reduce__(self):
+        # The field values were valid when pickled, so they are restored without
+        # validating them again. The schema fingerprint rejects pickles made
+        # with a different version of the model.
+        cls = self.__class__
+        names = cls._get_field_names()
+        state = self.__dict__
+        values = tuple(state[name] for name in names)
+        extra = (
+            {
+                key: value
+                for key, value in state.items()
+                if key not in names and key not in _INTERNAL_STATE_KEYS
+            }
+            if len(state) > len(names)
+            else None
+        )
+        return (
+            _restore_model,
+            (cls, (_PICKLE_VERSION, get_schema_fingerprint(cls)), values, extra),
+        )
+
     @staticmethod
-    def get_formatter_by_name(name: str) -> BaseModelFormatter:
-        return BaseModelFormatter.get_formatter(format_name=name)
+    def get_formatter_by_name(name: str, **config) -> "BaseModelFormatter":
+        # formatters and their dependencies are imported on first use
+        from .formatters import BaseModelFormatter
+
+        return BaseModelFormatter.get_formatter(format_name=name, **config)
 
     def validate(self, value: typing.Any, data_field: Field):
         """Implement this method to validate all fields"""
@@ -472,9 +941,219 @@ class BaseModel(PreventOverridingMixin, metaclass=SchemaMeta):
 
     @classmethod
     def loads(
-        cls, data: typing.Any, _format: str
+        cls, data: typing.Any, _format: str, batch: bool = False, **options
+    ) -> typing.Union[typing.List["BaseModel"], "BaseModel", "ModelBatch"]:
+        """
+        Load model instance(s) from data in the given format.
+
+        Args:
+            data: The raw input for the formatter.
+            _format: The name of the formatter e.g. "dict", "json" or "csv".
+            batch: If True, store the validated records column by column in a
+                ModelBatch instead of returning a list of instances.
+            **options: Options for the formatter e.g. ``use_mmap`` for "csv", or
+                ``include`` and ``exclude`` to validate only some fields.
+        """
+        formatter = cls.get_formatter_by_name(_format, **options)
+        if batch:
+            from .batch import ModelBatch
+
+            return ModelBatch(cls, formatter.iter_encode(cls, data))
+        return formatter.encode(cls, data)
+
+    @classmethod
+    async def aloads(
+        cls,
+        data: typing.Any,
+        _format: str,
+        max_concurrency: typing.Optional[int] = None,
+        **options,
     ) -> typing.Union[typing.List["BaseModel"], "BaseModel"]:
-        return cls.get_formatter_by_name(_format).encode(cls, data)
+        """
+        Load model instance(s) like ``loads``, then run their async validators
+        concurrently with ``avalidate``.
+
+        Args:
+            data: The raw input for the formatter.
+            _format: The name of the formatter e.g. "dict", "json" or "csv".
+            max_concurrency: The maximum number of async validators running at
+                once, for all the loaded instances. Defaults to no limit.
+            **options: Options for the formatter, see ``loads``. ``batch`` is not
+                supported, because batches do not keep the instances.
+        """
+        if options.pop("batch", False):
+            raise TypeError("aloads does not support batch=True")
+        result = cls.loads(data, _format, **options)
+        return await cls.avalidate(result, max_concurrency=max_concurrency)
+
+    @classmethod
+    async def avalidate(
+        cls,
+        instances: typing.Union["BaseModel", typing.Sequence["BaseModel"]],
+        max_concurrency: typing.Optional[int] = None,
+    ) -> typing.Union["BaseModel", typing.Sequence["BaseModel"]]:
+        """
+        Run the async validators of one or more instances concurrently.
+
+        Async validators are the coroutine functions in ``Attrib(validators=...)``
+        and the ``validate`` and ``validate_<field>`` hooks defined with
+        ``async def``. They are skipped when instances are created, after the sync
+        validation, and are collected here and run with ``asyncio.gather``. They all
+        receive the values left by the sync validation, so they must not depend on
+        each other. Returned values are then set in field and declaration order,
+        without running ``validate_assignment`` or recording changes.
+
+        Args:
+            instances: An instance, or a list or tuple of instances.
+            max_concurrency: The maximum number of async validators running at
+                once. Defaults to no limit.
+
+        Returns:
+            The instances given.
+
+        Raises:
+            ValidationError: The first error in field and declaration order, once
+                all the validators finished. No values are set in that case.
+                Exceptions that are not ``Exception`` subclasses, e.g.
+                ``asyncio.CancelledError``, are raised as they are.
+        """
+        from .async_validation import gather_limited
+
+        items = instances if isinstance(instances, (list, tuple)) else (instances,)
+        calls = [
+            (instance, *call)
+            for instance in items
+            for call in instance._get_async_validator_calls()
+        ]
+        results = await gather_limited(
+            [call[-1] for call in calls], max_concurrency=max_concurrency
+        )
+
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                # e.g. CancelledError, which is not a validation error
+                raise result
+
+        for (_, fd, query, _), result in zip(calls, results):
+            if not isinstance(result, Exception):
+                continue
+            if query is None and isinstance(result, NotImplementedError):
+                continue
+            if query is not None and not isinstance(result, ValidationError):
+                raise ValidationError(str(result)) from result
+            raise result
+
+        for (instance, fd, query, _), result in zip(calls, results):
+            if result is not None and not isinstance(result, BaseException):
+                object.__setattr__(instance, fd.name, result)
+            elif query is not None and result is None and query.allow_none:
+                object.__setattr__(instance, fd.name, None)
+        return instances
+
+    def _get_async_validator_calls(
+        self,
+    ) -> typing.List[
+        typing.Tuple[
+            Field,
+            typing.Optional[Attrib],
+            typing.Callable[[], typing.Awaitable[typing.Any]],
+        ]
+    ]:
+        """
+        Return the field, the Attrib for Attrib validators or None for hooks, and
+        a function starting the validator, for each async validator in order.
+        """
+        config = getattr(self, PYDANTIC_MINI_EXTRA_MODEL_CONFIG, {})
+        if config.get("disable_all_validation", False):
+            return []
+
+        validate_hook, by_field = _get_async_validator_plan(self.__class__)
+        calls = []
+        for fd, query, validators, method_name in by_field.values():
+            value = getattr(self, fd.name)
+            for validator in validators:
+                calls.append((fd, query, functools.partial(validator, self, value)))
+            if validate_hook:
+                calls.append((fd, None, functools.partial(self.validate, value, fd)))
+            if method_name is not None:
+                method = getattr(self, method_name)
+                calls.append((fd, None, functools.partial(method, value, fd)))
+        return calls
+
+    @classmethod
+    def loads_cache_info(cls) -> typing.Optional["CacheInfo"]:
+        """
+        Return the hits, misses, evictions and size of the loads cache of the model,
+        or None if ``loads_cache_size`` is not set in the model Config.
+        """
+        from .cache import get_loads_cache
+
+        cache = get_loads_cache(cls)
+        return cache.info() if cache is not None else None
+
+    @classmethod
+    def loads_cache_clear(cls) -> None:
+        """Remove all entries from the loads cache of the model and reset its stats."""
+        from .cache import get_loads_cache
+
+        cache = get_loads_cache(cls)
+        if cache is not None:
+            cache.clear()
+
+    def dump(self, _format: str, **options) -> typing.Any:
+        """
+        Serialise the instance to the given format.
+
+        Args:
+            _format: The name of the formatter e.g. "dict", "json" or "csv".
+            **options: Options for the formatter e.g. ``only_changed=True`` to
+                serialise only the fields returned by ``get_changed_fields``, or
+                ``include`` and ``exclude`` to select fields by name or dotted path.
+        """
+        return self.get_formatter_by_name(_format, **options).decode(instance=self)
+
+    @classmethod
+    def dump_to(
+        cls,
+        sink: typing.Any,
+        instances: typing.Iterable["BaseModel"],
+        _format: str = "csv",
+        **options,
+    ) -> int:
+        """
+        Write instances to a path or file object and return how many were written.
+
+        Args:
+            sink: A path, or a text or binary file object that is left open.
+            instances: The instances to write. May be a generator; formatters that
+                write incrementally, like "csv", hold one instance at a time.
+            _format: The name of the formatter.
+            **options: Options for the formatter e.g. ``encoding``.
+
+        Raises:
+            TypeError: If an instance is not an instance of the model.
+        """
+        return cls.get_formatter_by_name(_format, **options).decode_to(
+            sink, instances, model=cls
+        )
+
+    def get_changed_fields(self) -> typing.FrozenSet[str]:
+        """
+        Return the names of the fields assigned a different value since the instance
+        was initialised or since the last ``checkpoint_changes``.
+
+        Changes made inside mutable field values, e.g. appending to a list, are not
+        detected. Requires ``track_changes = True`` in the model Config.
+        """
+        try:
+            return frozenset(self.__dict__[_CHANGED_FIELDS])
+        except KeyError:
+            raise RuntimeError(
+                f"Change tracking is not enabled for model '{self.__class__.__name__}'. "
+                f"Set 'track_changes = True' in the model Config."
+            )
 
-    def dump(self, _format: str) -> typing.Any:
-        return self.get_formatter_by_name(_format).decode(instance=self)
+    def checkpoint_changes(self) -> None:
+        """Forget the changes recorded so far. See ``get_changed_fields``."""
+        self.get_changed_fields()
+        self.__dict__[_CHANGED_FIELDS].clear()
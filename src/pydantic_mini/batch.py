@@ -0,0 +1,216 @@
+import typing
+from array import array
+from dataclasses import fields
+
+from .typing import get_args, is_mini_annotated
+from .accelerators import (
+    DEFERRED_CONSTRAINTS,
+    DEFERRED_INSTANCES,
+    ColumnConstraintChecker,
+)
+
+if typing.TYPE_CHECKING:
+    from .base import BaseModel
+
+__all__ = ("ModelBatch",)
+
+M = typing.TypeVar("M", bound="BaseModel")
+
+# Number of rows added between two vectorised constraint checks
+_CHECK_CHUNK_SIZE = 65536
+
+# array.array type codes used for numeric columns. ``bool`` is checked before
+# ``int`` because it is a subclass of it.
+_NUMERIC_TYPECODES = ((bool, "b"), (int, "q"), (float, "d"))
+
+
+def get_column_typecode(annotation: typing.Any) -> typing.Optional[str]:
+    """
+    Return the ``array.array`` type code used to store a field column.
+
+    Args:
+        annotation: The field annotation, usually ``MiniAnnotated[typ, Attrib()]``.
+
+    Returns:
+        A type code for exact ``bool``, ``int`` and ``float`` annotations, otherwise None.
+        Optional and union annotations are stored as lists because they may hold None.
+    """
+    if is_mini_annotated(annotation):
+        annotation = get_args(annotation)[0]
+
+    for typ, typecode in _NUMERIC_TYPECODES:
+        if annotation is typ:
+            return typecode
+    return None
+
+
+class ModelBatch(typing.Generic[M]):
+    """
+    Columnar container for a large number of validated records of one model.
+
+    Each field is stored as one column: numeric fields use ``array.array`` and
+    all other fields use lists. Rows are materialised as model instances on
+    demand, so only the columns are kept in memory.
+
+    Only the dataclass fields of the model are stored. Attributes set in
+    ``__model_init__`` are not part of the columns.
+
+    Example:
+        >>> batch = Person.loads(rows, _format="dict", batch=True)
+        >>> batch[0]
+        Person(name='nafiu', age=12)
+        >>> batch.column("age")
+        array('q', [12, 13])
+    """
+
+    __slots__ = ("model", "_names", "_columns", "_length")
+
+    def __init__(
+        self,
+        model: typing.Type[M],
+        records: typing.Optional[typing.Iterable[M]] = None,
+    ):
+        self.model = model
+        self._names: typing.Tuple[str, ...] = ()
+        self._columns: typing.List[typing.Union[array, list]] = []
+        self._length = 0
+
+        names = []
+        for fd in fields(model):
+            names.append(fd.name)
+            typecode = get_column_typecode(fd.type)
+            self._columns.append(array(typecode) if typecode else [])
+        self._names = tuple(names)
+
+        if records is not None:
+            self.extend(records)
+
+    @classmethod
+    def _from_columns(
+        cls,
+        model: typing.Type[M],
+        columns: typing.List[typing.Union[array, list]],
+        length: int,
+    ) -> "ModelBatch[M]":
+        batch = cls(model)
+        batch._columns = columns
+        batch._length = length
+        return batch
+
+    @property
+    def field_names(self) -> typing.Tuple[str, ...]:
+        return self._names
+
+    def column(self, name: str) -> typing.Union[array, list]:
+        """Return the storage of a single field column."""
+        try:
+            return self._columns[self._names.index(name)]
+        except ValueError:
+            raise KeyError(f"Model '{self.model.__name__}' has no field {name!r}")
+
+    def append(self, instance: M) -> None:
+        if not isinstance(instance, self.model):
+            raise TypeError(
+                f"Expected an instance of '{self.model.__name__}', "
+                f"got {type(instance).__name__}."
+            )
+        for index, name in enumerate(self._names):
+            value = getattr(instance, name)
+            column = self._columns[index]
+            try:
+                column.append(value)
+            except (TypeError, OverflowError):
+                # value does not fit the numeric column e.g. large int or None
+                # when validation is disabled. Fall back to a list column.
+                column = self._columns[index] = list(column)
+                column.append(value)
+        self._length += 1
+
+    def extend(self, records: typing.Iterable[M]) -> None:
+        """
+        Append the records to the batch.
+
+        When numpy is installed, the ``gt/ge/lt/le`` constraints of numeric fields and
+        the ``min_length/max_length`` constraints of string fields are not checked while
+        the records are created. They are checked on whole column chunks instead, and
+        the first invalid row raises the same error as row-by-row validation. Only
+        the records are deferred: other instances of the model, e.g. those created by
+        validators, check all their constraints.
+        """
+        checker = ColumnConstraintChecker.for_batch(self)
+        if checker is None:
+            for instance in records:
+                self.append(instance)
+            return
+
+        checked = self._length
+        deferred_instances = []
+        token = DEFERRED_CONSTRAINTS.set({self.model: checker.deferred})
+        instances_token = DEFERRED_INSTANCES.set(deferred_instances)
+        try:
+            iterator = iter(records)
+            while True:
+                try:
+                    instance = next(iterator)
+                except StopIteration:
+                    break
+                except Exception:
+                    # rows created earlier may already be invalid
+                    checker.check(self, checked, self._length)
+                    raise
+                # other instances created by the iterator are not in the columns
+                for other, validated in deferred_instances:
+                    if other is not instance:
+                        other._check_deferred_constraints(
+                            validated,
+                            other._get_resolved_type_hints(),
+                            checker.deferred,
+                        )
+                deferred_instances.clear()
+                self.append(instance)
+                if self._length - checked >= _CHECK_CHUNK_SIZE:
+                    checker.check(self, checked, self._length)
+                    checked = self._length
+        finally:
+            DEFERRED_INSTANCES.reset(instances_token)
+            DEFERRED_CONSTRAINTS.reset(token)
+
+        checker.check(self, checked, self._length)
+
+    def _materialise(self, index: int) -> M:
+        # The values were validated when the record was added, so the row is
+        # rebuilt without running __init__ and __post_init__ again.
+        values = {}
+        for name, column in zip(self._names, self._columns):
+            value = column[index]
+            if isinstance(column, array) and column.typecode == "b":
+                value = bool(value)
+            values[name] = value
+        return self.model._build_without_validation(values)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(
+        self, index: typing.Union[int, slice]
+    ) -> typing.Union[M, "ModelBatch[M]"]:
+        if isinstance(index, slice):
+            columns = [column[index] for column in self._columns]
+            length = len(range(*index.indices(self._length)))
+            return self._from_columns(self.model, columns, length)
+
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("ModelBatch index out of range")
+        return self._materialise(index)
+
+    def __iter__(self) -> typing.Iterator[M]:
+        for index in range(self._length):
+            yield self._materialise(index)
+
+    def __repr__(self):
+        return f"ModelBatch[{self.model.__name__}](length={self._length})"
+
+    def dump(self, _format: str) -> typing.Any:
+        return self.model.get_formatter_by_name(_format).decode(list(self))
@@ -0,0 +1,494 @@
+import enum
+import uuid
+import struct
+import typing
+import decimal
+import datetime
+import collections
+from dataclasses import MISSING, fields
+from operator import attrgetter
+
+from .typing import (
+    get_args,
+    get_origin,
+    is_initvar_type,
+    is_mini_annotated,
+    is_optional_type,
+    NoneType,
+)
+from .utils import get_schema_fingerprint
+
+if typing.TYPE_CHECKING:
+    from .base import BaseModel
+
+__all__ = ("ModelCodec", "get_model_codec", "dumps", "loads")
+
+Encoder = typing.Callable[[typing.Any, bytearray], None]
+Decoder = typing.Callable[[typing.Any, int, bool], typing.Tuple[typing.Any, int]]
+
+_MAGIC = b"PMB"
+_VERSION = 1
+
+# magic, format version, schema fingerprint, record kind
+_HEADER = struct.Struct("<3sB8sB")
+_KIND_SINGLE = 0
+_KIND_LIST = 1
+
+# Fingerprint of empty lists written without a model. Any model loads them.
+_NO_FINGERPRINT = bytes(8)
+
+_BOOL = struct.Struct("<?")
+_INT = struct.Struct("<q")
+_FLOAT = struct.Struct("<d")
+_LENGTH = struct.Struct("<I")
+
+_SCALAR_FORMATS = {bool: "?", int: "q", float: "d"}
+_SCALAR_STRUCTS = {bool: _BOOL, int: _INT, float: _FLOAT}
+
+_SEQUENCE_TYPES = (list, set, frozenset, collections.deque)
+_MAPPING_TYPES = (dict, collections.OrderedDict, collections.Counter)
+
+_CODEC_CACHE: typing.Dict[type, "ModelCodec"] = {}
+
+
+def _struct_codec(st: struct.Struct) -> typing.Tuple[Encoder, Decoder]:
+    pack, unpack_from, size = st.pack, st.unpack_from, st.size
+
+    def encode(value, out):
+        out += pack(value)
+
+    def decode(buf, offset, validate):
+        return unpack_from(buf, offset)[0], offset + size
+
+    return encode, decode
+
+
+def _bytes_codec(
+    to_bytes: typing.Callable[[typing.Any], bytes],
+    from_bytes: typing.Callable[[typing.Any], typing.Any],
+) -> typing.Tuple[Encoder, Decoder]:
+    pack_length, unpack_length = _LENGTH.pack, _LENGTH.unpack_from
+
+    def encode(value, out):
+        data = to_bytes(value)
+        out += pack_length(len(data))
+        out += data
+
+    def decode(buf, offset, validate):
+        (length,) = unpack_length(buf, offset)
+        offset += 4
+        if offset + length > len(buf):
+            raise ValueError(
+                f"Truncated binary payload: {length} bytes expected at offset "
+                f"{offset}, but only {len(buf) - offset} remain"
+            )
+        return from_bytes(buf[offset : offset + length]), offset + length
+
+    return encode, decode
+
+
+def _str_codec() -> typing.Tuple[Encoder, Decoder]:
+    return _bytes_codec(lambda value: value.encode("utf-8"), lambda b: str(b, "utf-8"))
+
+
+def _isoformat_codec(typ: type) -> typing.Tuple[Encoder, Decoder]:
+    from_string = typ.fromisoformat
+    return _bytes_codec(
+        lambda value: value.isoformat().encode("ascii"),
+        lambda b: from_string(str(b, "ascii")),
+    )
+
+
+def _enum_codec(typ: typing.Type[enum.Enum]) -> typing.Tuple[Encoder, Decoder]:
+    members = tuple(typ)
+    indexes = {member: index for index, member in enumerate(members)}
+    pack_index, unpack_index = _LENGTH.pack, _LENGTH.unpack_from
+
+    def encode(value, out):
+        out += pack_index(indexes[value])
+
+    def decode(buf, offset, validate):
+        return members[unpack_index(buf, offset)[0]], offset + 4
+
+    return encode, decode
+
+
+def _optional_codec(
+    inner: typing.Tuple[Encoder, Decoder]
+) -> typing.Tuple[Encoder, Decoder]:
+    encode_inner, decode_inner = inner
+
+    def encode(value, out):
+        if value is None:
+            out.append(0)
+        else:
+            out.append(1)
+            encode_inner(value, out)
+
+    def decode(buf, offset, validate):
+        if buf[offset] == 0:
+            return None, offset + 1
+        return decode_inner(buf, offset + 1, validate)
+
+    return encode, decode
+
+
+def _sequence_codec(
+    container: type, item: typing.Tuple[Encoder, Decoder]
+) -> typing.Tuple[Encoder, Decoder]:
+    encode_item, decode_item = item
+    pack_length, unpack_length = _LENGTH.pack, _LENGTH.unpack_from
+
+    def encode(value, out):
+        out += pack_length(len(value))
+        for val in value:
+            encode_item(val, out)
+
+    def decode(buf, offset, validate):
+        (length,) = unpack_length(buf, offset)
+        offset += 4
+        items = []
+        for _ in range(length):
+            val, offset = decode_item(buf, offset, validate)
+            items.append(val)
+        return items if container is list else container(items), offset
+
+    return encode, decode
+
+
+def _fixed_tuple_codec(
+    items: typing.List[typing.Tuple[Encoder, Decoder]]
+) -> typing.Tuple[Encoder, Decoder]:
+    def encode(value, out):
+        if len(value) != len(items):
+            raise TypeError(f"Expected a tuple of {len(items)} items, got {len(value)}")
+        for (encode_item, _), val in zip(items, value):
+            encode_item(val, out)
+
+    def decode(buf, offset, validate):
+        values = []
+        for _, decode_item in items:
+            val, offset = decode_item(buf, offset, validate)
+            values.append(val)
+        return tuple(values), offset
+
+    return encode, decode
+
+
+def _mapping_codec(
+    container: type,
+    key: typing.Tuple[Encoder, Decoder],
+    value: typing.Tuple[Encoder, Decoder],
+) -> typing.Tuple[Encoder, Decoder]:
+    encode_key, decode_key = key
+    encode_value, decode_value = value
+    pack_length, unpack_length = _LENGTH.pack, _LENGTH.unpack_from
+
+    def encode(mapping, out):
+        out += pack_length(len(mapping))
+        for k, v in mapping.items():
+            encode_key(k, out)
+            encode_value(v, out)
+
+    def decode(buf, offset, validate):
+        (length,) = unpack_length(buf, offset)
+        offset += 4
+        result = container()
+        for _ in range(length):
+            k, offset = decode_key(buf, offset, validate)
+            result[k], offset = decode_value(buf, offset, validate)
+        return result, offset
+
+    return encode, decode
+
+
+def _model_codec(model: typing.Type["BaseModel"]) -> typing.Tuple[Encoder, Decoder]:
+    # The codec of a recursive model is looked up when used, as it may still be
+    # compiling when this field is compiled.
+    def encode(value, out):
+        get_model_codec(model).encode_into(value, out)
+
+    def decode(buf, offset, validate):
+        return get_model_codec(model).decode_from(buf, offset, validate)
+
+    return encode, decode
+
+
+def compile_value_codec(typ: typing.Any) -> typing.Tuple[Encoder, Decoder]:
+    """
+    Return the (encoder, decoder) pair for values of the given annotation.
+
+    Raises:
+        TypeError: If values of the annotation cannot be stored in the binary format.
+    """
+    from .base import BaseModel
+
+    if is_mini_annotated(typ):
+        typ = get_args(typ)[0]
+
+    if is_optional_type(typ):
+        args = [arg for arg in get_args(typ) if arg is not NoneType]
+        if len(args) == 1:
+            return _optional_codec(compile_value_codec(args[0]))
+
+    origin = get_origin(typ)
+    if origin is not None:
+        args = get_args(typ)
+        if origin is tuple:
+            if len(args) == 2 and args[1] is Ellipsis:
+                return _sequence_codec(tuple, compile_value_codec(args[0]))
+            if args:
+                return _fixed_tuple_codec([compile_value_codec(arg) for arg in args])
+        elif origin in _SEQUENCE_TYPES and len(args) == 1:
+            return _sequence_codec(origin, compile_value_codec(args[0]))
+        elif origin in _MAPPING_TYPES and len(args) == 2:
+            return _mapping_codec(
+                origin, compile_value_codec(args[0]), compile_value_codec(args[1])
+            )
+    elif isinstance(typ, type):
+        if typ in _SCALAR_FORMATS:
+            return _struct_codec(_SCALAR_STRUCTS[typ])
+        if typ is str:
+            return _str_codec()
+        if typ is bytes:
+            return _bytes_codec(bytes, bytes)
+        if issubclass(typ, enum.Enum):
+            return _enum_codec(typ)
+        if typ in (datetime.datetime, datetime.date, datetime.time):
+            return _isoformat_codec(typ)
+        if typ is uuid.UUID:
+            return _bytes_codec(
+                attrgetter("bytes"), lambda b: uuid.UUID(bytes=bytes(b))
+            )
+        if typ is decimal.Decimal:
+            return _bytes_codec(
+                lambda value: str(value).encode("ascii"),
+                lambda b: decimal.Decimal(str(b, "ascii")),
+            )
+        if issubclass(typ, BaseModel):
+            return _model_codec(typ)
+
+    raise TypeError(f"Type {typ!r} is not supported by the binary format")
+
+
+class ModelCodec:
+    """
+    Encodes instances of one model in field order.
+
+    Consecutive ``int``, ``float`` and ``bool`` fields are packed with a single
+    ``struct`` call, strings and bytes are length prefixed and nested models are
+    written inline.
+    """
+
+    __slots__ = ("model", "fingerprint", "_steps", "_init_values", "_missing_init_vars")
+
+    def __init__(self, model: typing.Type["BaseModel"]):
+        self.model = model
+        self.fingerprint = get_schema_fingerprint(model)
+        self._steps: typing.List[typing.Tuple[typing.Any, ...]] = []
+        # the InitVar defaults passed to __model_init__, or None when the model
+        # does not define it
+        self._init_values: typing.Optional[typing.Tuple[typing.Any, ...]] = None
+        self._missing_init_vars: typing.Tuple[str, ...] = ()
+
+    def compile(self) -> None:
+        hints = self.model._get_resolved_type_hints()
+        steps = []
+        scalar_names, scalar_format = [], ""
+
+        def flush_scalars():
+            nonlocal scalar_names, scalar_format
+            if scalar_names:
+                steps.append(
+                    (
+                        "struct",
+                        tuple(scalar_names),
+                        attrgetter(*scalar_names),
+                        struct.Struct("<" + scalar_format),
+                    )
+                )
+                scalar_names, scalar_format = [], ""
+
+        for fd in fields(self.model):
+            typ = hints.get(fd.name, fd.type)
+            inner = get_args(typ)[0] if is_mini_annotated(typ) else typ
+            if inner in _SCALAR_FORMATS:
+                scalar_names.append(fd.name)
+                scalar_format += _SCALAR_FORMATS[inner]
+                continue
+
+            flush_scalars()
+            try:
+                encode, decode = compile_value_codec(typ)
+            except TypeError as e:
+                raise TypeError(
+                    f"Field '{fd.name}' of model '{self.model.__name__}': {e}"
+                ) from e
+            steps.append(("value", fd.name, encode, decode))
+
+        flush_scalars()
+        self._steps = steps
+        self._compile_model_init()
+
+    def _compile_model_init(self) -> None:
+        from .base import BaseModel
+
+        if self.model.__model_init__ is BaseModel.__model_init__:
+            return
+        initvars = [
+            fd
+            for fd in self.model.__dataclass_fields__.values()
+            if is_initvar_type(fd.type)
+        ]
+        self._init_values = tuple(fd.default for fd in initvars)
+        self._missing_init_vars = tuple(
+            fd.name for fd in initvars if fd.default is MISSING
+        )
+
+    def encode_into(self, instance: "BaseModel", out: bytearray) -> None:
+        for step in self._steps:
+            if step[0] == "struct":
+                _, names, getter, st = step
+                values = getter(instance)
+                try:
+                    out += st.pack(*values) if len(names) > 1 else st.pack(values)
+                except struct.error as e:
+                    raise TypeError(
+                        f"Cannot encode fields {names} of '{self.model.__name__}': {e}"
+                    ) from e
+            else:
+                _, name, encode, _ = step
+                try:
+                    encode(getattr(instance, name), out)
+                except (struct.error, AttributeError, KeyError) as e:
+                    raise TypeError(
+                        f"Cannot encode field '{name}' of '{self.model.__name__}': {e}"
+                    ) from e
+
+    def decode_from(
+        self, buf: typing.Any, offset: int, validate: bool = False
+    ) -> typing.Tuple["BaseModel", int]:
+        values = {}
+        for step in self._steps:
+            if step[0] == "struct":
+                _, names, _, st = step
+                values.update(zip(names, st.unpack_from(buf, offset)))
+                offset += st.size
+            else:
+                _, name, _, decode = step
+                values[name], offset = decode(buf, offset, validate)
+
+        if validate:
+            return self.model(**values), offset
+        if self._missing_init_vars:
+            raise TypeError(
+                f"Cannot load '{self.model.__name__}' from binary: __model_init__ "
+                f"needs the InitVar fields {list(self._missing_init_vars)}, which "
+                f"have no default"
+            )
+        instance = self.model._build_without_validation(values, self._init_values)
+        return instance, offset
+
+
+def get_model_codec(model: typing.Type["BaseModel"]) -> ModelCodec:
+    """Return the compiled codec of a model, compiling it on first use."""
+    try:
+        return _CODEC_CACHE[model]
+    except KeyError:
+        pass
+
+    codec = ModelCodec(model)
+    # registered before compiling so recursive models find it
+    _CODEC_CACHE[model] = codec
+    try:
+        codec.compile()
+    except Exception:
+        del _CODEC_CACHE[model]
+        raise
+    return codec
+
+
+def dumps(instance: typing.Union["BaseModel", typing.Sequence["BaseModel"]]) -> bytes:
+    """
+    Encode a model instance, or a list of instances of one model, to bytes.
+
+    An empty list has no model to take the schema fingerprint from, so it is
+    written without one and loads as an empty list for any model.
+    """
+    if isinstance(instance, (list, tuple)):
+        if not instance:
+            return _HEADER.pack(
+                _MAGIC, _VERSION, _NO_FINGERPRINT, _KIND_LIST
+            ) + _LENGTH.pack(0)
+        codec = get_model_codec(type(instance[0]))
+        out = bytearray(_HEADER.pack(_MAGIC, _VERSION, codec.fingerprint, _KIND_LIST))
+        out += _LENGTH.pack(len(instance))
+        for item in instance:
+            if type(item) is not codec.model:
+                raise TypeError("All instances in the list must be of the same model")
+            codec.encode_into(item, out)
+    else:
+        codec = get_model_codec(type(instance))
+        out = bytearray(_HEADER.pack(_MAGIC, _VERSION, codec.fingerprint, _KIND_SINGLE))
+        codec.encode_into(instance, out)
+    return bytes(out)
+
+
+def _read_header(
+    model: typing.Type["BaseModel"], buf: memoryview
+) -> typing.Tuple[ModelCodec, bool, int, int]:
+    codec = get_model_codec(model)
+    try:
+        magic, version, fingerprint, kind = _HEADER.unpack_from(buf, 0)
+        offset = _HEADER.size
+        count = 1
+        if kind == _KIND_LIST:
+            (count,) = _LENGTH.unpack_from(buf, offset)
+            offset += 4
+    except struct.error:
+        raise ValueError("Data is too short to be a binary model payload")
+
+    if magic != _MAGIC or version != _VERSION:
+        raise ValueError("Data is not a binary model payload of a supported version")
+    empty = kind == _KIND_LIST and count == 0 and fingerprint == _NO_FINGERPRINT
+    if fingerprint != codec.fingerprint and not empty:
+        raise ValueError(
+            f"Schema fingerprint mismatch: data was not encoded for the current "
+            f"schema of model '{model.__name__}'"
+        )
+    return codec, kind == _KIND_LIST, count, offset
+
+
+def _iter_records(
+    codec: ModelCodec, buf: memoryview, count: int, offset: int, validate: bool
+) -> typing.Iterator["BaseModel"]:
+    try:
+        for _ in range(count):
+            instance, offset = codec.decode_from(buf, offset, validate=validate)
+            yield instance
+    except (struct.error, IndexError, UnicodeDecodeError) as e:
+        raise ValueError(
+            f"Malformed binary payload for '{codec.model.__name__}': {e}"
+        ) from e
+
+    if offset != len(buf):
+        raise ValueError("Unexpected trailing data in binary payload")
+
+
+def iter_loads(
+    model: typing.Type["BaseModel"], data: typing.Any, validate: bool = False
+) -> typing.Iterator["BaseModel"]:
+    """Yield the model instances encoded in ``data`` one at a time."""
+    buf = memoryview(data)
+    codec, _, count, offset = _read_header(model, buf)
+    return _iter_records(codec, buf, count, offset, validate)
+
+
+def loads(
+    model: typing.Type["BaseModel"], data: typing.Any, validate: bool = False
+) -> typing.Union["BaseModel", typing.List["BaseModel"]]:
+    """Decode bytes produced by ``dumps`` into an instance or a list of instances."""
+    buf = memoryview(data)
+    codec, is_list, count, offset = _read_header(model, buf)
+    instances = list(_iter_records(codec, buf, count, offset, validate))
+    return instances if is_list else instances[0]
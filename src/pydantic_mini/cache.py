@@ -0,0 +1,186 @@
+import typing
+import hashlib
+import threading
+from collections import OrderedDict, namedtuple
+from dataclasses import MISSING
+
+if typing.TYPE_CHECKING:
+    from .base import BaseModel
+
+__all__ = ("CacheInfo", "LoadsCache", "get_loads_cache", "payload_key", "dict_key")
+
+CacheInfo = namedtuple(
+    "CacheInfo",
+    ["hits", "misses", "evictions", "entries", "bytes", "maxsize", "maxbytes"],
+)
+
+_LOADS_CACHES: typing.Dict[type, typing.Optional["LoadsCache"]] = {}
+_LOADS_CACHES_LOCK = threading.Lock()
+
+
+class LoadsCache:
+    """
+    Least recently used cache of loaded model instances.
+
+    The cache is bounded by the number of entries and, optionally, by the total size
+    in bytes of the payloads the entries were loaded from.
+    """
+
+    __slots__ = (
+        "maxsize",
+        "maxbytes",
+        "hits",
+        "misses",
+        "evictions",
+        "_bytes",
+        "_entries",
+        "_lock",
+    )
+
+    def __init__(self, maxsize: int, maxbytes: typing.Optional[int] = None):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._bytes = 0
+        self._entries: "OrderedDict[bytes, typing.Tuple[typing.Any, int]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: bytes) -> typing.Any:
+        """Return the cached value for the key, or MISSING."""
+        with self._lock:
+            try:
+                value, _ = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return MISSING
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: bytes, value: typing.Any, size: int) -> None:
+        if self.maxbytes is not None and size > self.maxbytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+
+            self._entries[key] = value, size
+            self._bytes += size
+
+            while len(self._entries) > self.maxsize or (
+                self.maxbytes is not None and self._bytes > self.maxbytes
+            ):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                self.hits,
+                self.misses,
+                self.evictions,
+                len(self._entries),
+                self._bytes,
+                self.maxsize,
+                self.maxbytes,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+
+def get_loads_cache(model: typing.Type["BaseModel"]) -> typing.Optional[LoadsCache]:
+    """Return the loads cache of a model, or None if the model does not use one."""
+    try:
+        return _LOADS_CACHES[model]
+    except KeyError:
+        pass
+
+    from .base import PYDANTIC_MINI_EXTRA_MODEL_CONFIG
+
+    config = getattr(model, PYDANTIC_MINI_EXTRA_MODEL_CONFIG, {})
+    maxsize = config.get("loads_cache_size") or 0
+
+    with _LOADS_CACHES_LOCK:
+        if model not in _LOADS_CACHES:
+            _LOADS_CACHES[model] = (
+                LoadsCache(maxsize, config.get("loads_cache_max_bytes"))
+                if maxsize > 0
+                else None
+            )
+    return _LOADS_CACHES[model]
+
+
+def _digest(data: typing.Union[bytes, bytearray, memoryview]) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def payload_key(
+    payload: typing.Union[str, bytes, bytearray, memoryview],
+) -> typing.Tuple[bytes, int]:
+    """Return the cache key and size of a raw payload, e.g. a JSON document."""
+    if isinstance(payload, str):
+        payload = payload.encode("utf-8")
+    # buffers are hashed in place
+    return b"p" + _digest(payload), memoryview(payload).nbytes
+
+
+def _write_canonical(obj: typing.Any, out: typing.List[str]) -> None:
+    # Every value is written with its type, so e.g. [1] and (1,), or {1: 2} and
+    # {"1": 2}, give different keys. Raises TypeError for other types.
+    typ = type(obj)
+    if obj is None or typ is bool:
+        out.append(f"{obj};")
+    elif typ is int or typ is float:
+        out.append(f"{typ.__name__[0]}{obj!r};")
+    elif typ is str:
+        out.append(f"s{len(obj)}:{obj}")
+    elif typ is list or typ is tuple:
+        out.append(f"{typ.__name__[0]}{len(obj)}[")
+        for item in obj:
+            _write_canonical(item, out)
+    elif typ is dict:
+        items = []
+        for key, value in obj.items():
+            key_parts, value_parts = [], []
+            _write_canonical(key, key_parts)
+            _write_canonical(value, value_parts)
+            items.append(("".join(key_parts), value_parts))
+        # dicts are equal regardless of the order of their keys
+        items.sort(key=lambda item: item[0])
+        out.append(f"d{len(items)}{{")
+        for key, value_parts in items:
+            out.append(key)
+            out.extend(value_parts)
+    else:
+        raise TypeError(f"{typ.__name__} values are not cached")
+
+
+def dict_key(
+    obj: typing.Dict[str, typing.Any]
+) -> typing.Optional[typing.Tuple[bytes, int]]:
+    """
+    Return the cache key and size of a dict from a canonical form that keeps the
+    type of every value.
+
+    Returns:
+        None if the dict holds values other than None, bool, int, float, str, and
+        lists, tuples and dicts of them. Such dicts are not cached.
+    """
+    out: typing.List[str] = []
+    try:
+        _write_canonical(obj, out)
+    except (TypeError, RecursionError):
+        return None
+    data = "".join(out).encode("utf-8", "surrogatepass")
+    return b"d" + _digest(data), len(data)
@@ -0,0 +1,365 @@
+import types
+import typing
+import itertools
+import threading
+import collections
+
+from .typing import (
+    COLLECTION_TYPES,
+    NoneType,
+    get_args,
+    get_origin,
+    get_type,
+    is_any_type,
+)
+
+__all__ = (
+    "TypeChecker",
+    "compile_type_checker",
+    "register_type_checker",
+    "unregister_type_checker",
+    "get_collection_shape",
+    "find_type_mismatch",
+)
+
+TypeChecker = typing.Callable[[typing.Any], bool]
+
+# User registered checkers by type. A checker registered for a generic class is also
+# used for its parametrised forms, e.g. a checker for ``Vector`` checks ``Vector[int]``.
+_REGISTERED_CHECKERS: typing.Dict[typing.Any, TypeChecker] = {}
+
+# Compiled checkers by annotation
+_COMPILED_CHECKERS: typing.Dict[typing.Any, TypeChecker] = {}
+
+# Caches of compiled callables that use the checkers, cleared when checkers change
+_DEPENDENT_CACHES: typing.List[typing.Dict[typing.Any, typing.Any]] = [
+    _COMPILED_CHECKERS
+]
+
+_LOCK = threading.Lock()
+
+# Kinds of collection shapes returned by get_collection_shape
+SEQUENCE = "sequence"
+FIXED_TUPLE = "fixed_tuple"
+MAPPING = "mapping"
+
+UNION_ORIGINS = frozenset([typing.Union, getattr(types, "UnionType", typing.Union)])
+
+
+def register_type_checker(typ: typing.Any, checker: TypeChecker) -> None:
+    """
+    Register a checker for values of fields annotated with the given type.
+
+    The checker receives the value and returns True if it is valid. It replaces the
+    default ``isinstance`` check, e.g. to accept duck-typed values or to skip a slow
+    ``__instancecheck__``.
+
+    Args:
+        typ: The type, or generic class, the checker is used for.
+        checker: A callable taking the value and returning a bool.
+    """
+    if not callable(checker):
+        raise TypeError(f"Checker for {typ!r} must be callable")
+
+    with _LOCK:
+        _REGISTERED_CHECKERS[typ] = checker
+        _clear_compiled_caches()
+
+
+def unregister_type_checker(typ: typing.Any) -> None:
+    """Remove the checker registered for the type, if any."""
+    with _LOCK:
+        _REGISTERED_CHECKERS.pop(typ, None)
+        _clear_compiled_caches()
+
+
+def register_compiled_cache(
+    cache: typing.Dict[typing.Any, typing.Any],
+) -> typing.Dict[typing.Any, typing.Any]:
+    """Register a cache of compiled callables to clear when checkers are (un)registered."""
+    _DEPENDENT_CACHES.append(cache)
+    return cache
+
+
+def _clear_compiled_caches() -> None:
+    for cache in _DEPENDENT_CACHES:
+        cache.clear()
+
+
+def compile_type_checker(annotation: typing.Any) -> TypeChecker:
+    """
+    Return a callable that checks a value against the annotation.
+
+    Checkers are compiled once per annotation and looked up from a cache afterwards.
+
+    Raises:
+        TypeError: If values cannot be checked against the annotation.
+    """
+    try:
+        return _COMPILED_CHECKERS[annotation]
+    except KeyError:
+        pass
+    except TypeError:
+        # Unhashable annotation, e.g. one holding a list
+        return _compile(annotation)
+
+    checker = _compile(annotation)
+    _COMPILED_CHECKERS[annotation] = checker
+    return checker
+
+
+def _accept_any(value: typing.Any) -> bool:
+    return True
+
+
+def _is_none(value: typing.Any) -> bool:
+    return value is None
+
+
+def _get_registered(annotation: typing.Any) -> typing.Optional[TypeChecker]:
+    try:
+        checker = _REGISTERED_CHECKERS.get(annotation)
+    except TypeError:
+        checker = None
+    if checker is None:
+        origin = get_origin(annotation)
+        if origin is not None:
+            checker = _REGISTERED_CHECKERS.get(origin)
+    return checker
+
+
+def _class_checker(cls: type) -> TypeChecker:
+    if cls is object:
+        return _accept_any
+    if cls is NoneType:
+        return _is_none
+
+    def check(value: typing.Any) -> bool:
+        # exact type first, it avoids the isinstance machinery for the common case
+        return value.__class__ is cls or isinstance(value, cls)
+
+    return check
+
+
+def _literal_checker(values: typing.Tuple[typing.Any, ...]) -> TypeChecker:
+    # values are compared with their type, so that True does not match Literal[1]
+    allowed = set()
+    unhashable = []
+    for literal in values:
+        try:
+            allowed.add((literal.__class__, literal))
+        except TypeError:
+            unhashable.append(literal)
+
+    def check(value: typing.Any) -> bool:
+        try:
+            if (value.__class__, value) in allowed:
+                return True
+        except TypeError:
+            pass
+        return any(
+            value.__class__ is literal.__class__ and value == literal
+            for literal in unhashable
+        )
+
+    return check
+
+
+def _union_checker(args: typing.Tuple[typing.Any, ...]) -> TypeChecker:
+    members = []
+    classes = []
+    for arg in args:
+        if isinstance(arg, type) and _get_registered(arg) is None:
+            classes.append(arg)
+        else:
+            members.append(compile_type_checker(arg))
+
+    if object in classes:
+        return _accept_any
+
+    classes = tuple(classes)
+    if not members:
+        return lambda value: isinstance(value, classes)
+
+    def check(value: typing.Any) -> bool:
+        if classes and isinstance(value, classes):
+            return True
+        for member in members:
+            if member(value):
+                return True
+        return False
+
+    return check
+
+
+def _sequence_checker(origin: type, element_type: typing.Any) -> TypeChecker:
+    if is_any_type(element_type):
+        return lambda value: isinstance(value, origin)
+
+    check_element = compile_type_checker(element_type)
+
+    def check(value: typing.Any) -> bool:
+        if not isinstance(value, origin):
+            return False
+        for element in value:
+            if not check_element(element):
+                return False
+        return True
+
+    return check
+
+
+def _fixed_tuple_checker(element_types: typing.Tuple[typing.Any, ...]) -> TypeChecker:
+    size = len(element_types)
+    element_checkers = tuple(compile_type_checker(typ) for typ in element_types)
+
+    def check(value: typing.Any) -> bool:
+        if not isinstance(value, tuple) or len(value) != size:
+            return False
+        for check_element, element in zip(element_checkers, value):
+            if not check_element(element):
+                return False
+        return True
+
+    return check
+
+
+def _mapping_checker(
+    origin: type, key_type: typing.Any, value_type: typing.Any
+) -> TypeChecker:
+    check_key = compile_type_checker(key_type)
+    check_value = compile_type_checker(value_type)
+
+    if check_key is _accept_any and check_value is _accept_any:
+        return lambda value: isinstance(value, origin)
+
+    def check(value: typing.Any) -> bool:
+        if not isinstance(value, origin):
+            return False
+        for key, item in value.items():
+            if not (check_key(key) and check_value(item)):
+                return False
+        return True
+
+    return check
+
+
+def get_collection_shape(
+    annotation: typing.Any,
+) -> typing.Optional[typing.Tuple[type, str, typing.Tuple[typing.Any, ...]]]:
+    """
+    Describe a generic collection annotation.
+
+    Returns:
+        A tuple of the collection class, the kind of collection and the element types,
+        or None if the annotation is not a collection. The kind is ``SEQUENCE`` with
+        one element type, ``FIXED_TUPLE`` with one type per position, or ``MAPPING``
+        with the key and value types.
+    """
+    origin = get_origin(annotation)
+    if origin not in COLLECTION_TYPES:
+        return None
+
+    args = get_args(annotation)
+    if issubclass(origin, dict):
+        if origin is collections.Counter:
+            return origin, MAPPING, (args[0] if args else typing.Any, typing.Any)
+        return origin, MAPPING, args if len(args) == 2 else (typing.Any, typing.Any)
+
+    if origin is tuple:
+        if len(args) == 2 and args[1] is Ellipsis:
+            return origin, SEQUENCE, args[:1]
+        if args and args != ((),):
+            return origin, FIXED_TUPLE, args
+        return origin, SEQUENCE, (typing.Any,)
+
+    return origin, SEQUENCE, args[:1] if args else (typing.Any,)
+
+
+def find_type_mismatch(
+    annotation: typing.Any, value: typing.Any
+) -> typing.Optional[typing.Tuple[str, typing.Any]]:
+    """
+    Find the first part of a value that does not match the annotation.
+
+    Returns:
+        None if the value matches, otherwise the path to the mismatching part,
+        e.g. ``"[2]"`` or ``"['key'][0]"``, and the part itself. The path is
+        empty when the value itself does not match.
+    """
+    if compile_type_checker(annotation)(value):
+        return None
+
+    if get_origin(annotation) in UNION_ORIGINS:
+        members = [arg for arg in get_args(annotation) if arg is not NoneType]
+        if value is not None and len(members) == 1:
+            return find_type_mismatch(members[0], value)
+        return "", value
+
+    shape = get_collection_shape(annotation)
+    if (
+        shape is None
+        or _get_registered(annotation) is not None
+        or not isinstance(value, shape[0])
+    ):
+        return "", value
+
+    _, kind, args = shape
+    if kind == MAPPING:
+        key_type, value_type = args
+        for key, item in value.items():
+            if not compile_type_checker(key_type)(key):
+                return f"[{key!r}]", key
+            mismatch = find_type_mismatch(value_type, item)
+            if mismatch is not None:
+                return f"[{key!r}]{mismatch[0]}", mismatch[1]
+        return "", value
+
+    if kind == FIXED_TUPLE:
+        if len(value) != len(args):
+            return "", value
+        element_types = args
+    else:
+        element_types = itertools.repeat(args[0])
+
+    for index, (element_type, element) in enumerate(zip(element_types, value)):
+        mismatch = find_type_mismatch(element_type, element)
+        if mismatch is not None:
+            return f"[{index}]{mismatch[0]}", mismatch[1]
+    return "", value
+
+
+def _compile(annotation: typing.Any) -> TypeChecker:
+    checker = _get_registered(annotation)
+    if checker is not None:
+        return checker
+
+    if is_any_type(annotation):
+        return _accept_any
+
+    if annotation is None:
+        return _is_none
+
+    origin = get_origin(annotation)
+    if origin is None and isinstance(annotation, type):
+        return _class_checker(annotation)
+
+    if origin in UNION_ORIGINS:
+        return _union_checker(get_args(annotation))
+
+    if origin is typing.Literal:
+        return _literal_checker(get_args(annotation))
+
+    shape = get_collection_shape(annotation)
+    if shape is not None:
+        origin, kind, args = shape
+        if kind == MAPPING:
+            return _mapping_checker(origin, *args)
+        if kind == FIXED_TUPLE:
+            return _fixed_tuple_checker(args)
+        return _sequence_checker(origin, args[0])
+
+    typ = get_type(annotation)
+    if not isinstance(typ, type):
+        raise TypeError(f"Values cannot be checked against {annotation!r}")
+    return _class_checker(typ)
@@ -0,0 +1,566 @@
+import uuid
+import typing
+import decimal
+import datetime
+import collections
+from enum import Enum
+from dataclasses import MISSING, is_dataclass
+
+from .checkers import (
+    FIXED_TUPLE,
+    MAPPING,
+    UNION_ORIGINS,
+    compile_type_checker,
+    get_collection_shape,
+    register_compiled_cache,
+)
+from .typing import (
+    NoneType,
+    get_args,
+    get_origin,
+    is_any_type,
+    is_builtin_type,
+    is_mini_annotated,
+)
+from .projection import LOAD_PROJECTION
+from .recursive import build_model, is_recursive_model
+from .utils import init_class
+
+__all__ = ("Coercer", "compile_coercer", "get_discriminator_map")
+
+Coercer = typing.Callable[[typing.Any], typing.Any]
+
+# Compiled coercers by annotation
+_COMPILED_COERCERS: typing.Dict[typing.Any, Coercer] = register_compiled_cache({})
+
+# Models by discriminator value, by union annotation and discriminator field
+_DISCRIMINATOR_MAPS: typing.Dict[typing.Any, typing.Dict[typing.Any, type]] = (
+    register_compiled_cache({})
+)
+
+# Values that can be converted to another sequence type
+_SEQUENCE_VALUES = (list, tuple, set, frozenset, collections.deque)
+
+
+def compile_coercer(
+    annotation: typing.Any, discriminator: typing.Optional[str] = None
+) -> Coercer:
+    """
+    Return a callable that converts a value to the annotation where possible, e.g. a
+    dict to a model instance or a list of dicts to a list of model instances.
+
+    Values that already match the annotation are returned as is. Values that cannot
+    be converted are returned unchanged and left for the type check to report.
+
+    Args:
+        annotation: The annotation to convert values to.
+        discriminator: The name of the field whose value selects the model of the
+            unions of models in the annotation, see ``get_discriminator_map``.
+    """
+    key = annotation if discriminator is None else (annotation, discriminator)
+    try:
+        return _COMPILED_COERCERS[key]
+    except KeyError:
+        pass
+    except TypeError:
+        return _compile(annotation, discriminator)
+
+    coercer = _compile(annotation, discriminator)
+    _COMPILED_COERCERS[key] = coercer
+    return coercer
+
+
+def get_discriminator_map(
+    annotation: typing.Any, discriminator: str
+) -> typing.Dict[typing.Any, type]:
+    """
+    Map the discriminator values of the models of a union to the models.
+
+    The values of a model are the arguments of its ``Literal`` annotation of the
+    discriminator field, or else the default of the field. The values of Enum members
+    are mapped too, so that raw values select the model as well.
+
+    Raises:
+        TypeError: If a model has no discriminator field or no value for it, or if
+            two models share a value.
+    """
+    key = (annotation, discriminator)
+    try:
+        return _DISCRIMINATOR_MAPS[key]
+    except KeyError:
+        pass
+
+    mapping: typing.Dict[typing.Any, type] = {}
+    for member in get_args(annotation):
+        if not (isinstance(member, type) and is_dataclass(member)):
+            continue
+        for tag in _get_discriminator_values(member, discriminator):
+            tags = [tag, tag.value] if isinstance(tag, Enum) else [tag]
+            for tag in tags:
+                other = mapping.setdefault(tag, member)
+                if other is not member:
+                    raise TypeError(
+                        f"Models '{other.__name__}' and '{member.__name__}' have the "
+                        f"same discriminator value {tag!r} for {discriminator!r}"
+                    )
+
+    _DISCRIMINATOR_MAPS[key] = mapping
+    return mapping
+
+
+def _get_discriminator_values(
+    model: type, discriminator: str
+) -> typing.Tuple[typing.Any, ...]:
+    fd = getattr(model, "__dataclass_fields__", {}).get(discriminator)
+    if fd is None:
+        raise TypeError(
+            f"Model '{model.__name__}' has no discriminator field {discriminator!r}"
+        )
+
+    get_hints = getattr(model, "_get_resolved_type_hints", None)
+    annotation = get_hints().get(discriminator, fd.type) if get_hints else fd.type
+    default = fd.default
+    if is_mini_annotated(annotation):
+        if default is MISSING:
+            default = getattr(annotation.__metadata__[0], "default", MISSING)
+        annotation = get_args(annotation)[0]
+    if get_origin(annotation) is typing.Literal:
+        return get_args(annotation)
+    if default is not MISSING:
+        return (default,)
+    raise TypeError(
+        f"Discriminator field {discriminator!r} of model '{model.__name__}' must be "
+        f"annotated with a Literal or have a default"
+    )
+
+
+def _identity(value: typing.Any) -> typing.Any:
+    return value
+
+
+_TRUE_STRINGS = frozenset(["true", "t", "yes", "y", "on", "1"])
+_FALSE_STRINGS = frozenset(["false", "f", "no", "n", "off", "0", ""])
+
+# Values converted to str by the str coercer. Containers are left for the type check,
+# and bytes are decoded instead.
+_STR_CONVERTIBLE = (int, float, complex, decimal.Decimal, Enum)
+
+
+def _bool_coercer(cls: type) -> Coercer:
+    def coerce(value: typing.Any) -> typing.Any:
+        if value.__class__ is bool:
+            return value
+        if isinstance(value, str):
+            text = value.strip().lower()
+            if text in _TRUE_STRINGS:
+                return True
+            if text in _FALSE_STRINGS:
+                return False
+        elif isinstance(value, (int, float)) and value in (0, 1):
+            return bool(value)
+        return value
+
+    return coerce
+
+
+def _int_coercer(cls: type) -> Coercer:
+    def coerce(value: typing.Any) -> typing.Any:
+        if value.__class__ is int or isinstance(value, int):
+            return value
+        if isinstance(value, str):
+            try:
+                return int(value)
+            except ValueError:
+                return value
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        if isinstance(value, decimal.Decimal) and value == value.to_integral_value():
+            return int(value)
+        return value
+
+    return coerce
+
+
+def _float_coercer(cls: type) -> Coercer:
+    def coerce(value: typing.Any) -> typing.Any:
+        if value.__class__ is float or isinstance(value, float):
+            return value
+        if (
+            isinstance(value, (str, int, decimal.Decimal))
+            and value.__class__ is not bool
+        ):
+            try:
+                return float(value)
+            except ValueError:
+                return value
+        return value
+
+    return coerce
+
+
+def _str_coercer(cls: type) -> Coercer:
+    def coerce(value: typing.Any) -> typing.Any:
+        if value.__class__ is str or isinstance(value, str):
+            return value
+        if isinstance(value, _STR_CONVERTIBLE):
+            return str(value)
+        if isinstance(value, (bytes, bytearray)):
+            try:
+                return value.decode("utf-8")
+            except UnicodeDecodeError:
+                pass
+        return value
+
+    return coerce
+
+
+def _enum_coercer(cls: typing.Type[Enum]) -> Coercer:
+    members = {}
+    for member in cls:
+        try:
+            members.setdefault(member.value, member)
+        except TypeError:
+            # unhashable member values are looked up by calling the enum
+            pass
+    # Enums can resolve unknown values in _missing_
+    resolve_missing = getattr(cls._missing_, "__func__", None) is not getattr(
+        Enum._missing_, "__func__", None
+    )
+
+    def coerce(value: typing.Any) -> typing.Any:
+        if value is None or value.__class__ is cls:
+            return value
+        try:
+            member = members.get(value)
+        except TypeError:
+            member = None
+        if member is not None:
+            return member
+        if resolve_missing or not members:
+            try:
+                return cls(value)
+            except (ValueError, TypeError):
+                pass
+        return value
+
+    return coerce
+
+
+# Formats tried, after fromisoformat, for strings assigned to date and time fields
+_DATETIME_FORMATS = (
+    "%Y-%m-%d %H:%M:%S.%f%z",
+    "%Y-%m-%d %H:%M:%S%z",
+    "%Y-%m-%dT%H:%M:%S.%f%z",
+    "%Y-%m-%dT%H:%M:%S%z",
+    "%Y-%m-%d %H:%M:%S.%f",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M",
+    "%Y-%m-%d %H:%M",
+    "%Y%m%dT%H%M%S",
+    "%Y/%m/%d %H:%M:%S",
+)
+_DATE_FORMATS = ("%Y%m%d", "%Y/%m/%d")
+_TIME_FORMATS = ("%H:%M:%S.%f", "%H:%M:%S", "%H:%M", "%H%M%S")
+
+_TEMPORAL_FORMATS = {
+    datetime.datetime: _DATETIME_FORMATS + _DATE_FORMATS,
+    datetime.date: _DATE_FORMATS,
+    datetime.time: _TIME_FORMATS,
+}
+
+
+def _temporal_coercer(cls: type) -> Coercer:
+    formats = _TEMPORAL_FORMATS[cls]
+    # The format that parsed the last value is tried first, since the values of
+    # one field, e.g. a CSV column, usually share a format.
+    detected: typing.List[typing.Optional[str]] = [None]
+
+    if cls is datetime.datetime:
+        convert = _identity
+    elif cls is datetime.date:
+        convert = datetime.datetime.date
+    else:
+        convert = datetime.datetime.timetz
+
+    def parse(text: str) -> typing.Any:
+        try:
+            return cls.fromisoformat(text)
+        except ValueError:
+            pass
+
+        if text[-1:] in ("Z", "z"):
+            # fromisoformat accepts the "Z" suffix from Python 3.11 only
+            try:
+                return cls.fromisoformat(text[:-1] + "+00:00")
+            except ValueError:
+                pass
+
+        last = detected[0]
+        if last is not None:
+            try:
+                return convert(datetime.datetime.strptime(text, last))
+            except ValueError:
+                pass
+
+        for fmt in formats:
+            if fmt == last:
+                continue
+            try:
+                result = datetime.datetime.strptime(text, fmt)
+            except ValueError:
+                continue
+            detected[0] = fmt
+            return convert(result)
+        return None
+
+    def coerce(value: typing.Any) -> typing.Any:
+        if value.__class__ is cls or isinstance(value, cls):
+            return value
+        if isinstance(value, str):
+            result = parse(value.strip())
+            return value if result is None else result
+        if (
+            cls is datetime.datetime
+            and isinstance(value, (int, float))
+            and value.__class__ is not bool
+        ):
+            # numbers are read as POSIX timestamps
+            try:
+                return cls.fromtimestamp(value, tz=datetime.timezone.utc)
+            except (OverflowError, OSError, ValueError):
+                return value
+        return value
+
+    return coerce
+
+
+def _uuid_coercer(cls: type) -> Coercer:
+    def coerce(value: typing.Any) -> typing.Any:
+        if value.__class__ is cls or isinstance(value, cls):
+            return value
+        try:
+            if isinstance(value, str):
+                return cls(value)
+            if isinstance(value, bytes) and len(value) == 16:
+                return cls(bytes=value)
+            if isinstance(value, int) and value.__class__ is not bool:
+                return cls(int=value)
+        except ValueError:
+            pass
+        return value
+
+    return coerce
+
+
+def _decimal_coercer(cls: type) -> Coercer:
+    def coerce(value: typing.Any) -> typing.Any:
+        if value.__class__ is cls or isinstance(value, cls):
+            return value
+        if isinstance(value, str):
+            try:
+                return cls(value.strip())
+            except decimal.InvalidOperation:
+                return value
+        if isinstance(value, int) and value.__class__ is not bool:
+            return cls(value)
+        if isinstance(value, float):
+            # the shortest repr gives Decimal("0.1") instead of the binary expansion
+            return cls(repr(value))
+        return value
+
+    return coerce
+
+
+# Coercers of scalar types by class. The coercers return None and values that are
+# already of the type as they are.
+_SCALAR_COERCERS: typing.Dict[type, typing.Callable[[type], Coercer]] = {
+    bool: _bool_coercer,
+    int: _int_coercer,
+    float: _float_coercer,
+    str: _str_coercer,
+    datetime.datetime: _temporal_coercer,
+    datetime.date: _temporal_coercer,
+    datetime.time: _temporal_coercer,
+    uuid.UUID: _uuid_coercer,
+    decimal.Decimal: _decimal_coercer,
+}
+
+
+def _class_coercer(cls: type) -> Coercer:
+    if issubclass(cls, Enum):
+        return _enum_coercer(cls)
+
+    factory = _SCALAR_COERCERS.get(cls)
+    if factory is not None:
+        return factory(cls)
+
+    builtin = is_builtin_type(cls)
+    # dicts for recursive models are converted without recursion, unless only
+    # some of their fields are validated
+    recursive = hasattr(cls, "_get_field_names") and is_recursive_model(cls)
+
+    def coerce(value: typing.Any) -> typing.Any:
+        if value is None or value.__class__ is cls or isinstance(value, cls):
+            return value
+        if isinstance(value, dict):
+            if recursive and LOAD_PROJECTION.get() is None:
+                return build_model(cls, value, depth=1)
+            return init_class(cls, value)
+        if builtin:
+            try:
+                return cls(value)
+            except (ValueError, TypeError):
+                pass
+        return value
+
+    return coerce
+
+
+def _literal_coercer(values: typing.Tuple[typing.Any, ...]) -> Coercer:
+    # raw values are converted to the Enum members allowed by the Literal
+    members = {}
+    for literal in values:
+        if isinstance(literal, Enum):
+            try:
+                members.setdefault(literal.value, literal)
+            except TypeError:
+                pass
+    if not members:
+        return _identity
+
+    def coerce(value: typing.Any) -> typing.Any:
+        if isinstance(value, Enum):
+            return value
+        try:
+            return members.get(value, value)
+        except TypeError:
+            return value
+
+    return coerce
+
+
+def _union_coercer(annotation: typing.Any) -> Coercer:
+    # Values that match no member are converted to the first member, if possible
+    members = [arg for arg in get_args(annotation) if arg is not NoneType]
+    check = compile_type_checker(annotation)
+    coerce_member = compile_coercer(members[0]) if members else _identity
+
+    def coerce(value: typing.Any) -> typing.Any:
+        if value is None or check(value):
+            return value
+        return coerce_member(value)
+
+    return coerce
+
+
+def _tagged_union_coercer(annotation: typing.Any, discriminator: str) -> Coercer:
+    # Dicts are converted to the model selected by their discriminator value
+    check = compile_type_checker(annotation)
+    models = get_discriminator_map(annotation, discriminator)
+
+    def coerce(value: typing.Any) -> typing.Any:
+        if value is None or check(value) or not isinstance(value, dict):
+            return value
+        try:
+            model = models.get(value.get(discriminator))
+        except TypeError:
+            model = None
+        return value if model is None else init_class(model, value)
+
+    return coerce
+
+
+def _sequence_coercer(
+    annotation: typing.Any,
+    origin: type,
+    element_type: typing.Any,
+    discriminator: typing.Optional[str] = None,
+) -> Coercer:
+    check = compile_type_checker(annotation)
+    coerce_element = compile_coercer(element_type, discriminator)
+
+    def coerce(value: typing.Any) -> typing.Any:
+        if check(value) or not isinstance(value, _SEQUENCE_VALUES):
+            return value
+        return origin([coerce_element(element) for element in value])
+
+    return coerce
+
+
+def _fixed_tuple_coercer(
+    annotation: typing.Any,
+    element_types: typing.Tuple[typing.Any, ...],
+    discriminator: typing.Optional[str] = None,
+) -> Coercer:
+    check = compile_type_checker(annotation)
+    element_coercers = tuple(
+        compile_coercer(typ, discriminator) for typ in element_types
+    )
+
+    def coerce(value: typing.Any) -> typing.Any:
+        if (
+            check(value)
+            or not isinstance(value, _SEQUENCE_VALUES)
+            or len(value) != len(element_coercers)
+        ):
+            return value
+        return tuple(
+            coerce_element(element)
+            for coerce_element, element in zip(element_coercers, value)
+        )
+
+    return coerce
+
+
+def _mapping_coercer(
+    annotation: typing.Any,
+    origin: type,
+    key_type: typing.Any,
+    value_type: typing.Any,
+    discriminator: typing.Optional[str] = None,
+) -> Coercer:
+    check = compile_type_checker(annotation)
+    coerce_key = compile_coercer(key_type)
+    coerce_value = compile_coercer(value_type, discriminator)
+
+    def coerce(value: typing.Any) -> typing.Any:
+        if check(value) or not isinstance(value, dict):
+            return value
+        items = {coerce_key(key): coerce_value(item) for key, item in value.items()}
+        if origin is collections.defaultdict:
+            return origin(getattr(value, "default_factory", None), items)
+        return origin(items)
+
+    return coerce
+
+
+def _compile(
+    annotation: typing.Any, discriminator: typing.Optional[str] = None
+) -> Coercer:
+    if annotation is None or is_any_type(annotation):
+        return _identity
+
+    origin = get_origin(annotation)
+    if origin is None and isinstance(annotation, type):
+        return _class_coercer(annotation)
+
+    if origin in UNION_ORIGINS:
+        if discriminator is not None and any(
+            isinstance(arg, type) and is_dataclass(arg) for arg in get_args(annotation)
+        ):
+            return _tagged_union_coercer(annotation, discriminator)
+        return _union_coercer(annotation)
+
+    if origin is typing.Literal:
+        return _literal_coercer(get_args(annotation))
+
+    shape = get_collection_shape(annotation)
+    if shape is None:
+        return _identity
+
+    origin, kind, args = shape
+    if kind == MAPPING:
+        return _mapping_coercer(annotation, origin, *args, discriminator)
+    if kind == FIXED_TUPLE:
+        return _fixed_tuple_coercer(annotation, args, discriminator)
+    return _sequence_coercer(annotation, origin, args[0], discriminator)
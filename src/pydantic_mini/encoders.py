@@ -0,0 +1,315 @@
+import uuid
+import typing
+import decimal
+import datetime
+import operator
+import collections
+from enum import Enum
+from dataclasses import fields, is_dataclass
+
+from .checkers import FIXED_TUPLE, MAPPING, UNION_ORIGINS, get_collection_shape
+from .projection import ProjectionPlan, map_models
+from .recursive import REFERENCES_COPY, dump_model, is_recursive_model
+from .typing import NoneType, get_args, get_origin, is_any_type, is_mini_annotated
+
+if typing.TYPE_CHECKING:
+    from .base import BaseModel
+
+__all__ = ("Converter", "to_jsonable", "compile_json_converter", "get_json_converter")
+
+Converter = typing.Callable[[typing.Any], typing.Any]
+
+# Values the json module writes as they are
+_JSON_NATIVE_TYPES = frozenset([str, int, float, bool, NoneType])
+
+_JSON_KEY_CONSTANTS = {None: "null", True: "true", False: "false"}
+
+_INFINITY = float("inf")
+
+_SEQUENCE_VALUES = (list, tuple, set, frozenset, collections.deque)
+
+_COMPILED_CONVERTERS: typing.Dict[typing.Any, Converter] = {}
+
+# Converters by model. The converters of projection plans are kept on the plans.
+_MODEL_CONVERTERS: typing.Dict[typing.Any, Converter] = {}
+
+# Converters of the field values of models, by model and field name
+_FIELD_CONVERTERS: typing.Dict[type, typing.Dict[str, Converter]] = {}
+
+
+def to_jsonable(value: typing.Any) -> typing.Any:
+    """
+    Convert any value to the objects the json module writes: Enums to their value,
+    dates and times to ISO 8601 strings, dataclasses to dicts and sequences to lists.
+    Values of other types are converted with ``str``.
+    """
+    cls = value.__class__
+    if cls in _JSON_NATIVE_TYPES:
+        return value
+    if isinstance(value, (str, int, float)) and not isinstance(value, Enum):
+        return value
+    if isinstance(value, Enum):
+        return to_jsonable(value.value)
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if is_dataclass(value) and not isinstance(value, type):
+        if hasattr(cls, "_get_field_names"):
+            return get_json_converter(cls)(value)
+        return {fd.name: to_jsonable(getattr(value, fd.name)) for fd in fields(value)}
+    if isinstance(value, _SEQUENCE_VALUES):
+        return [to_jsonable(item) for item in value]
+    if isinstance(value, dict):
+        return {_to_json_key(key): to_jsonable(item) for key, item in value.items()}
+    return str(value)
+
+
+def _to_json_key(key: typing.Any) -> str:
+    # Keys are converted to strings the way the json module converts them, so that
+    # every backend writes the same document.
+    key = to_jsonable(key)
+    if isinstance(key, str):
+        return key
+    if key is None or isinstance(key, bool):
+        return _JSON_KEY_CONSTANTS[key]
+    if isinstance(key, float):
+        if key != key:
+            return "NaN"
+        if key in (_INFINITY, -_INFINITY):
+            return "Infinity" if key > 0 else "-Infinity"
+        return float.__repr__(key)
+    if isinstance(key, int):
+        return int.__repr__(key)
+    return str(key)
+
+
+def compile_json_converter(annotation: typing.Any) -> Converter:
+    """
+    Return a function converting values of the annotation like ``to_jsonable``.
+
+    The function converts values of the declared type directly and falls back to
+    ``to_jsonable`` for values of any other type.
+    """
+    try:
+        return _COMPILED_CONVERTERS[annotation]
+    except KeyError:
+        pass
+    except TypeError:
+        return _compile(annotation)
+
+    converter = _compile(annotation)
+    _COMPILED_CONVERTERS[annotation] = converter
+    return converter
+
+
+def get_json_converter(
+    model: typing.Type["BaseModel"],
+    plan: typing.Optional[ProjectionPlan] = None,
+    references: typing.Optional[str] = None,
+) -> Converter:
+    """
+    Return the function converting instances of the model to JSON-ready dicts.
+    With a projection plan, only the fields selected by the plan are converted.
+    With references, nested instances seen before are converted as described by
+    ``dump_model``; references cannot be combined with a plan.
+    """
+    if references == REFERENCES_COPY:
+        references = None
+    if plan is not None and references is None:
+        if plan.json_converter is None:
+            plan.json_converter = _compile_model_converter(model, plan)
+        return plan.json_converter
+
+    key = model if references is None else (plan or model, references)
+    try:
+        return _MODEL_CONVERTERS[key]
+    except KeyError:
+        pass
+
+    if plan is None and (references is not None or is_recursive_model(model)):
+        # instances of recursive models are converted without recursion
+        def convert_recursive(instance: "BaseModel") -> typing.Dict[str, typing.Any]:
+            return dump_model(
+                instance,
+                _get_field_converters,
+                to_jsonable,
+                _to_json_key,
+                keep_tuples=False,
+                references=references,
+            )
+
+        _MODEL_CONVERTERS[key] = convert_recursive
+        return convert_recursive
+
+    if references is not None:
+        raise ValueError("references cannot be combined with include or exclude")
+
+    convert = _MODEL_CONVERTERS[key] = _compile_model_converter(model, plan)
+    return convert
+
+
+def _compile_model_converter(
+    model: typing.Type["BaseModel"], plan: typing.Optional[ProjectionPlan]
+) -> Converter:
+    field_converters = _get_field_converters(model)
+    names = model._get_field_names() if plan is None else plan.names
+    converters = [
+        (
+            _projected_converter(plan.children[name])
+            if plan is not None and name in plan.children
+            else field_converters[name]
+        )
+        for name in names
+    ]
+
+    if plan is not None:
+        getter = plan.getter
+    elif len(names) > 1:
+        getter = operator.attrgetter(*names)
+    else:
+        getter = None
+    items = tuple(zip(names, converters))
+
+    def convert(instance: "BaseModel") -> typing.Dict[str, typing.Any]:
+        if getter is None:
+            return {name: conv(getattr(instance, name)) for name, conv in items}
+        return {
+            name: conv(value) for (name, conv), value in zip(items, getter(instance))
+        }
+
+    return convert
+
+
+def _get_field_converters(
+    model: typing.Type["BaseModel"],
+) -> typing.Dict[str, Converter]:
+    try:
+        return _FIELD_CONVERTERS[model]
+    except KeyError:
+        pass
+
+    hints = model._get_resolved_type_hints()
+    converters = {}
+    for name in model._get_field_names():
+        annotation = hints.get(name, model.__dataclass_fields__[name].type)
+        if is_mini_annotated(annotation):
+            annotation = get_args(annotation)[0]
+        converters[name] = compile_json_converter(annotation)
+
+    _FIELD_CONVERTERS[model] = converters
+    return converters
+
+
+def _projected_converter(plan: ProjectionPlan) -> Converter:
+    # values holding instances of the model of a nested projection plan
+    def project(instance: typing.Any) -> typing.Any:
+        if instance.__class__ is plan.model:
+            return get_json_converter(plan.model, plan)(instance)
+        return to_jsonable(instance)
+
+    return lambda value: map_models(value, project, to_jsonable)
+
+
+def _native_converter(cls: type) -> Converter:
+    return lambda value: value if value.__class__ is cls else to_jsonable(value)
+
+
+def _enum_converter(cls: typing.Type[Enum]) -> Converter:
+    if all(member.value.__class__ in _JSON_NATIVE_TYPES for member in cls):
+        return lambda value: (
+            value._value_ if value.__class__ is cls else to_jsonable(value)
+        )
+    return to_jsonable
+
+
+def _isoformat_converter(cls: type) -> Converter:
+    return lambda value: (
+        value.isoformat() if value.__class__ is cls else to_jsonable(value)
+    )
+
+
+def _str_converter(cls: type) -> Converter:
+    return lambda value: str(value) if value.__class__ is cls else to_jsonable(value)
+
+
+def _model_converter(cls: type) -> Converter:
+    # looked up when used, as the converter of a recursive model may still be compiling
+    def convert(value: typing.Any) -> typing.Any:
+        if value.__class__ is cls:
+            return get_json_converter(cls)(value)
+        return to_jsonable(value)
+
+    return convert
+
+
+_CLASS_CONVERTERS: typing.Dict[type, typing.Callable[[type], Converter]] = {
+    str: _native_converter,
+    int: _native_converter,
+    float: _native_converter,
+    bool: _native_converter,
+    datetime.datetime: _isoformat_converter,
+    datetime.date: _isoformat_converter,
+    datetime.time: _isoformat_converter,
+    uuid.UUID: _str_converter,
+    decimal.Decimal: _str_converter,
+}
+
+
+def _sequence_converter(element: Converter) -> Converter:
+    def convert(value: typing.Any) -> typing.Any:
+        if isinstance(value, _SEQUENCE_VALUES):
+            return [element(item) for item in value]
+        return to_jsonable(value)
+
+    return convert
+
+
+def _fixed_tuple_converter(elements: typing.Sequence[Converter]) -> Converter:
+    def convert(value: typing.Any) -> typing.Any:
+        if isinstance(value, _SEQUENCE_VALUES) and len(value) == len(elements):
+            return [conv(item) for conv, item in zip(elements, value)]
+        return to_jsonable(value)
+
+    return convert
+
+
+def _mapping_converter(key: Converter, item: Converter) -> Converter:
+    def convert(value: typing.Any) -> typing.Any:
+        if isinstance(value, dict):
+            return {_to_json_key(key(k)): item(v) for k, v in value.items()}
+        return to_jsonable(value)
+
+    return convert
+
+
+def _compile(annotation: typing.Any) -> Converter:
+    if annotation is None or is_any_type(annotation):
+        return to_jsonable
+
+    origin = get_origin(annotation)
+    if origin is None and isinstance(annotation, type):
+        if issubclass(annotation, Enum):
+            return _enum_converter(annotation)
+        factory = _CLASS_CONVERTERS.get(annotation)
+        if factory is not None:
+            return factory(annotation)
+        if is_dataclass(annotation) and hasattr(annotation, "_get_field_names"):
+            return _model_converter(annotation)
+        return to_jsonable
+
+    if origin in UNION_ORIGINS:
+        members = [arg for arg in get_args(annotation) if arg is not NoneType]
+        if len(members) == 1:
+            member = compile_json_converter(members[0])
+            return lambda value: None if value is None else member(value)
+        return to_jsonable
+
+    shape = get_collection_shape(annotation)
+    if shape is None:
+        return to_jsonable
+
+    _, kind, args = shape
+    if kind == MAPPING:
+        return _mapping_converter(*[compile_json_converter(arg) for arg in args])
+    if kind == FIXED_TUPLE:
+        return _fixed_tuple_converter([compile_json_converter(arg) for arg in args])
+    return _sequence_converter(compile_json_converter(args[0]))
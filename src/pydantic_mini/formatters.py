@@ -1,7 +1,15 @@
+import io
+import os
 import csv
-import json
+import copy
+import mmap
+import codecs
+import locale
 import typing
-from dataclasses import asdict
+import operator
+import functools
+import contextlib
+from dataclasses import MISSING, asdict, is_dataclass
 from abc import ABC, abstractmethod
 
 try:
@@ -9,6 +17,19 @@ try:
 except ImportError:
     from io import StringIO
 
+from . import binary
+from .base import DEFERRED_CONSTRAINTS
+from .cache import get_loads_cache, dict_key, payload_key
+from .encoders import get_json_converter
+from .json_backends import JSONBackend, JSONText, get_json_backend
+from .projection import (
+    LOAD_PROJECTION,
+    ProjectionPlan,
+    get_projection_plan,
+    map_models,
+    select_fields,
+)
+from .recursive import REFERENCES_COPY, build_model, dump_model, is_recursive_model
 from .utils import init_class
 
 if typing.TYPE_CHECKING:
@@ -17,15 +38,244 @@ if typing.TYPE_CHECKING:
 
 _BLOCK_SIZE = 1024
 
+# Files of at least this size are read through a memory map by default
+_MMAP_THRESHOLD = 1024 * 1024
+
+# Number of bytes decoded at a time from a memory mapped file
+_MMAP_CHUNK_SIZE = 1024 * 1024
+
 T = typing.TypeVar("T", typing.List["BaseModel"], "BaseModel")
 D = typing.TypeVar(
     "D", typing.Dict[str, typing.Any], typing.List[typing.Dict[str, typing.Any]]
 )
 
 
+def model_asdict(instance: typing.Any) -> typing.Dict[str, typing.Any]:
+    """
+    Convert a dataclass instance like ``dataclasses.asdict``. Instances of recursive
+    models are converted without recursion.
+    """
+    cls = type(instance)
+    if hasattr(cls, "_get_field_names") and is_recursive_model(cls):
+        return dump_model(instance, _get_asdict_converters, asdict_value, asdict_value)
+    return asdict(instance)
+
+
+def _get_asdict_converters(
+    model: typing.Type["BaseModel"],
+) -> typing.Dict[str, typing.Callable[[typing.Any], typing.Any]]:
+    return dict.fromkeys(model._get_field_names(), asdict_value)
+
+
+def asdict_value(value: typing.Any) -> typing.Any:
+    """Convert a single field value the way ``dataclasses.asdict`` converts fields."""
+    if is_dataclass(value) and not isinstance(value, type):
+        return model_asdict(value)
+    if isinstance(value, tuple) and hasattr(value, "_fields"):
+        return type(value)(*[asdict_value(val) for val in value])
+    if isinstance(value, (list, tuple)):
+        return type(value)(asdict_value(val) for val in value)
+    if isinstance(value, dict):
+        return type(value)(
+            (asdict_value(key), asdict_value(val)) for key, val in value.items()
+        )
+    return copy.deepcopy(value)
+
+
+def asdict_projected(
+    instance: "BaseModel", plan: ProjectionPlan
+) -> typing.Dict[str, typing.Any]:
+    """Convert the fields of an instance selected by a projection plan like ``asdict``."""
+    children = plan.children
+    return {
+        name: (
+            asdict_value(value)
+            if name not in children
+            else asdict_projected_value(value, children[name])
+        )
+        for name, value in zip(plan.names, plan.getter(instance))
+    }
+
+
+def asdict_projected_value(value: typing.Any, plan: ProjectionPlan) -> typing.Any:
+    """Convert a field value holding instances of the model of a projection plan."""
+    return map_models(value, lambda obj: asdict_projected(obj, plan), asdict_value)
+
+
+def iter_mmap_lines(
+    mm: mmap.mmap, encoding: str, chunk_size: int = _MMAP_CHUNK_SIZE
+) -> typing.Iterator[str]:
+    """
+    Yield the lines of a memory mapped text file with their line endings.
+
+    The file is decoded in chunks of ``chunk_size`` bytes instead of line by line.
+    Lines are split like a file opened with ``newline=""``, as the csv module expects.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    pending = ""
+    for offset in range(0, len(mm), chunk_size):
+        text = pending + decoder.decode(mm[offset : offset + chunk_size])
+        lines = StringIO(text, newline="").readlines()
+        # the last line may continue in the next chunk, including a "\r\n"
+        # line ending split across two chunks
+        pending = lines.pop() if lines else ""
+        yield from lines
+
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield from StringIO(pending, newline="").readlines()
+
+
+@contextlib.contextmanager
+def open_json_source(source: typing.Any) -> typing.Iterator[JSONText]:
+    """
+    Yield the document of a JSON source without copying it where possible.
+
+    ``str``, ``bytes``, ``bytearray`` and ``memoryview`` documents are yielded as they
+    are. Paths (``os.PathLike``, not ``str``, which is always a JSON document) are
+    memory mapped and yielded as a ``memoryview``, valid only inside the context.
+    File objects are read whole.
+    """
+    if isinstance(source, (str, bytes, bytearray, memoryview)):
+        yield source
+    elif isinstance(source, os.PathLike):
+        with open(source, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # empty files cannot be memory mapped
+                yield b""
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                view = memoryview(mm)
+                try:
+                    yield view
+                finally:
+                    view.release()
+    elif hasattr(source, "read"):
+        yield source.read()
+    else:
+        raise TypeError(
+            f"JSON source must be str, bytes, bytearray, memoryview, a path or a file "
+            f"object, not {type(source).__name__}"
+        )
+
+
+def is_binary_sink(sink: typing.Any) -> bool:
+    """Return True if the sink is a path or a binary file object."""
+    return isinstance(sink, (str, bytes, os.PathLike, io.RawIOBase, io.BufferedIOBase))
+
+
+@contextlib.contextmanager
+def open_sink(
+    sink: typing.Any, binary: bool = False, encoding: typing.Optional[str] = None
+) -> typing.Iterator[typing.IO]:
+    """
+    Open a path for writing, or adapt a file object to text or binary writes.
+
+    Paths are opened and closed by the context manager. File objects are left open, and
+    binary file objects are wrapped in a text wrapper when text is written to them.
+    """
+    encoding = encoding or locale.getpreferredencoding(False)
+
+    if isinstance(sink, (str, bytes, os.PathLike)):
+        if binary:
+            with open(sink, "wb") as f:
+                yield f
+        else:
+            with open(sink, "w", newline="", encoding=encoding) as f:
+                yield f
+        return
+
+    if binary or not isinstance(sink, (io.RawIOBase, io.BufferedIOBase)):
+        yield sink
+        return
+
+    wrapper = io.TextIOWrapper(sink, encoding=encoding, newline="", write_through=True)
+    try:
+        yield wrapper
+    finally:
+        wrapper.flush()
+        # leave the binary file open for the caller
+        wrapper.detach()
+
+
+_CSV_SCALAR_TYPES = frozenset([str, int, float, bool, type(None)])
+
+_ROW_EXTRACTORS: typing.Dict[typing.Any, typing.Callable[[typing.Any], typing.List]] = (
+    {}
+)
+
+
+def check_instances(
+    model: typing.Optional[typing.Type["BaseModel"]],
+    instances: typing.Iterable["BaseModel"],
+) -> typing.Iterator["BaseModel"]:
+    """
+    Yield the instances, raising TypeError for any that is not an instance of the
+    model. Without a model the instances are yielded as they are.
+    """
+    if model is None:
+        yield from instances
+        return
+    for instance in instances:
+        if not isinstance(instance, model):
+            raise TypeError(
+                f"Expected an instance of '{model.__name__}', "
+                f"got {type(instance).__name__}."
+            )
+        yield instance
+
+
+def get_row_extractor(
+    model: typing.Type["BaseModel"], plan: typing.Optional[ProjectionPlan] = None
+) -> typing.Callable[["BaseModel"], typing.List[typing.Any]]:
+    """
+    Return a function that reads the field values of an instance of the model as a
+    list in field order, converting values like ``dataclasses.asdict`` does.
+    With a projection plan, only the fields selected by the plan are read.
+    """
+    key = model if plan is None else plan
+    try:
+        return _ROW_EXTRACTORS[key]
+    except KeyError:
+        pass
+
+    if plan is None:
+        names = model._get_field_names()
+        getter = operator.attrgetter(*names)
+        single = len(names) == 1
+        converters = (asdict_value,) * len(names)
+    else:
+        getter = plan.getter
+        single = False
+        converters = tuple(
+            (
+                functools.partial(asdict_projected_value, plan=plan.children[name])
+                if name in plan.children
+                else asdict_value
+            )
+            for name in plan.names
+        )
+
+    def extract(instance: "BaseModel") -> typing.List[typing.Any]:
+        values = getter(instance)
+        if single:
+            values = (values,)
+        return [
+            (value if value.__class__ in _CSV_SCALAR_TYPES else convert(value))
+            for convert, value in zip(converters, values)
+        ]
+
+    _ROW_EXTRACTORS[key] = extract
+    return extract
+
+
 class BaseModelFormatter(ABC):
     format_name: str = None
 
+    def __init__(self, **config):
+        # per-call options passed to BaseModel.loads and BaseModel.dump
+        self.config = config
+
     @classmethod
     def is_format_name(cls, format_name: str) -> bool:
         format_names = (
@@ -35,6 +285,14 @@ class BaseModelFormatter(ABC):
         )
         return format_name in format_names
 
+    def _projection_plan(
+        self, _type: typing.Type["BaseModel"]
+    ) -> typing.Optional[ProjectionPlan]:
+        """Return the plan of the fields selected by the include and exclude options."""
+        return get_projection_plan(
+            _type, self.config.get("include"), self.config.get("exclude")
+        )
+
     @abstractmethod
     def encode(self, _type: typing.Type["BaseModel"], obj: D) -> T:
         pass
@@ -43,6 +301,43 @@ class BaseModelFormatter(ABC):
     def decode(self, instance: "BaseModel") -> typing.Any:
         pass
 
+    def iter_encode(
+        self, _type: typing.Type["BaseModel"], obj: typing.Any
+    ) -> typing.Iterator["BaseModel"]:
+        """
+        Yield the model instances of ``obj`` one at a time.
+
+        Formatters that can read records incrementally should override this, so that
+        batch loads do not have to hold all the instances in memory at once.
+        """
+        result = self.encode(_type, obj)
+        if isinstance(result, (list, tuple)):
+            yield from result
+        else:
+            yield result
+
+    def decode_to(
+        self,
+        sink: typing.Any,
+        instances: typing.Iterable["BaseModel"],
+        model: typing.Optional[typing.Type["BaseModel"]] = None,
+    ) -> int:
+        """
+        Write the instances to a path or file object and return how many were written.
+
+        The default implementation serialises all the instances with ``decode`` before
+        writing. Formatters that can write records incrementally should override this.
+
+        Raises:
+            TypeError: If ``model`` is given and an instance is not an instance of it.
+        """
+        instances = list(check_instances(model, instances))
+        data = self.decode(instances)
+        binary = isinstance(data, (bytes, bytearray))
+        with open_sink(sink, binary=binary, encoding=self.config.get("encoding")) as f:
+            f.write(data)
+        return len(instances)
+
     @classmethod
     def get_formatters(cls):
         for subclass in cls.__subclasses__():
@@ -58,14 +353,69 @@ class BaseModelFormatter(ABC):
 
 
 class DictModelFormatter(BaseModelFormatter):
+    """
+    Options:
+        use_cache: Set to False to bypass the loads cache of models configured
+            with ``loads_cache_size``. Defaults to True.
+        include: The fields to load or dump, as names or dotted paths of nested
+            fields e.g. ``["id", "author.name"]``, or as a mapping of names to True
+            or to the fields of the nested model e.g. ``{"author": {"name"}}``.
+        exclude: The fields to leave out, in the same forms as ``include``.
+        only_changed: Dump only the fields returned by ``get_changed_fields``.
+        references: How dump writes nested instances held more than once by an
+            instance. "copy", the default, dumps them each time and rejects cycles.
+            "reuse" dumps each instance once and reuses its dict. "ref" dumps each
+            instance once and writes ``{"$ref": pointer}`` for the later ones, where
+            pointer is the JSON Pointer of the first, which also allows cycles.
+            Cannot be combined with include or exclude.
+
+    Fields left out are not validated by loads: they keep the value they were given,
+    or None. Loads with include or exclude do not use the loads cache.
+    """
+
     format_name = "dict"
 
+    # Whether each dict is looked up in the loads cache of the model
+    cache_dicts = True
+
+    def _get_cache(self, _type: typing.Type["BaseModel"]):
+        if not self.config.get("use_cache", True) or self._projection_plan(_type):
+            return None
+        # batch rows are created before their deferred constraints are checked
+        deferred_constraints = DEFERRED_CONSTRAINTS.get()
+        if deferred_constraints and _type in deferred_constraints:
+            return None
+        return get_loads_cache(_type)
+
+    def _build(
+        self, _type: typing.Type["BaseModel"], obj: typing.Dict[str, typing.Any]
+    ) -> "BaseModel":
+        plan = self._projection_plan(_type)
+        token = LOAD_PROJECTION.set({_type: plan}) if plan is not None else None
+        try:
+            if plan is None and is_recursive_model(_type):
+                instance = build_model(_type, obj)
+            else:
+                instance = init_class(_type, obj)
+            # force executes post-init again for normal field validation
+            instance.__post_init__()
+        finally:
+            if token is not None:
+                LOAD_PROJECTION.reset(token)
+        return instance
+
     def _encode(
         self, _type: typing.Type["BaseModel"], obj: typing.Dict[str, typing.Any]
     ) -> "BaseModel":
-        instance = init_class(_type, obj)
-        # force executes post-init again for normal field validation
-        instance.__post_init__()
+        cache = self._get_cache(_type) if self.cache_dicts else None
+        key = dict_key(obj) if cache is not None else None
+        if key is None:
+            return self._build(_type, obj)
+
+        instance = cache.get(key[0])
+        if instance is MISSING:
+            instance = self._build(_type, obj)
+            cache.put(key[0], instance, key[1])
         return instance
 
     def encode(self, _type: typing.Type["BaseModel"], obj: D) -> T:
@@ -76,47 +426,381 @@ class DictModelFormatter(BaseModelFormatter):
         else:
             raise TypeError("Object must be dict or list")
 
+    def iter_encode(
+        self, _type: typing.Type["BaseModel"], obj: D
+    ) -> typing.Iterator["BaseModel"]:
+        if isinstance(obj, dict):
+            yield self._encode(_type, obj)
+        elif isinstance(obj, list):
+            for item in obj:
+                yield self._encode(_type, item)
+        else:
+            raise TypeError("Object must be dict or list")
+
+    def _references(
+        self, plan: typing.Optional[ProjectionPlan]
+    ) -> typing.Optional[str]:
+        references = self.config.get("references")
+        if references in (None, REFERENCES_COPY):
+            return None
+        if plan is not None:
+            raise ValueError("references cannot be combined with include or exclude")
+        return references
+
+    def _decode(self, instance: "BaseModel") -> typing.Dict[str, typing.Any]:
+        plan = self._projection_plan(type(instance))
+        references = self._references(plan)
+        only_changed = self.config.get("only_changed", False)
+        if references is not None:
+            data = dump_model(
+                instance,
+                _get_asdict_converters,
+                asdict_value,
+                asdict_value,
+                references=references,
+            )
+            if only_changed:
+                changed = instance.get_changed_fields()
+                data = {name: value for name, value in data.items() if name in changed}
+            return data
+
+        if only_changed:
+            # only the changed fields are converted
+            plan = select_fields(type(instance), plan, instance.get_changed_fields())
+        if plan is not None:
+            return asdict_projected(instance, plan)
+        return model_asdict(instance)
+
     def decode(self, instance: T) -> D:
         if isinstance(instance, list):
-            return [asdict(val) for val in instance]
-        return asdict(instance)
+            return [self._decode(val) for val in instance]
+        return self._decode(instance)
 
 
 class JSONModelFormatter(DictModelFormatter):
+    """
+    Loads from a JSON document as ``str``, ``bytes``, ``bytearray`` or ``memoryview``,
+    from a path (``os.PathLike``) or from a file object.
+
+    Options:
+        json_backend: The name of the JSON backend, e.g. "orjson". Defaults to the
+            ``json_backend`` of the model Config, then to the global default.
+        compact: Write JSON without spaces after separators. Defaults to False. orjson
+            and ujson only write compact JSON, so they use the standard library when
+            it is False.
+        ensure_ascii: Write non-ASCII characters as ``\\uXXXX`` escapes. Defaults to
+            True, like ``json.dumps``.
+        include, exclude, only_changed: See ``DictModelFormatter``.
+        encoding: The encoding used by ``dump_to`` for text files. Defaults to UTF-8.
+    """
+
     format_name = "json"
 
-    def encode(self, _type: typing.Type["BaseModel"], obj: str) -> T:
-        return super().encode(_type, json.loads(obj))
+    # The raw document is the cache key, so the parsed dicts are not looked up
+    cache_dicts = False
+
+    def _backend(self, _type: typing.Type["BaseModel"]) -> JSONBackend:
+        from .base import PYDANTIC_MINI_EXTRA_MODEL_CONFIG
+
+        name = self.config.get("json_backend") or getattr(
+            _type, PYDANTIC_MINI_EXTRA_MODEL_CONFIG, {}
+        ).get("json_backend")
+        return get_json_backend(name)
+
+    def _load(self, _type: typing.Type["BaseModel"], obj: typing.Any) -> typing.Any:
+        with open_json_source(obj) as document:
+            return self._backend(_type).loads(document)
+
+    def encode(self, _type: typing.Type["BaseModel"], obj: typing.Any) -> T:
+        cache = self._get_cache(_type)
+        if cache is None:
+            return super().encode(_type, self._load(_type, obj))
+
+        with open_json_source(obj) as document:
+            key, size = payload_key(document)
+            result = cache.get(key)
+            if result is MISSING:
+                data = self._backend(_type).loads(document)
+            else:
+                return list(result) if isinstance(result, tuple) else result
+
+        result = super().encode(_type, data)
+        cache.put(key, tuple(result) if isinstance(result, list) else result, size)
+        return result
+
+    def iter_encode(
+        self, _type: typing.Type["BaseModel"], obj: typing.Any
+    ) -> typing.Iterator["BaseModel"]:
+        return super().iter_encode(_type, self._load(_type, obj))
+
+    def _to_jsonable(self, instance: "BaseModel") -> typing.Dict[str, typing.Any]:
+        model = type(instance)
+        plan = self._projection_plan(model)
+        references = self._references(plan)
+        only_changed = self.config.get("only_changed", False)
+        if references is None and only_changed:
+            # only the changed fields are converted
+            plan = select_fields(model, plan, instance.get_changed_fields())
+        data = get_json_converter(model, plan, references)(instance)
+        if references is not None and only_changed:
+            changed = instance.get_changed_fields()
+            data = {name: value for name, value in data.items() if name in changed}
+        return data
 
     def decode(self, instance: T) -> str:
-        return json.dumps(super().decode(instance), default=str)
+        compact = self.config.get("compact", False)
+        ensure_ascii = self.config.get("ensure_ascii", True)
+        if isinstance(instance, (list, tuple)):
+            if not instance:
+                return get_json_backend(self.config.get("json_backend")).dumps([])
+            backend = self._backend(type(instance[0]))
+            return backend.dumps(
+                [self._to_jsonable(val) for val in instance], compact, ensure_ascii
+            )
+        return self._backend(type(instance)).dumps(
+            self._to_jsonable(instance), compact, ensure_ascii
+        )
+
+    def decode_to(
+        self,
+        sink: typing.Any,
+        instances: typing.Iterable["BaseModel"],
+        model: typing.Optional[typing.Type["BaseModel"]] = None,
+    ) -> int:
+        """Write the instances to a path or file object as a JSON array, one at a time."""
+        compact = self.config.get("compact", False)
+        ensure_ascii = self.config.get("ensure_ascii", True)
+        encoding = self.config.get("encoding") or "utf-8"
+        # backends write UTF-8 bytes directly to binary sinks
+        binary = is_binary_sink(sink) and codecs.lookup(encoding).name == "utf-8"
+        separator = "," if compact else ", "
+        if binary:
+            separator = separator.encode("ascii")
+        backend = self._backend(model) if model is not None else None
+        count = 0
+
+        with open_sink(sink, binary=binary, encoding=encoding) as f:
+            f.write(b"[" if binary else "[")
+            for obj in check_instances(model, instances):
+                if backend is None:
+                    backend = self._backend(type(obj))
+                dump = backend.dumpb if binary else backend.dumps
+                if count:
+                    f.write(separator)
+                f.write(dump(self._to_jsonable(obj), compact, ensure_ascii))
+                count += 1
+            f.write(b"]" if binary else "]")
+        return count
 
 
 class CSVModelFormatter(DictModelFormatter):
+    """
+    Loads models from a CSV file and dumps them to a CSV string.
+
+    Options:
+        use_mmap: Read the file through a read-only memory map, decoding it in large
+            chunks. Defaults to doing so for files of at least 1 MiB.
+        encoding: The file encoding. Defaults to the locale encoding like ``open``.
+        dialect: A ``csv.Dialect``, or the name of a registered dialect e.g. "excel".
+            Defaults to sniffing the dialect from the start of the file.
+        has_header: Whether the first row is a header. Defaults to False when
+            ``fieldnames`` is given, and to sniffing otherwise. Files sniffed as having
+            no header are rejected.
+        fieldnames: The names of the file columns. Defaults to the header, or to the
+            model field names for files without a header.
+        columns: The file column of each field to load, as a mapping of field names
+            to column names or positions, or a list of field names. Defaults to the
+            fields whose name is a column name. Other columns are not read.
+    """
+
     format_name = "csv"
 
-    def encode(self, _type: typing.Type["BaseModel"], file: str) -> T:
-        with open(file, "r", newline="") as f:
-            sample = f.read(_BLOCK_SIZE)
+    def _use_mmap(self, file: str) -> bool:
+        use_mmap = self.config.get("use_mmap")
+        size = os.path.getsize(file)
+        if size == 0:
+            # empty files cannot be memory mapped
+            return False
+        if use_mmap is None:
+            return size >= _MMAP_THRESHOLD
+        return use_mmap
+
+    def _sniff(self, sample: str, file: str) -> typing.Tuple[typing.Any, bool]:
+        dialect = self.config.get("dialect")
+        if isinstance(dialect, str):
+            dialect = csv.get_dialect(dialect)
+        elif dialect is None:
             dialect = csv.Sniffer().sniff(sample)
-            has_header = csv.Sniffer().has_header(sample)
-            f.seek(0)
-            if not has_header:
+
+        has_header = self.config.get("has_header")
+        if has_header is None:
+            if self.config.get("fieldnames"):
+                has_header = False
+            elif not csv.Sniffer().has_header(sample):
                 raise FileExistsError(f"File {file} does not have header")
-            reader = csv.DictReader(f, dialect=dialect)
-            return [super().encode(_type, row) for row in reader]
+            else:
+                has_header = True
+        return dialect, has_header
+
+    @contextlib.contextmanager
+    def _open_lines(
+        self, file: str
+    ) -> typing.Iterator[typing.Tuple[str, typing.Iterable[str]]]:
+        """Yield a sample of the file for sniffing and an iterator over its lines."""
+        encoding = self.config.get("encoding") or locale.getpreferredencoding(False)
+
+        if self._use_mmap(file):
+            with open(file, "rb") as f, mmap.mmap(
+                f.fileno(), 0, access=mmap.ACCESS_READ
+            ) as mm:
+                decoder = codecs.getincrementaldecoder(encoding)()
+                yield decoder.decode(mm[:_BLOCK_SIZE]), iter_mmap_lines(mm, encoding)
+            return
+
+        with open(file, "r", newline="", encoding=encoding) as f:
+            sample = f.read(_BLOCK_SIZE)
+            f.seek(0)
+            yield sample, f
+
+    def _get_projection(
+        self, _type: typing.Type["BaseModel"], fieldnames: typing.Sequence[str]
+    ) -> typing.List[typing.Tuple[str, int]]:
+        """Return the (field name, column position) pairs of the fields to load."""
+        columns = self.config.get("columns")
+        field_names = _type._get_field_names()
+        if columns is None:
+            mapping = {name: name for name in field_names}
+        elif isinstance(columns, dict):
+            mapping = dict(columns)
+        else:
+            mapping = {name: name for name in columns}
+
+        # the last of duplicate column names wins, as with csv.DictReader
+        positions = {name: index for index, name in enumerate(fieldnames)}
+        projection = []
+        for name, column in mapping.items():
+            if columns is not None and name not in field_names:
+                raise ValueError(f"{name!r} is not a field of {_type.__name__}")
+            if isinstance(column, int):
+                projection.append((name, column))
+            elif column in positions:
+                projection.append((name, positions[column]))
+            elif columns is not None:
+                raise ValueError(f"Column {column!r} of field {name!r} not found")
+        return projection
+
+    def _read_rows(
+        self, _type: typing.Type["BaseModel"], file: str
+    ) -> typing.Iterator[typing.Dict[str, str]]:
+        with self._open_lines(file) as (sample, lines):
+            dialect, has_header = self._sniff(sample, file)
+            reader = csv.reader(lines, dialect=dialect)
+
+            header = next(reader, None) if has_header else None
+            if has_header and header is None:
+                return
+            fieldnames = self.config.get("fieldnames") or header
+            projection = self._get_projection(
+                _type, fieldnames or _type._get_field_names()
+            )
+            size = max((index for _, index in projection), default=-1) + 1
+
+            for row in reader:
+                if not row:
+                    continue
+                if len(row) >= size:
+                    yield {name: row[index] for name, index in projection}
+                else:
+                    # missing values of short rows are None, as with csv.DictReader
+                    yield {
+                        name: row[index] if index < len(row) else None
+                        for name, index in projection
+                    }
+
+    def encode(self, _type: typing.Type["BaseModel"], file: str) -> T:
+        return list(self.iter_encode(_type, file))
+
+    def iter_encode(
+        self, _type: typing.Type["BaseModel"], file: str
+    ) -> typing.Iterator["BaseModel"]:
+        for row in self._read_rows(_type, file):
+            yield self._encode(_type, row)
 
     def decode(self, instance: T) -> str:
         instances = instance if isinstance(instance, (list, tuple)) else [instance]
         with StringIO() as f:
-            writer = csv.DictWriter(f, dialect=csv.excel, fieldnames=[])
-            for index, obj in enumerate(instances):
-                instance_dict = super().decode(obj)
-                if index == 0:
-                    writer.fieldnames = list(instance_dict.keys())
-                    writer.writeheader()
-                writer.writerow(instance_dict)
-
+            self._write_rows(f, instances)
             context = f.getvalue()
 
         return context
+
+    def decode_to(
+        self,
+        sink: typing.Any,
+        instances: typing.Iterable["BaseModel"],
+        model: typing.Optional[typing.Type["BaseModel"]] = None,
+    ) -> int:
+        """
+        Write the instances to a path or file object row by row.
+
+        ``instances`` may be a generator; only one instance is held at a time. With a
+        model, the header is written from its fields even when there are no instances.
+        """
+        with open_sink(sink, encoding=self.config.get("encoding")) as f:
+            return self._write_rows(f, check_instances(model, instances), model)
+
+    def _write_rows(
+        self,
+        f: typing.IO,
+        instances: typing.Iterable["BaseModel"],
+        model: typing.Optional[typing.Type["BaseModel"]] = None,
+    ) -> int:
+        writer = csv.writer(f, dialect=csv.excel)
+        extract = self._write_header(writer, model) if model is not None else None
+        count = 0
+        for obj in instances:
+            if extract is None:
+                # without a model, the header comes from the model of the first instance
+                extract = self._write_header(writer, type(obj))
+            writer.writerow(extract(obj))
+            count += 1
+        return count
+
+    def _write_header(
+        self, writer: typing.Any, model: typing.Type["BaseModel"]
+    ) -> typing.Callable[["BaseModel"], typing.List[typing.Any]]:
+        """Write the header of the model and return the extractor of its rows."""
+        plan = self._projection_plan(model)
+        writer.writerow(model._get_field_names() if plan is None else plan.names)
+        return get_row_extractor(model, plan)
+
+
+class BinaryModelFormatter(BaseModelFormatter):
+    """
+    Compact binary format for services that share the model schema.
+
+    Fields are written in declaration order with ``struct`` packed numbers,
+    length-prefixed strings and nested models inline. Every payload starts with
+    a fingerprint of the model schema and loading fails if it does not match.
+
+    Loaded values are not validated again because they were written from valid
+    instances of the same schema. Pass ``validate=True`` to ``loads`` to run the
+    model validation anyway.
+    """
+
+    format_name = "binary"
+
+    def encode(
+        self, _type: typing.Type["BaseModel"], obj: typing.Union[bytes, bytearray]
+    ) -> T:
+        return binary.loads(_type, obj, validate=self.config.get("validate", False))
+
+    def iter_encode(
+        self, _type: typing.Type["BaseModel"], obj: typing.Union[bytes, bytearray]
+    ) -> typing.Iterator["BaseModel"]:
+        return binary.iter_loads(
+            _type, obj, validate=self.config.get("validate", False)
+        )
+
+    def decode(self, instance: T) -> bytes:
+        return binary.dumps(instance)
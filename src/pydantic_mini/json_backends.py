@@ -0,0 +1,266 @@
+import re
+import json
+import typing
+import importlib
+from json.encoder import encode_basestring_ascii
+
+__all__ = (
+    "JSONBackend",
+    "StdlibJSONBackend",
+    "register_json_backend",
+    "get_json_backend",
+    "set_default_json_backend",
+    "available_json_backends",
+)
+
+JSONText = typing.Union[str, bytes, bytearray, memoryview]
+
+
+class JSONBackend:
+    """
+    Interface of the JSON libraries used by the json formatter.
+
+    Backends must load ``str``, ``bytes``, ``bytearray`` and ``memoryview`` documents,
+    copying buffers at most once, and dump the objects produced by the model encoders,
+    i.e. dicts with str keys, lists, str, int, float, bool and None.
+
+    Loads must accept the documents that the standard library accepts and raise
+    ``json.JSONDecodeError`` for the others. Dumps must match ``dumps`` of the standard
+    library backend: ``compact`` leaves out the spaces after separators, and
+    ``ensure_ascii`` writes non-ASCII characters as ``\\uXXXX`` escapes. Backends may
+    hand the documents their library rejects to the standard library.
+    """
+
+    name: str = None
+
+    def loads(self, data: JSONText) -> typing.Any:
+        raise NotImplementedError
+
+    def dumps(
+        self, obj: typing.Any, compact: bool = False, ensure_ascii: bool = True
+    ) -> str:
+        raise NotImplementedError
+
+    def dumpb(
+        self, obj: typing.Any, compact: bool = False, ensure_ascii: bool = True
+    ) -> bytes:
+        """Dump to UTF-8 encoded bytes."""
+        return self.dumps(obj, compact, ensure_ascii).encode("utf-8")
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.name!r}>"
+
+
+def _stdlib_loads(data: JSONText) -> typing.Any:
+    if isinstance(data, memoryview):
+        # decode the buffer directly instead of copying it to bytes first
+        encoding = json.detect_encoding(data[:4].tobytes())
+        data = str(data, encoding, "surrogatepass")
+    return json.loads(data)
+
+
+def _stdlib_dumps(
+    obj: typing.Any, compact: bool = False, ensure_ascii: bool = True
+) -> str:
+    return json.dumps(
+        obj, ensure_ascii=ensure_ascii, separators=(",", ":") if compact else None
+    )
+
+
+# DEL and the characters outside ASCII, which ensure_ascii escapes
+_NON_ASCII = re.compile(r"[^\x00-\x7e]+")
+
+
+def _escape_non_ascii(text: str) -> str:
+    """Escape the non-ASCII characters of a JSON document like ``ensure_ascii``."""
+    if text.isascii() and "\x7f" not in text:
+        return text
+    # outside strings JSON documents are ASCII, so only string characters match
+    return _NON_ASCII.sub(
+        lambda match: encode_basestring_ascii(match.group())[1:-1], text
+    )
+
+
+class StdlibJSONBackend(JSONBackend):
+    name = "json"
+
+    def loads(self, data: JSONText) -> typing.Any:
+        return _stdlib_loads(data)
+
+    def dumps(
+        self, obj: typing.Any, compact: bool = False, ensure_ascii: bool = True
+    ) -> str:
+        return _stdlib_dumps(obj, compact, ensure_ascii)
+
+
+class OrjsonBackend(JSONBackend):
+    """
+    orjson parses buffers without copying them. It only writes compact JSON, so
+    dumps that are not compact use the standard library. Documents that orjson
+    rejects, e.g. with ``NaN`` or integers outside 64 bits, also use the standard
+    library.
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        self._orjson = importlib.import_module("orjson")
+
+    def loads(self, data: JSONText) -> typing.Any:
+        try:
+            return self._orjson.loads(data)
+        except self._orjson.JSONDecodeError:
+            return _stdlib_loads(data)
+
+    def dumps(
+        self, obj: typing.Any, compact: bool = False, ensure_ascii: bool = True
+    ) -> str:
+        if not compact:
+            return _stdlib_dumps(obj, compact, ensure_ascii)
+        try:
+            dumped = self._orjson.dumps(
+                obj, option=self._orjson.OPT_NON_STR_KEYS
+            ).decode("utf-8")
+        except self._orjson.JSONEncodeError:
+            return _stdlib_dumps(obj, compact, ensure_ascii)
+        return _escape_non_ascii(dumped) if ensure_ascii else dumped
+
+    def dumpb(
+        self, obj: typing.Any, compact: bool = False, ensure_ascii: bool = True
+    ) -> bytes:
+        if not compact or ensure_ascii:
+            return self.dumps(obj, compact, ensure_ascii).encode("utf-8")
+        try:
+            return self._orjson.dumps(obj, option=self._orjson.OPT_NON_STR_KEYS)
+        except self._orjson.JSONEncodeError:
+            return _stdlib_dumps(obj, compact, ensure_ascii).encode("utf-8")
+
+
+class UjsonBackend(JSONBackend):
+    """
+    ujson only writes compact JSON, so dumps that are not compact use the standard
+    library. Documents that ujson rejects also use the standard library.
+    """
+
+    name = "ujson"
+
+    def __init__(self):
+        self._ujson = importlib.import_module("ujson")
+
+    def loads(self, data: JSONText) -> typing.Any:
+        try:
+            return self._ujson.loads(
+                bytes(data) if isinstance(data, (bytearray, memoryview)) else data
+            )
+        except ValueError:
+            return _stdlib_loads(data)
+
+    def dumps(
+        self, obj: typing.Any, compact: bool = False, ensure_ascii: bool = True
+    ) -> str:
+        if not compact:
+            return _stdlib_dumps(obj, compact, ensure_ascii)
+        try:
+            dumped = self._ujson.dumps(
+                obj, ensure_ascii=False, escape_forward_slashes=False
+            )
+        except (OverflowError, TypeError, ValueError):
+            return _stdlib_dumps(obj, compact, ensure_ascii)
+        return _escape_non_ascii(dumped) if ensure_ascii else dumped
+
+
+class SimdjsonBackend(JSONBackend):
+    """
+    pysimdjson only parses JSON; dumping uses the standard library. Documents that
+    simdjson rejects are parsed by the standard library.
+    """
+
+    name = "simdjson"
+
+    def __init__(self):
+        self._simdjson = importlib.import_module("simdjson")
+
+    def loads(self, data: JSONText) -> typing.Any:
+        try:
+            return self._simdjson.loads(
+                bytes(data) if isinstance(data, (bytearray, memoryview)) else data
+            )
+        except ValueError:
+            return _stdlib_loads(data)
+
+    def dumps(
+        self, obj: typing.Any, compact: bool = False, ensure_ascii: bool = True
+    ) -> str:
+        return _stdlib_dumps(obj, compact, ensure_ascii)
+
+
+_BACKEND_FACTORIES: typing.Dict[str, typing.Callable[[], JSONBackend]] = {}
+
+_BACKENDS: typing.Dict[str, JSONBackend] = {}
+
+_default_backend = "json"
+
+
+def register_json_backend(name: str, factory: typing.Callable[[], JSONBackend]) -> None:
+    """
+    Register a JSON backend under a name.
+
+    Args:
+        name: The name used to select the backend.
+        factory: A callable returning the backend, e.g. the backend class. It is
+            called when the backend is first used and may raise ImportError.
+    """
+    _BACKEND_FACTORIES[name] = factory
+    _BACKENDS.pop(name, None)
+
+
+def get_json_backend(name: typing.Optional[str] = None) -> JSONBackend:
+    """
+    Return the backend registered under the name, or the default backend.
+
+    Raises:
+        ValueError: If no backend is registered under the name.
+        ImportError: If the library of the backend is not installed.
+    """
+    name = name or _default_backend
+    try:
+        return _BACKENDS[name]
+    except KeyError:
+        pass
+
+    try:
+        factory = _BACKEND_FACTORIES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown JSON backend {name!r}. "
+            f"Registered backends: {', '.join(sorted(_BACKEND_FACTORIES))}"
+        ) from None
+
+    backend = _BACKENDS[name] = factory()
+    return backend
+
+
+def set_default_json_backend(name: str) -> None:
+    """Use the backend registered under the name when none is configured."""
+    global _default_backend
+
+    get_json_backend(name)
+    _default_backend = name
+
+
+def available_json_backends() -> typing.List[str]:
+    """Return the names of the registered backends whose library can be imported."""
+    names = []
+    for name in _BACKEND_FACTORIES:
+        try:
+            get_json_backend(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+register_json_backend(StdlibJSONBackend.name, StdlibJSONBackend)
+register_json_backend(OrjsonBackend.name, OrjsonBackend)
+register_json_backend(UjsonBackend.name, UjsonBackend)
+register_json_backend(SimdjsonBackend.name, SimdjsonBackend)
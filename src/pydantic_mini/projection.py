@@ -0,0 +1,289 @@
+import typing
+import operator
+import threading
+from collections import OrderedDict
+from dataclasses import is_dataclass
+
+from .base import LOAD_PROJECTION
+from .checkers import MAPPING, UNION_ORIGINS, get_collection_shape
+from .typing import NoneType, get_args, get_origin, is_mini_annotated
+
+if typing.TYPE_CHECKING:
+    from .base import BaseModel
+
+__all__ = (
+    "LOAD_PROJECTION",
+    "ProjectionSpec",
+    "ProjectionPlan",
+    "get_projection_plan",
+    "select_fields",
+    "map_models",
+)
+
+# Fields to select, as names or dotted paths e.g. ["id", "author.name"], or as a
+# mapping of names to True or to the spec of the nested model e.g. {"author": {"name"}}
+ProjectionSpec = typing.Union[
+    str, typing.Iterable[str], typing.Mapping[str, typing.Any]
+]
+
+# A parsed spec: field names mapped to the parsed spec of their nested model, or to
+# None when the whole field is selected
+_Tree = typing.Dict[str, typing.Optional["_Tree"]]
+
+# Plans by model and parsed specs, and by model and specs as passed when hashable
+_PLANS: typing.Dict[typing.Any, "ProjectionPlan"] = {}
+_SPEC_PLANS: typing.Dict[typing.Any, "ProjectionPlan"] = {}
+# Plans narrowed to some field names, by model, plan and names. Each set of names
+# makes a new plan, so only the most recently used ones are kept.
+_SELECTIONS: "OrderedDict[typing.Any, ProjectionPlan]" = OrderedDict()
+_SELECTIONS_MAXSIZE = 256
+_PLANS_LOCK = threading.Lock()
+
+_SEQUENCE_VALUES = (list, tuple)
+
+
+class ProjectionPlan:
+    """
+    The fields of a model selected by include and exclude specs.
+
+    Attributes:
+        model: The model class.
+        names: The selected field names, in field order.
+        selected: The selected field names as a frozenset.
+        children: The plans of selected fields holding models of which only some
+            fields are selected, by field name.
+        getter: Returns the values of the selected fields of an instance as a tuple.
+        json_converter: The JSON converter compiled for the plan, set on first use,
+            so that it is released with the plan.
+    """
+
+    __slots__ = ("model", "names", "selected", "children", "getter", "json_converter")
+
+    def __init__(
+        self,
+        model: typing.Type["BaseModel"],
+        names: typing.Tuple[str, ...],
+        children: typing.Dict[str, "ProjectionPlan"],
+    ):
+        self.model = model
+        self.names = names
+        self.selected = frozenset(names)
+        self.children = children
+        if len(names) == 1:
+            getter = operator.attrgetter(names[0])
+            self.getter = lambda instance: (getter(instance),)
+        elif names:
+            self.getter = operator.attrgetter(*names)
+        else:
+            self.getter = lambda instance: ()
+        self.json_converter = None
+
+    def __repr__(self):
+        return f"<ProjectionPlan {self.model.__name__} {self.names!r}>"
+
+
+def get_projection_plan(
+    model: typing.Type["BaseModel"],
+    include: typing.Optional[ProjectionSpec] = None,
+    exclude: typing.Optional[ProjectionSpec] = None,
+) -> typing.Optional[ProjectionPlan]:
+    """
+    Return the plan of the fields of a model selected by the include and exclude specs.
+
+    Plans are compiled once per model and specs, and looked up from a cache afterwards.
+    Paths of fields holding a model, or a list, tuple or dict of models, select fields
+    of the nested model.
+
+    Returns:
+        None if neither spec is given.
+
+    Raises:
+        ValueError: If a spec names a field the model does not have, or a nested
+            field of a field that does not hold a model.
+    """
+    if include is None and exclude is None:
+        return None
+
+    raw_key = (model, include, exclude)
+    try:
+        return _SPEC_PLANS[raw_key]
+    except (KeyError, TypeError):
+        pass
+
+    plan = _get_plan(model, _parse(include), _parse(exclude))
+    try:
+        _SPEC_PLANS[raw_key] = plan
+    except TypeError:
+        # unhashable specs, e.g. lists, are looked up by their parsed form
+        pass
+    return plan
+
+
+def select_fields(
+    model: typing.Type["BaseModel"],
+    plan: typing.Optional[ProjectionPlan],
+    names: typing.FrozenSet[str],
+) -> ProjectionPlan:
+    """
+    Return the plan of the fields of a model that are both selected by the plan, or
+    by no plan, and in ``names``, e.g. the changed fields of an instance.
+    """
+    key = (model, plan, names)
+    with _PLANS_LOCK:
+        try:
+            _SELECTIONS.move_to_end(key)
+            return _SELECTIONS[key]
+        except KeyError:
+            pass
+
+    if plan is None:
+        selected = tuple(name for name in model._get_field_names() if name in names)
+        children = {}
+    else:
+        selected = tuple(name for name in plan.names if name in names)
+        children = {
+            name: child for name, child in plan.children.items() if name in names
+        }
+    narrowed = ProjectionPlan(model, selected, children)
+    with _PLANS_LOCK:
+        narrowed = _SELECTIONS.setdefault(key, narrowed)
+        while len(_SELECTIONS) > _SELECTIONS_MAXSIZE:
+            _SELECTIONS.popitem(last=False)
+    return narrowed
+
+
+def _parse(spec: typing.Optional[ProjectionSpec]) -> typing.Optional[_Tree]:
+    if spec is None:
+        return None
+    if isinstance(spec, str):
+        spec = (spec,)
+
+    tree: _Tree = {}
+    if isinstance(spec, typing.Mapping):
+        for name, value in spec.items():
+            if value is True or value is Ellipsis:
+                tree[name] = None
+            elif value is not False:
+                tree[name] = _parse(value)
+        return tree
+
+    for path in spec:
+        node = tree
+        *parents, name = path.split(".")
+        for parent in parents:
+            if parent in node and node[parent] is None:
+                # the whole parent is selected already
+                break
+            node = node.setdefault(parent, {})
+        else:
+            node[name] = None
+    return tree
+
+
+def _freeze(tree: typing.Optional[_Tree]) -> typing.Any:
+    if tree is None:
+        return None
+    return frozenset((name, _freeze(child)) for name, child in tree.items())
+
+
+def _get_plan(
+    model: typing.Type["BaseModel"],
+    include: typing.Optional[_Tree],
+    exclude: typing.Optional[_Tree],
+) -> ProjectionPlan:
+    key = (model, _freeze(include), _freeze(exclude))
+    try:
+        return _PLANS[key]
+    except KeyError:
+        pass
+
+    plan = _compile(model, include, exclude)
+    with _PLANS_LOCK:
+        return _PLANS.setdefault(key, plan)
+
+
+def _compile(
+    model: typing.Type["BaseModel"],
+    include: typing.Optional[_Tree],
+    exclude: typing.Optional[_Tree],
+) -> ProjectionPlan:
+    field_names = model._get_field_names()
+    for tree in (include, exclude):
+        for name in tree or ():
+            if name not in field_names:
+                raise ValueError(f"{name!r} is not a field of {model.__name__}")
+
+    names = []
+    children = {}
+    for name in field_names:
+        nested_include = nested_exclude = None
+        if include is not None:
+            if name not in include:
+                continue
+            nested_include = include[name]
+        if exclude is not None and name in exclude:
+            nested_exclude = exclude[name]
+            if nested_exclude is None:
+                continue
+
+        names.append(name)
+        if nested_include is not None or nested_exclude is not None:
+            children[name] = _get_plan(
+                _get_field_model(model, name), nested_include, nested_exclude
+            )
+    return ProjectionPlan(model, tuple(names), children)
+
+
+def _find_model(annotation: typing.Any) -> typing.Optional[type]:
+    if is_mini_annotated(annotation):
+        annotation = get_args(annotation)[0]
+
+    if isinstance(annotation, type) and get_origin(annotation) is None:
+        if is_dataclass(annotation) and hasattr(annotation, "_get_field_names"):
+            return annotation
+        return None
+
+    if get_origin(annotation) in UNION_ORIGINS:
+        members = [arg for arg in get_args(annotation) if arg is not NoneType]
+        return _find_model(members[0]) if len(members) == 1 else None
+
+    shape = get_collection_shape(annotation)
+    if shape is None:
+        return None
+    _, kind, args = shape
+    return _find_model(args[1] if kind == MAPPING else args[0])
+
+
+def _get_field_model(model: typing.Type["BaseModel"], name: str) -> type:
+    annotation = model._get_resolved_type_hints().get(
+        name, model.__dataclass_fields__[name].type
+    )
+    nested = _find_model(annotation)
+    if nested is None:
+        raise ValueError(
+            f"Field {name!r} of {model.__name__} does not hold a model, "
+            f"so its fields cannot be selected"
+        )
+    return nested
+
+
+def map_models(
+    value: typing.Any,
+    project: typing.Callable[[typing.Any], typing.Any],
+    default: typing.Callable[[typing.Any], typing.Any],
+) -> typing.Any:
+    """
+    Apply ``project`` to the model instances of a field value, i.e. the value itself,
+    the items of a list or tuple or the values of a dict, and ``default`` to the
+    values that are not instances.
+    """
+    if is_dataclass(value) and not isinstance(value, type):
+        return project(value)
+    if isinstance(value, _SEQUENCE_VALUES):
+        items = [map_models(item, project, default) for item in value]
+        if hasattr(value, "_fields"):
+            return type(value)(*items)
+        return items if value.__class__ is list else type(value)(items)
+    if isinstance(value, dict):
+        return {key: map_models(item, project, default) for key, item in value.items()}
+    return default(value)
@@ -0,0 +1,397 @@
+import typing
+import threading
+from dataclasses import is_dataclass
+
+from .checkers import MAPPING, SEQUENCE, UNION_ORIGINS, get_collection_shape
+from .exceptions import ValidationError
+from .typing import NoneType, get_args, get_origin, is_mini_annotated
+from .utils import init_class
+
+if typing.TYPE_CHECKING:
+    from .base import BaseModel
+
+__all__ = (
+    "NestedField",
+    "get_nested_fields",
+    "is_recursive_model",
+    "build_model",
+    "dump_model",
+    "REFERENCES_COPY",
+    "REFERENCES_REUSE",
+    "REFERENCES_REF",
+)
+
+# Kind of a nested field holding a single model
+MODEL = "model"
+
+# A field holding models: its name, its kind (MODEL, SEQUENCE or MAPPING), the model,
+# and whether dicts assigned to it are converted to instances of the model
+NestedField = typing.Tuple[str, str, type, bool]
+
+_NESTED_FIELDS: typing.Dict[type, typing.Tuple[NestedField, ...]] = {}
+_RECURSIVE_MODELS: typing.Dict[type, bool] = {}
+_LOCK = threading.Lock()
+
+_ENTER = 0
+_EXIT = 1
+
+
+def _is_model(annotation: typing.Any) -> bool:
+    return (
+        isinstance(annotation, type)
+        and is_dataclass(annotation)
+        and hasattr(annotation, "_get_field_names")
+    )
+
+
+def _get_nested(annotation: typing.Any) -> typing.Optional[typing.Tuple[str, type]]:
+    if get_origin(annotation) in UNION_ORIGINS:
+        members = [arg for arg in get_args(annotation) if arg is not NoneType]
+        if len(members) != 1:
+            return None
+        annotation = members[0]
+
+    if _is_model(annotation):
+        return MODEL, annotation
+
+    shape = get_collection_shape(annotation)
+    if shape is None:
+        return None
+    origin, kind, args = shape
+    if kind == MAPPING:
+        return (MAPPING, args[1]) if _is_model(args[1]) else None
+    if kind == SEQUENCE and issubclass(origin, (list, tuple)) and _is_model(args[0]):
+        return SEQUENCE, args[0]
+    return None
+
+
+def get_nested_fields(
+    model: typing.Type["BaseModel"],
+) -> typing.Tuple[NestedField, ...]:
+    """
+    Return the fields of a model holding a model, an optional model, or a list,
+    tuple or dict of models.
+
+    Dicts are not converted to instances for fields with a pre-formatter or a
+    discriminator, nor for the fields of models that do not convert values, e.g. in
+    strict mode.
+    """
+    try:
+        return _NESTED_FIELDS[model]
+    except KeyError:
+        pass
+
+    from .base import PYDANTIC_MINI_EXTRA_MODEL_CONFIG
+
+    config = getattr(model, PYDANTIC_MINI_EXTRA_MODEL_CONFIG, {})
+    converts = not (
+        config.get("strict_mode")
+        or config.get("disable_typecheck")
+        or config.get("disable_all_validation")
+    )
+    hints = model._get_resolved_type_hints()
+    nested = []
+    for name in model._get_field_names():
+        annotation = hints.get(name, model.__dataclass_fields__[name].type)
+        custom = False
+        if is_mini_annotated(annotation):
+            query = annotation.__metadata__[0]
+            custom = query.has_pre_formatter() or bool(query.discriminator)
+            annotation = get_args(annotation)[0]
+        found = _get_nested(annotation)
+        if found is not None:
+            nested.append((name, found[0], found[1], converts and not custom))
+
+    with _LOCK:
+        return _NESTED_FIELDS.setdefault(model, tuple(nested))
+
+
+def is_recursive_model(model: typing.Type["BaseModel"]) -> bool:
+    """Return True if a model reaches a model that holds itself, directly or not."""
+    try:
+        return _RECURSIVE_MODELS[model]
+    except KeyError:
+        pass
+
+    # depth-first search for a back edge among the models reachable from the model
+    recursive = False
+    visiting = {model}
+    done = set()
+    stack = [(model, iter(get_nested_fields(model)))]
+    while stack and not recursive:
+        current, fields = stack[-1]
+        for _, _, child, _ in fields:
+            if child in visiting:
+                recursive = True
+                break
+            if child not in done:
+                visiting.add(child)
+                stack.append((child, iter(get_nested_fields(child))))
+                break
+        else:
+            stack.pop()
+            visiting.discard(current)
+            done.add(current)
+
+    _RECURSIVE_MODELS[model] = recursive
+    return recursive
+
+
+def _get_max_depth(model: typing.Type["BaseModel"]) -> typing.Optional[int]:
+    from .base import PYDANTIC_MINI_EXTRA_MODEL_CONFIG
+
+    return getattr(model, PYDANTIC_MINI_EXTRA_MODEL_CONFIG, {}).get("max_depth")
+
+
+def build_model(
+    model: typing.Type["BaseModel"],
+    data: typing.Dict[str, typing.Any],
+    depth: int = 0,
+) -> "BaseModel":
+    """
+    Create an instance of a model from a dict with nested dicts, without recursion.
+
+    The nested dicts are converted to instances bottom-up with an explicit stack,
+    so that each instance is created from values that are already instances. The
+    depth is bounded by the ``max_depth`` Config option of the model, not by the
+    interpreter recursion limit.
+
+    Args:
+        model: The model class.
+        data: The field values.
+        depth: The depth of the dict, for dicts nested in an instance being created.
+
+    Raises:
+        ValidationError: If the dicts are nested deeper than ``max_depth``, or
+            hold themselves.
+    """
+    max_depth = _get_max_depth(model)
+    root: typing.List[typing.Any] = [None]
+    active = set()
+    stack = [(_ENTER, model, data, root, 0, depth)]
+
+    while stack:
+        action, cls, values, container, key, level = stack.pop()
+        if action == _EXIT:
+            # the level of an exit entry is the id of the dict it was copied from
+            active.discard(level)
+            container[key] = init_class(cls, values)
+            continue
+
+        if id(values) in active:
+            raise ValidationError(
+                f"Data for model '{cls.__name__}' contains itself.",
+                params={"model": cls},
+            )
+        if max_depth is not None and level > max_depth:
+            raise ValidationError(
+                f"Data for model '{model.__name__}' is nested deeper than "
+                f"max_depth {max_depth}.",
+                params={"model": model, "max_depth": max_depth},
+            )
+
+        original = id(values)
+        active.add(original)
+        values = dict(values)
+        stack.append((_EXIT, cls, values, container, key, original))
+        for name, kind, child, converts in get_nested_fields(cls):
+            if not converts:
+                continue
+            value = values.get(name)
+            if kind == MODEL:
+                if isinstance(value, dict):
+                    stack.append((_ENTER, child, value, values, name, level + 1))
+            elif kind == SEQUENCE:
+                if isinstance(value, (list, tuple)):
+                    items = values[name] = list(value)
+                    for index, item in enumerate(items):
+                        if isinstance(item, dict):
+                            stack.append((_ENTER, child, item, items, index, level + 1))
+            elif isinstance(value, dict):
+                items = values[name] = dict(value)
+                for item_key, item in items.items():
+                    if isinstance(item, dict):
+                        stack.append((_ENTER, child, item, items, item_key, level + 1))
+    return root[0]
+
+
+# Ways of dumping instances that appear more than once in the values of an instance
+REFERENCES_COPY = "copy"
+REFERENCES_REUSE = "reuse"
+REFERENCES_REF = "ref"
+
+_REFERENCE_MODES = (REFERENCES_COPY, REFERENCES_REUSE, REFERENCES_REF)
+
+# Location of a nested instance: the location of its parent, the field name, index or
+# key, and whether it is a field name
+_Link = typing.Optional[typing.Tuple[typing.Any, typing.Any, bool]]
+
+
+def _tokens(link: _Link) -> typing.List[typing.Tuple[typing.Any, bool]]:
+    tokens = []
+    while link is not None:
+        link, token, is_field = link
+        tokens.append((token, is_field))
+    tokens.reverse()
+    return tokens
+
+
+def _describe_location(link: _Link) -> str:
+    path = "".join(
+        f".{token}" if is_field else f"[{token!r}]" for token, is_field in _tokens(link)
+    )
+    return "the root" if not path else path[1:] if path[0] == "." else path
+
+
+def _json_pointer(link: _Link) -> str:
+    """Return the JSON Pointer (RFC 6901) of a location, relative to the document."""
+    return "#" + "".join(
+        "/" + str(token).replace("~", "~0").replace("/", "~1")
+        for token, _ in _tokens(link)
+    )
+
+
+def dump_model(
+    instance: "BaseModel",
+    get_converters: typing.Callable[
+        [type], typing.Dict[str, typing.Callable[[typing.Any], typing.Any]]
+    ],
+    convert_other: typing.Callable[[typing.Any], typing.Any],
+    convert_key: typing.Callable[[typing.Any], typing.Any],
+    keep_tuples: bool = True,
+    references: typing.Optional[str] = None,
+) -> typing.Dict[str, typing.Any]:
+    """
+    Convert an instance with nested instances to a dict, without recursion.
+
+    Args:
+        instance: The instance to convert.
+        get_converters: Returns the converters of the fields of a model by name.
+            Nested instances in the fields returned by ``get_nested_fields`` are
+            converted by this function instead.
+        convert_other: Converts values of nested fields that are not instances.
+        convert_key: Converts the keys of dicts of instances.
+        keep_tuples: Convert tuples of instances to tuples rather than lists.
+        references: How nested instances seen before are dumped. "copy", the
+            default, converts them again. "reuse" converts each instance once and
+            reuses its dict. "ref" dumps them as ``{"$ref": pointer}``, where the
+            pointer is the JSON Pointer of their first dump, and allows cycles.
+
+    Raises:
+        ValueError: If the instances are nested deeper than the ``max_depth`` of the
+            model of the instance, or an instance holds itself, except with "ref".
+    """
+    references = references or REFERENCES_COPY
+    if references not in _REFERENCE_MODES:
+        raise ValueError(
+            f"references must be one of {', '.join(map(repr, _REFERENCE_MODES))}, "
+            f"not {references!r}"
+        )
+    memoise = references != REFERENCES_COPY
+
+    model = type(instance)
+    max_depth = _get_max_depth(model)
+    root: typing.List[typing.Any] = [None]
+    # instances being dumped, i.e. the ancestors of the current instance
+    active: typing.Dict[int, _Link] = {}
+    # instances dumped already, with their dicts and locations
+    seen: typing.Dict[int, typing.Tuple[typing.Dict[str, typing.Any], _Link]] = {}
+    tuples = []
+    stack = [(_ENTER, instance, root, 0, 0, None)]
+
+    while stack:
+        action, obj, container, key, level, link = stack.pop()
+        if action == _EXIT:
+            del active[id(obj)]
+            continue
+
+        ident = id(obj)
+        if ident in active and references != REFERENCES_REF:
+            raise ValueError(
+                f"Instance of '{type(obj).__name__}' at {_describe_location(link)} "
+                f"is the instance at {_describe_location(active[ident])}, which holds "
+                f"itself. Dump it with references='ref' to write cycles as references."
+            )
+        if memoise and ident in seen:
+            result, first = seen[ident]
+            container[key] = (
+                result
+                if references == REFERENCES_REUSE
+                else {"$ref": _json_pointer(first)}
+            )
+            continue
+        if max_depth is not None and level > max_depth:
+            raise ValueError(
+                f"Instance of '{model.__name__}' is nested deeper than "
+                f"max_depth {max_depth}."
+            )
+
+        active[ident] = link
+        stack.append((_EXIT, obj, None, None, level, None))
+        cls = type(obj)
+        nested = {name: kind for name, kind, _, _ in get_nested_fields(cls)}
+        result = container[key] = {}
+        # nested instances are pushed in reverse, so they are dumped in order
+        pending = []
+        if memoise:
+            seen[ident] = result, link
+        for name, convert in get_converters(cls).items():
+            value = getattr(obj, name)
+            kind = nested.get(name)
+            if kind is None:
+                result[name] = convert(value)
+            elif kind == MODEL:
+                if _is_model(type(value)):
+                    result[name] = None
+                    pending.append(
+                        (_ENTER, value, result, name, level + 1, (link, name, True))
+                    )
+                else:
+                    result[name] = convert_other(value)
+            elif kind == SEQUENCE and isinstance(value, (list, tuple)):
+                items = result[name] = []
+                field_link = (link, name, True)
+                for index, item in enumerate(value):
+                    items.append(None)
+                    if _is_model(type(item)):
+                        pending.append(
+                            (
+                                _ENTER,
+                                item,
+                                items,
+                                index,
+                                level + 1,
+                                (field_link, index, False),
+                            )
+                        )
+                    else:
+                        items[index] = convert_other(item)
+                if keep_tuples and isinstance(value, tuple):
+                    tuples.append((result, name))
+            elif kind == MAPPING and isinstance(value, dict):
+                items = result[name] = {}
+                field_link = (link, name, True)
+                for item_key, item in value.items():
+                    item_key = convert_key(item_key)
+                    items[item_key] = None
+                    if _is_model(type(item)):
+                        pending.append(
+                            (
+                                _ENTER,
+                                item,
+                                items,
+                                item_key,
+                                level + 1,
+                                (field_link, item_key, False),
+                            )
+                        )
+                    else:
+                        items[item_key] = convert_other(item)
+            else:
+                result[name] = convert_other(value)
+        stack.extend(reversed(pending))
+
+    # tuples are built once their items are converted
+    for result, name in tuples:
+        result[name] = tuple(result[name])
+    return root[0]
@@ -0,0 +1,315 @@
+import io
+import os
+import re
+import sys
+import enum
+import types
+import typing
+import threading
+from collections import namedtuple
+from dataclasses import MISSING
+
+from .typing import Attrib, ForwardRef, NoneType, get_args, get_origin
+
+__all__ = (
+    "SchemaCacheInfo",
+    "set_schema_cache_dir",
+    "get_schema_cache_dir",
+    "schema_cache_info",
+    "clear_schema_cache",
+    "schema_key",
+    "load_model_fields",
+    "store_model_fields",
+)
+
+SchemaCacheInfo = namedtuple("SchemaCacheInfo", ["hits", "misses", "stores"])
+
+# Directory of the cache. Set it in the environment to enable the cache without
+# changing code, e.g. for command line tools.
+CACHE_DIR_ENV = "PYDANTIC_MINI_SCHEMA_CACHE_DIR"
+
+# Bump when the layout of cache entries changes
+_FORMAT_VERSION = 1
+
+_SUFFIX = ".schema"
+
+_cache_dir: typing.Optional[str] = (
+    os.path.expanduser(os.environ[CACHE_DIR_ENV])
+    if os.environ.get(CACHE_DIR_ENV)
+    else None
+)
+_library_stamp: typing.Optional[str] = None
+_counts = {"hits": 0, "misses": 0, "stores": 0}
+_counts_lock = threading.Lock()
+
+_ADDRESS = re.compile(r" at 0x[0-9a-fA-F]+")
+_NAMES = re.compile(r"[A-Za-z_][\w.]*")
+
+_SCALARS = (type(None), bool, int, float, complex, str, bytes)
+_CONTAINERS = (tuple, list, frozenset, set)
+
+_GLOBAL_DESCRIPTIONS: typing.Dict[int, typing.Tuple[typing.Any, str]] = {}
+
+_SPECIAL_FORMS = (typing.Any, typing.Union, typing.Optional, typing.Literal)
+
+
+def set_schema_cache_dir(path: typing.Optional[typing.Union[str, os.PathLike]]) -> None:
+    """
+    Enable the on-disk cache of model fields in a directory, or disable it with None.
+
+    Models defined afterwards read their prepared fields from the cache instead of
+    resolving their annotations, so call this before importing the modules that
+    define them.
+    """
+    global _cache_dir
+    _cache_dir = os.path.expanduser(os.fspath(path)) if path is not None else None
+
+
+def get_schema_cache_dir() -> typing.Optional[str]:
+    return _cache_dir
+
+
+def schema_cache_info() -> SchemaCacheInfo:
+    with _counts_lock:
+        return SchemaCacheInfo(_counts["hits"], _counts["misses"], _counts["stores"])
+
+
+def clear_schema_cache() -> None:
+    """Remove the entries of the cache directory and reset the counts."""
+    with _counts_lock:
+        for name in _counts:
+            _counts[name] = 0
+    if _cache_dir is None or not os.path.isdir(_cache_dir):
+        return
+    for name in os.listdir(_cache_dir):
+        if name.endswith(_SUFFIX):
+            try:
+                os.remove(os.path.join(_cache_dir, name))
+            except OSError:
+                pass
+
+
+def _count(name: str) -> None:
+    with _counts_lock:
+        _counts[name] += 1
+
+
+def _stat(path: str) -> typing.Optional[str]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return f"{path}:{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def _get_library_stamp() -> str:
+    global _library_stamp
+    if _library_stamp is None:
+        package = os.path.dirname(os.path.abspath(__file__))
+        _library_stamp = "|".join(
+            str(_stat(os.path.join(package, name)))
+            for name in ("base.py", "typing.py", "schema_cache.py")
+        )
+    return _library_stamp
+
+
+def _describe(obj: typing.Any) -> str:
+    """Describe an annotation, or a value it refers to, without memory addresses."""
+    if isinstance(obj, str):
+        return repr(obj)
+    if isinstance(obj, Attrib):
+        values = [getattr(obj, name, None) for name in Attrib.__slots__]
+        return "Attrib(" + ",".join(map(_describe, values)) + ")"
+    if isinstance(obj, (type, types.FunctionType, types.BuiltinFunctionType)):
+        if get_origin(obj) is None:
+            return f"{obj.__module__}.{obj.__qualname__}"
+    if isinstance(obj, types.ModuleType):
+        return f"module {obj.__name__}"
+    if isinstance(obj, _CONTAINERS):
+        return type(obj).__name__ + "(" + ",".join(map(_describe, obj)) + ")"
+    metadata = getattr(obj, "__metadata__", None)
+    if metadata is not None:
+        return f"Annotated[{_describe(obj.__origin__)},{_describe(metadata)}]"
+    text = repr(obj)
+    return _ADDRESS.sub("", text) if " at 0x" in text else text
+
+
+def _describe_global(obj: typing.Any) -> str:
+    # globals are mostly classes, modules and aliases shared by many models. The
+    # object is kept with its description so that its id is not reused.
+    try:
+        return _GLOBAL_DESCRIPTIONS[id(obj)][1]
+    except KeyError:
+        description = _describe(obj)
+        _GLOBAL_DESCRIPTIONS[id(obj)] = obj, description
+        return description
+
+
+def _lookup(name: str, namespaces: typing.Sequence[typing.Mapping[str, typing.Any]]):
+    first, *rest = name.split(".")
+    for namespace in namespaces:
+        if first in namespace:
+            obj = namespace[first]
+            break
+    else:
+        return MISSING
+    for attr in rest:
+        obj = getattr(obj, attr, MISSING)
+    return obj
+
+
+def schema_key(name: str, attrs: typing.Dict[str, typing.Any]) -> typing.Optional[str]:
+    """
+    Return the cache key of a model from its class namespace, or None if the model
+    is not cached.
+
+    The key is a fingerprint of the source file of the module, the annotations of
+    the model and the values of the names used in string annotations, so editing
+    the model, or an alias it refers to by name, invalidates its entry. Models
+    defined in functions and models without a source file are not cached.
+    """
+    if _cache_dir is None:
+        return None
+    module_name = attrs.get("__module__")
+    qualname = attrs.get("__qualname__", name)
+    module = sys.modules.get(module_name)
+    path = getattr(module, "__file__", None)
+    if path is None or "<locals>" in qualname:
+        return None
+    stat = _stat(path)
+    if stat is None:
+        return None
+
+    namespaces = (attrs, vars(module), vars(sys.modules["builtins"]))
+    parts = [
+        str(_FORMAT_VERSION),
+        sys.version,
+        _get_library_stamp(),
+        module_name,
+        qualname,
+        stat,
+    ]
+    for field_name, annotation in attrs.get("__annotations__", {}).items():
+        parts.append(f"{field_name}:{_describe(annotation)}")
+        if isinstance(annotation, str):
+            for ref in _NAMES.findall(annotation):
+                obj = _lookup(ref, namespaces)
+                parts.append(f"{ref}={_describe_global(obj)}")
+
+    import hashlib
+
+    digest = hashlib.blake2b("\n".join(parts).encode("utf-8"), digest_size=16)
+    return digest.hexdigest()
+
+
+def _is_importable(obj: typing.Any) -> bool:
+    module = sys.modules.get(getattr(obj, "__module__", None))
+    qualname = getattr(obj, "__qualname__", "")
+    if module is None or "<" in qualname:
+        return False
+    return _lookup(qualname, (vars(module),)) is obj
+
+
+def _is_cacheable(obj: typing.Any) -> bool:
+    """
+    Whether a prepared annotation can be cached: values are stored by value only if
+    they are immutable, and classes and functions only if they can be imported.
+    """
+    if obj is MISSING or isinstance(obj, _SCALARS) or isinstance(obj, re.Pattern):
+        return True
+    if isinstance(obj, (tuple, frozenset)):
+        return all(map(_is_cacheable, obj))
+    if isinstance(obj, Attrib):
+        values = [
+            getattr(obj, name) for name in Attrib.__slots__ if not name.startswith("_")
+        ]
+        return all(map(_is_cacheable, values + list(obj._validators)))
+    if isinstance(obj, enum.Enum):
+        return _is_importable(type(obj))
+    if obj is NoneType or obj is Ellipsis or isinstance(obj, ForwardRef):
+        return True
+    if any(obj is form for form in _SPECIAL_FORMS):
+        return True
+    metadata = getattr(obj, "__metadata__", None)
+    if metadata is not None:
+        return _is_cacheable(obj.__origin__) and _is_cacheable(metadata)
+    origin = get_origin(obj)
+    if origin is not None:
+        return _is_cacheable(origin) and _is_cacheable(get_args(obj))
+    if isinstance(obj, (type, types.FunctionType, types.BuiltinFunctionType)):
+        return _is_importable(obj)
+    return False
+
+
+# MISSING is a sentinel compared by identity, so it is pickled by name
+def _persistent_id(obj: typing.Any) -> typing.Optional[str]:
+    return "MISSING" if obj is MISSING else None
+
+
+def _persistent_load(pid: str) -> typing.Any:
+    if pid == "MISSING":
+        return MISSING
+    raise ValueError(f"Unknown persistent id {pid!r}")
+
+
+def load_model_fields(
+    key: typing.Optional[str],
+) -> typing.Optional[typing.Dict[str, typing.Any]]:
+    """
+    Return the prepared field annotations of a model from the cache, or None if the
+    key is None or has no valid entry.
+    """
+    if key is None or _cache_dir is None:
+        return None
+    import pickle
+
+    try:
+        with open(os.path.join(_cache_dir, key + _SUFFIX), "rb") as f:
+            unpickler = pickle.Unpickler(f)
+            unpickler.persistent_load = _persistent_load
+            annotations = unpickler.load()
+    except Exception:
+        # missing, corrupt, or refers to a class that was moved or removed
+        _count("misses")
+        return None
+    _count("hits")
+    return annotations
+
+
+def store_model_fields(
+    key: typing.Optional[str], annotations: typing.Dict[str, typing.Any]
+) -> None:
+    """
+    Store the prepared field annotations of a model in the cache. Fields holding
+    values that cannot be restored faithfully, e.g. lambdas or mutable defaults,
+    leave the model uncached. Errors writing the cache are ignored.
+    """
+    if key is None or _cache_dir is None:
+        return
+    if not all(map(_is_cacheable, annotations.values())):
+        return
+    import pickle
+    import tempfile
+
+    buffer = io.BytesIO()
+    pickler = pickle.Pickler(buffer, protocol=pickle.HIGHEST_PROTOCOL)
+    pickler.persistent_id = _persistent_id
+    try:
+        pickler.dump(annotations)
+    except Exception:
+        return
+
+    try:
+        os.makedirs(_cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=_cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(buffer.getvalue())
+            # concurrent processes write the same content, the last one wins
+            os.replace(tmp_path, os.path.join(_cache_dir, key + _SUFFIX))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        return
+    _count("stores")
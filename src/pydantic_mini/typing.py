@@ -1,10 +1,10 @@
 from __future__ import annotations
 import re
-import logging
 import sys
 import types
 import typing
 import inspect
+import functools
 import collections
 from dataclasses import MISSING, Field, InitVar
 
@@ -21,6 +21,8 @@ else:
 from .exceptions import ValidationError
 
 if typing.TYPE_CHECKING:
+    import logging
+
     from .base import BaseModel
 
 __all__ = (
@@ -31,6 +33,7 @@ __all__ = (
     "is_optional_type",
     "is_type",
     "is_mini_annotated",
+    "is_async_callable",
     "NoneType",
     "ModelConfigWrapper",
     "is_builtin_type",
@@ -45,7 +48,12 @@ __all__ = (
     "dataclass_transform",
 )
 
-logger = logging.getLogger(__name__)
+
+def _get_logger() -> "logging.Logger":
+    # logging is imported when the first message is logged
+    import logging
+
+    return logging.getLogger(__name__)
 
 
 # backward compatibility
@@ -79,6 +87,12 @@ _NON_DATACLASS_CONFIG_FIELD: typing.List[str] = [
     "strict_mode",
     "disable_typecheck",
     "disable_all_validation",
+    "validate_assignment",
+    "track_changes",
+    "loads_cache_size",
+    "loads_cache_max_bytes",
+    "json_backend",
+    "max_depth",
 ]
 
 
@@ -92,6 +106,12 @@ class ModelConfigWrapper:
     strict_mode: bool = False
     disable_typecheck: bool = False
     disable_all_validation: bool = False
+    validate_assignment: bool = False
+    track_changes: bool = False
+    loads_cache_size: int = 0
+    loads_cache_max_bytes: typing.Optional[int] = None
+    json_backend: typing.Optional[str] = None
+    max_depth: typing.Optional[int] = None
 
     def __init__(self, config: typing.Type):
         self.config = config
@@ -129,7 +149,9 @@ class Attrib:
         "min_length",
         "max_length",
         "pattern",
+        "discriminator",
         "_validators",
+        "_async_validators",
     )
 
     def __init__(
@@ -150,6 +172,7 @@ class Attrib:
         validators: typing.Optional[
             typing.List[typing.Callable[[typing.Any], typing.Any]]
         ] = MISSING,
+        discriminator: typing.Optional[str] = None,
     ):
         """
         Represents a data attribute with optional validation, default values, and formatting logic.
@@ -167,7 +190,11 @@ class Attrib:
             min_length (int): Minimum allowed length (for iterable types like strings/lists).
             max_length (int): Maximum allowed length.
             pattern (str or Pattern): Regex pattern the value must match (typically for strings).
+            discriminator (str): Field of the union members whose value selects the model for a dict.
             _validators (List[Callable]): Custom validators to run on the value.
+            _async_validators (List[Callable]): The validators that are coroutine
+                functions. They are skipped on construction and run by
+                ``BaseModel.avalidate`` and ``BaseModel.aloads``.
 
         Args:
             default (Any, optional): Static default value to use if none is provided.
@@ -179,6 +206,9 @@ class Attrib:
             min_length, max_length (int, optional): Length constraints for sequences.
             pattern (str or Pattern, optional): Regex pattern constraint.
             validators (List[Callable], optional): Additional callables that validate the input.
+                Coroutine functions are run concurrently by ``BaseModel.avalidate``.
+            discriminator (str, optional): For unions of models, the field whose value
+                selects the model a dict is converted to, e.g. "kind".
         """
         self.default = default
         self.default_factory = default_factory
@@ -193,6 +223,7 @@ class Attrib:
         self.min_length = min_length
         self.max_length = max_length
         self.pattern = pattern
+        self.discriminator = discriminator
 
         if validators is not MISSING:
             self._validators = (
@@ -200,6 +231,9 @@ class Attrib:
             )
         else:
             self._validators = []
+        self._async_validators = [
+            validator for validator in self._validators if is_async_callable(validator)
+        ]
 
     def __repr__(self):
         return (
@@ -232,14 +266,28 @@ class Attrib:
                 else:
                     setattr(instance, fd.name, value)
             except Exception as exc:
-                logger.error(
+                _get_logger().error(
                     "Pre-formatter error for %s : %s", (fd.name, exc), exc_info=exc
                 )
                 raise RuntimeError(
                     f"Error occurred while executing the pre-formatter for field: {fd.name}"
                 ) from exc
 
-    def validate(self, value: typing.Any, field_name: str) -> typing.Optional[bool]:
+    def validate(
+        self,
+        value: typing.Any,
+        field_name: str,
+        skip: typing.Container[str] = (),
+    ) -> typing.Optional[bool]:
+        """
+        Validate the value against the constraints of this attribute.
+
+        Args:
+            value: The field value.
+            field_name: The name of the field being validated.
+            skip: Names of constraints not to check e.g. because batch validation
+                checks them for the whole column.
+        """
         value = value or self._get_default()
 
         if self.allow_none and value is None:
@@ -256,7 +304,7 @@ class Attrib:
 
             # Skip the validation if 'validation_factor' is None, or if both 'value'
             # and 'self.default' are None
-            if validation_factor is None or value is None:
+            if validation_factor is None or value is None or name in skip:
                 continue
 
             validator = getattr(self, f"_validate_{name}")
@@ -265,6 +313,8 @@ class Attrib:
 
     def execute_field_validators(self, instance: "BaseModel", fd: Field) -> None:
         for validator in self._validators:
+            if self._async_validators and validator in self._async_validators:
+                continue
             try:
                 result = validator(instance, getattr(instance, fd.name))
                 if result is not None:
@@ -370,6 +420,15 @@ class Attrib:
             )
 
 
+def is_async_callable(func: typing.Any) -> bool:
+    """Whether calling ``func`` returns an awaitable, e.g. an ``async def`` function."""
+    while isinstance(func, functools.partial):
+        func = func.func
+    return inspect.iscoroutinefunction(func) or inspect.iscoroutinefunction(
+        getattr(func, "__call__", None)
+    )
+
+
 def is_mini_annotated(typ) -> bool:
     origin = get_origin(typ)
     return (
@@ -453,6 +512,11 @@ def get_type(typ):
     if is_type(origin):
         return origin
 
+    if origin is typing.Literal:
+        # the type of the first allowed value
+        type_args = get_args(typ)
+        return type(type_args[0]) if type_args else None
+
     type_args = get_args(typ)
     if len(type_args) > 0:
         return get_type(type_args[0])
@@ -1,15 +1,54 @@
+import enum
 import typing
-import logging
 import inspect
-from dataclasses import MISSING
+from dataclasses import MISSING, fields, is_dataclass
 
-from pydantic_mini.typing import is_builtin_type
+from pydantic_mini.typing import (
+    is_builtin_type,
+    is_mini_annotated,
+    get_origin,
+    get_args,
+    get_forward_type,
+    NoneType,
+)
 
-logger = logging.getLogger(__name__)
+if typing.TYPE_CHECKING:
+    import logging
+
+
+def _get_logger() -> "logging.Logger":
+    # logging is imported when the first message is logged
+    import logging
+
+    return logging.getLogger(__name__)
 
 
 T = typing.TypeVar("T")
 
+_SCHEMA_FINGERPRINT_CACHE: typing.Dict[type, bytes] = {}
+
+# Parameters of the functions called by init_class, read with inspect.signature once
+_CALL_PARAMETERS_CACHE: typing.Dict[typing.Any, typing.Tuple] = {}
+
+
+def _get_call_parameters(func) -> typing.Tuple[typing.Tuple[str, typing.Any], ...]:
+    """Return the names and defaults of the parameters of a function, except self."""
+    try:
+        return _CALL_PARAMETERS_CACHE[func]
+    except (KeyError, TypeError):
+        pass
+
+    parameters = tuple(
+        (param.name, param.default)
+        for param in inspect.signature(func).parameters.values()
+        if param.name != "self"
+    )
+    try:
+        _CALL_PARAMETERS_CACHE[func] = parameters
+    except TypeError:
+        pass
+    return parameters
+
 
 def get_function_call_args(
     func, params: typing.Union[typing.Dict[str, typing.Any], object]
@@ -28,20 +67,17 @@ def get_function_call_args(
     """
     params_dict = {}
     try:
-        sig = inspect.signature(func)
-        for param in sig.parameters.values():
-            if param.name != "self":
-                value = (
-                    params.get(param.name, param.default)
-                    if isinstance(params, dict)
-                    else getattr(params, param.name, param.default)
-                )
-                if value is not MISSING and value is not inspect.Parameter.empty:
-                    params_dict[param.name] = value
-                else:
-                    params_dict[param.name] = None
+        is_dict = isinstance(params, dict)
+        for name, default in _get_call_parameters(func):
+            value = (
+                params.get(name, default) if is_dict else getattr(params, name, default)
+            )
+            if value is not MISSING and value is not inspect.Parameter.empty:
+                params_dict[name] = value
+            else:
+                params_dict[name] = None
     except (ValueError, KeyError) as e:
-        logger.warning(f"Parsing {func} for call parameters failed {str(e)}")
+        _get_logger().warning(f"Parsing {func} for call parameters failed {str(e)}")
 
     for key in ["args", "kwargs"]:
         if key in params_dict and params_dict[key] is None:
@@ -119,3 +155,70 @@ def init_class(
                 )
 
     return instance
+
+
+def _describe_type(typ: typing.Any, seen: typing.Set[type]) -> str:
+    if is_mini_annotated(typ):
+        return _describe_type(get_args(typ)[0], seen)
+
+    if typ is NoneType or typ is None:
+        return "None"
+
+    forward = get_forward_type(typ)
+    if isinstance(typ, (str, typing.ForwardRef)):
+        return forward
+
+    origin = get_origin(typ)
+    if origin is not None:
+        origin_name = getattr(origin, "__qualname__", None) or repr(origin)
+        args = ",".join(_describe_type(arg, seen) for arg in get_args(typ))
+        return f"{origin_name}[{args}]"
+
+    if inspect.isclass(typ):
+        if issubclass(typ, enum.Enum):
+            members = ",".join(f"{m.name}={m.value!r}" for m in typ)
+            return f"{typ.__qualname__}<{members}>"
+        if is_dataclass(typ):
+            if typ in seen:
+                return typ.__qualname__
+            seen.add(typ)
+            return f"{typ.__qualname__}{{{_describe_fields(typ, seen)}}}"
+        return typ.__qualname__
+
+    return repr(typ)
+
+
+def _describe_fields(model: type, seen: typing.Set[type]) -> str:
+    get_hints = getattr(model, "_get_resolved_type_hints", None)
+    hints = get_hints() if get_hints else {}
+    return ",".join(
+        f"{fd.name}:{_describe_type(hints.get(fd.name, fd.type), seen)}"
+        for fd in fields(model)
+    )
+
+
+def get_schema_fingerprint(model: type) -> bytes:
+    """
+    Return an 8 byte fingerprint of the schema of a model.
+
+    The fingerprint covers the model name, the names, order and types of its fields,
+    the members of Enum fields and the schema of nested models. Two processes that
+    define the same model get the same fingerprint.
+
+    Args:
+        model: A BaseModel or dataclass type.
+
+    Returns:
+        The fingerprint as bytes.
+    """
+    try:
+        return _SCHEMA_FINGERPRINT_CACHE[model]
+    except KeyError:
+        pass
+
+    import hashlib
+
+    description = _describe_type(model, set())
+    fingerprint = hashlib.blake2b(description.encode("utf-8"), digest_size=8).digest()
+    _SCHEMA_FINGERPRINT_CACHE[model] = fingerprint
+    return fingerprint
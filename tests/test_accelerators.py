@@ -0,0 +1,113 @@
+import typing
+
+import pytest
+
+from pydantic_mini import BaseModel, MiniAnnotated, Attrib
+from pydantic_mini import accelerators
+from pydantic_mini.accelerators import ColumnConstraintChecker
+from pydantic_mini.exceptions import ValidationError
+
+pytest.importorskip("numpy")
+
+
+class Measurement(BaseModel):
+    label: MiniAnnotated[str, Attrib(min_length=2, max_length=5)]
+    value: MiniAnnotated[float, Attrib(ge=0, lt=100)]
+    count: MiniAnnotated[int, Attrib(gt=0)]
+
+
+class Node(BaseModel):
+    count: MiniAnnotated[int, Attrib(gt=0)]
+    child: typing.Optional["Node"] = None
+
+
+def _rows(n, **overrides):
+    rows = [{"label": "ok", "value": 1.0, "count": 1} for _ in range(n)]
+    for index, row in overrides.items():
+        rows[int(index[1:])].update(row)
+    return rows
+
+
+def _load_error(rows, use_numpy, monkeypatch):
+    monkeypatch.setattr(accelerators, "USE_NUMPY", use_numpy)
+    with pytest.raises((ValidationError, TypeError)) as exc:
+        Measurement.loads(rows, _format="dict", batch=True)
+    return type(exc.value), str(exc.value)
+
+
+def test_checker_is_used_when_numpy_is_available(monkeypatch):
+    batch = Measurement.loads(_rows(3), _format="dict", batch=True)
+    checker = ColumnConstraintChecker.for_batch(batch)
+
+    assert checker is not None
+    assert set(checker.deferred) == {"label", "value", "count"}
+
+    monkeypatch.setattr(accelerators, "USE_NUMPY", False)
+    assert ColumnConstraintChecker.for_batch(batch) is None
+
+
+def test_checker_not_used_for_nested_models():
+    batch = Node.loads([{"count": 1}], _format="dict", batch=True)
+    assert ColumnConstraintChecker.for_batch(batch) is None
+
+
+def test_valid_rows_pass_vectorised_check():
+    batch = Measurement.loads(_rows(1000), _format="dict", batch=True)
+    assert len(batch) == 1000
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"r5": {"value": 150.0}},
+        {"r7": {"count": -3}, "r9": {"value": -1.0}},
+        {"r3": {"label": "toolong"}},
+        {"r2": {"label": "a"}, "r1": {"count": 0}},
+        {"r4": {"value": float("nan")}},
+        {"r6": {"count": "x"}, "r8": {"count": -1}},
+        {"r8": {"count": "x"}, "r6": {"count": -1}},
+        {"r3": {"label": "a", "count": "x"}},
+        {"r3": {"label": "a", "value": "x"}},
+    ],
+)
+def test_errors_match_pure_python_path(overrides, monkeypatch):
+    rows = _rows(10, **overrides)
+
+    assert _load_error(rows, True, monkeypatch) == _load_error(rows, False, monkeypatch)
+
+
+def test_deferred_constraints_are_restored_after_batch():
+    Measurement.loads(_rows(2), _format="dict", batch=True)
+
+    with pytest.raises(ValidationError):
+        Measurement(label="ok", value=1.0, count=-1)
+
+
+class Reading(BaseModel):
+    count: MiniAnnotated[int, Attrib(gt=0)]
+    previous: typing.Any = None
+
+    def validate_previous(self, value, field):
+        # a second instance of the model, which is not a row of the batch
+        if value is None:
+            return Reading(count=self.count - 10, previous=False)
+
+
+def test_instances_created_by_validators_check_their_constraints():
+    with pytest.raises(ValidationError, match="not greater than"):
+        Reading.loads([{"count": 5}], _format="dict", batch=True)
+
+    batch = Reading.loads([{"count": 15}], _format="dict", batch=True)
+    assert batch[0].previous == Reading(count=5, previous=False)
+
+
+def test_instances_not_appended_check_their_constraints():
+    from pydantic_mini import ModelBatch
+
+    def records():
+        Measurement(label="ok", value=1.0, count=-1)
+        yield Measurement(label="ok", value=1.0, count=1)
+
+    batch = ModelBatch(Measurement)
+    with pytest.raises(ValidationError, match="not greater than"):
+        batch.extend(records())
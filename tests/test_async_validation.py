@@ -0,0 +1,142 @@
+import asyncio
+
+import pytest
+
+from pydantic_mini import BaseModel, MiniAnnotated, Attrib, ValidationError
+from pydantic_mini.async_validation import gather_limited
+
+TAKEN = {"taken@example.com"}
+
+
+def lower(instance, value):
+    return value.lower()
+
+
+async def unique_email(instance, value):
+    await asyncio.sleep(0)
+    if value in TAKEN:
+        raise ValidationError(f"{value} is taken")
+    return value + "#checked"
+
+
+async def failing(instance, value):
+    raise LookupError("cache server unavailable")
+
+
+class Account(BaseModel):
+    email: MiniAnnotated[str, Attrib(validators=[lower, unique_email])]
+    name: str
+
+    async def validate_name(self, value, field):
+        await asyncio.sleep(0)
+        return value.title()
+
+
+class Unreachable(BaseModel):
+    email: MiniAnnotated[str, Attrib(validators=[failing])]
+
+
+def test_async_validators_are_skipped_on_construction():
+    account = Account(email="Ann@Example.com", name="ann lee")
+
+    # sync validators still run, in order
+    assert account.email == "ann@example.com"
+    assert account.name == "ann lee"
+
+    assert asyncio.run(Account.avalidate(account)) is account
+    assert account.email == "ann@example.com#checked"
+    assert account.name == "Ann Lee"
+
+
+def test_aloads():
+    data = [
+        {"email": "A@example.com", "name": "ann"},
+        {"email": "B@example.com", "name": "bob"},
+    ]
+
+    accounts = asyncio.run(Account.aloads(data, _format="dict"))
+
+    assert [account.email for account in accounts] == [
+        "a@example.com#checked",
+        "b@example.com#checked",
+    ]
+    assert [account.name for account in accounts] == ["Ann", "Bob"]
+
+    account = asyncio.run(
+        Account.aloads('{"email": "c@example.com", "name": "cy"}', _format="json")
+    )
+    assert account.name == "Cy"
+
+    with pytest.raises(TypeError, match="batch"):
+        asyncio.run(Account.aloads(data, _format="dict", batch=True))
+
+
+def test_first_error_is_raised_and_no_values_are_set():
+    accounts = [
+        Account(email="free@example.com", name="ann"),
+        Account(email="TAKEN@example.com", name="bob"),
+    ]
+
+    with pytest.raises(ValidationError, match="taken@example.com is taken"):
+        asyncio.run(Account.avalidate(accounts))
+    assert [account.name for account in accounts] == ["ann", "bob"]
+
+    with pytest.raises(ValidationError, match="cache server unavailable"):
+        asyncio.run(Unreachable.avalidate(Unreachable(email="x")))
+
+
+def test_cancelled_validator_is_not_a_validation_error():
+    async def cancelled(instance, value):
+        asyncio.current_task().cancel()
+        await asyncio.sleep(0)
+
+    class Cancelled(BaseModel):
+        email: MiniAnnotated[str, Attrib(validators=[cancelled])]
+
+    instances = [
+        Account(email="TAKEN@example.com", name="bob"),
+        Cancelled(email="x"),
+    ]
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(BaseModel.avalidate(instances))
+    assert instances[1].email == "x"
+
+
+def test_validators_run_concurrently_within_the_limit():
+    running = []
+    peak = []
+
+    async def slow(instance, value):
+        running.append(value)
+        peak.append(len(running))
+        await asyncio.sleep(0.01)
+        running.remove(value)
+
+    class Slow(BaseModel):
+        value: MiniAnnotated[int, Attrib(validators=[slow])]
+
+    instances = [Slow(value=i) for i in range(1, 9)]
+
+    asyncio.run(Slow.avalidate(instances))
+    assert max(peak) == 8
+
+    peak.clear()
+    asyncio.run(Slow.avalidate(instances, max_concurrency=3))
+    assert max(peak) == 3
+
+    with pytest.raises(ValueError, match="max_concurrency must be at least 1"):
+        asyncio.run(Slow.avalidate(instances, max_concurrency=0))
+
+
+def test_gather_limited_returns_errors_in_order():
+    async def value(result):
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    error = KeyError("x")
+    factories = [lambda: value(1), lambda: value(error), lambda: value(3)]
+
+    assert asyncio.run(gather_limited(factories, max_concurrency=1)) == [1, error, 3]
+    assert asyncio.run(gather_limited([])) == []
@@ -1,3 +1,5 @@
+import copy
+import pickle
 import unittest
 import typing
 from unittest.mock import patch
@@ -6,6 +8,20 @@ from pydantic_mini import BaseModel, MiniAnnotated, Attrib
 from pydantic_mini.exceptions import ValidationError
 
 
+class PickledAddress(BaseModel):
+    city: str
+
+
+class PickledPerson(BaseModel):
+    name: str
+    age: MiniAnnotated[int, Attrib(gt=0)]
+    address: typing.Optional[PickledAddress] = None
+    nickname: InitVar[str] = None
+
+    def __model_init__(self, nickname):
+        self.nickname_upper = nickname.upper() if nickname else None
+
+
 class TestBase(unittest.TestCase):
 
     @classmethod
@@ -549,3 +565,283 @@ class TestBase(unittest.TestCase):
             Person.loads(
                 {"name": "nafiu", "location": {"name": "kumasi"}}, _format="dict"
             )
+
+
+class TestPickling(unittest.TestCase):
+
+    def test_pickle_round_trip(self):
+        person = PickledPerson(
+            name="nafiu", age=12, address=PickledAddress(city="kumasi"), nickname="nsh"
+        )
+
+        restored = pickle.loads(pickle.dumps(person))
+
+        self.assertEqual(restored, person)
+        self.assertIsInstance(restored.address, PickledAddress)
+        self.assertEqual(restored.nickname_upper, "NSH")
+
+    def test_unpickle_does_not_revalidate(self):
+        person = PickledPerson(name="nafiu", age=12)
+        data = pickle.dumps(person)
+
+        with patch.object(PickledPerson, "__post_init__") as post_init:
+            restored = pickle.loads(data)
+            post_init.assert_not_called()
+
+        self.assertEqual(restored.age, 12)
+
+    def test_stale_pickle_is_rejected(self):
+        data = pickle.dumps(PickledPerson(name="nafiu", age=12))
+
+        with patch("pydantic_mini.base.get_schema_fingerprint", return_value=b"0" * 8):
+            with self.assertRaises(pickle.UnpicklingError):
+                pickle.loads(data)
+
+    def test_copy_uses_field_values(self):
+        person = PickledPerson(name="nafiu", age=12, address=PickledAddress("accra"))
+
+        shallow = copy.copy(person)
+        deep = copy.deepcopy(person)
+
+        self.assertEqual(shallow, person)
+        self.assertIs(shallow.address, person.address)
+        self.assertEqual(deep, person)
+        self.assertIsNot(deep.address, person.address)
+
+
+class TestValidateAssignment(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        class Session(BaseModel):
+            user: MiniAnnotated[str, Attrib(min_length=2)]
+            hits: MiniAnnotated[int, Attrib(ge=0)]
+
+            class Config:
+                validate_assignment = True
+
+            def validate_user(self, value, fd):
+                return value.lower()
+
+        cls.Session = Session
+
+    def test_assignment_is_validated(self):
+        session = self.Session(user="Nafiu", hits=1)
+        self.assertEqual(session.user, "nafiu")
+
+        session.user = "SHAIBU"
+        self.assertEqual(session.user, "shaibu")
+
+        session.hits = "5"
+        self.assertEqual(session.hits, 5)
+
+        with self.assertRaises(ValidationError):
+            session.hits = -1
+        self.assertEqual(session.hits, 5)
+
+        with self.assertRaises(TypeError):
+            session.hits = "many"
+        self.assertEqual(session.hits, 5)
+
+    def test_only_assigned_field_is_validated(self):
+        session = self.Session(user="nafiu", hits=1)
+
+        with patch.object(
+            self.Session, "_validate_field", autospec=True
+        ) as validate_field:
+            session.hits = 2
+            session.extra = "not a field"
+
+        validate_field.assert_called_once()
+        self.assertEqual(validate_field.call_args[0][1].name, "hits")
+        self.assertEqual(session.extra, "not a field")
+
+    def test_assignment_not_validated_by_default(self):
+        class Person(BaseModel):
+            age: int
+
+        instance = Person(age=1)
+        instance.age = "not an int"
+        self.assertEqual(instance.age, "not an int")
+
+    def test_restored_instances_validate_assignment(self):
+        session = self.Session(user="nafiu", hits=1)
+        loaded = self.Session.loads({"user": "ab", "hits": 3}, _format="dict")
+
+        for instance in (session, loaded, copy.copy(session)):
+            with self.assertRaises(ValidationError):
+                instance.hits = -5
+
+
+class TestChangeTracking(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        class Address(BaseModel):
+            city: str
+
+        class Account(BaseModel):
+            name: str
+            balance: int
+            address: typing.Optional[Address] = None
+
+            class Config:
+                track_changes = True
+
+        cls.Address = Address
+        cls.Account = Account
+
+    def test_changes_are_recorded_after_initialisation(self):
+        account = self.Account(name="nafiu", balance="10")
+        self.assertEqual(account.get_changed_fields(), frozenset())
+
+        account.balance = 10
+        self.assertEqual(account.get_changed_fields(), frozenset())
+
+        account.balance = 20
+        account.address = self.Address(city="kumasi")
+        self.assertEqual(account.get_changed_fields(), {"balance", "address"})
+
+        account.checkpoint_changes()
+        self.assertEqual(account.get_changed_fields(), frozenset())
+
+    def test_dump_only_changed_fields(self):
+        account = self.Account(name="nafiu", balance=10)
+        account.address = self.Address(city="kumasi")
+
+        self.assertEqual(
+            account.dump("dict", only_changed=True), {"address": {"city": "kumasi"}}
+        )
+        self.assertEqual(
+            account.dump("json", only_changed=True), '{"address": {"city": "kumasi"}}'
+        )
+        self.assertEqual(account.dump("dict")["name"], "nafiu")
+
+    def test_dump_only_changed_fields_converts_only_changed_fields(self):
+        converted = []
+
+        class Probe:
+            def __str__(self):
+                converted.append("str")
+                return "probe"
+
+            def __deepcopy__(self, memo):
+                converted.append("deepcopy")
+                return self
+
+        class Tagged(BaseModel):
+            name: str
+            probe: typing.Any
+
+            class Config:
+                track_changes = True
+
+        tagged = Tagged(name="a", probe=Probe())
+        tagged.name = "b"
+
+        for _format, options in [("dict", {}), ("json", {}), ("json", {"exclude": []})]:
+            self.assertIn("b", str(tagged.dump(_format, only_changed=True, **options)))
+        self.assertEqual(converted, [])
+
+        tagged.probe = Probe()
+        self.assertEqual(
+            tagged.dump("json", only_changed=True), '{"name": "b", "probe": "probe"}'
+        )
+        self.assertEqual(converted, ["str"])
+
+    def test_tracking_requires_config(self):
+        with self.assertRaises(RuntimeError):
+            self.Address(city="accra").get_changed_fields()
+
+    def test_tracking_with_validate_assignment(self):
+        class Counter(BaseModel):
+            value: MiniAnnotated[int, Attrib(ge=0)]
+
+            class Config:
+                track_changes = True
+                validate_assignment = True
+
+        counter = Counter(value=1)
+        with self.assertRaises(ValidationError):
+            counter.value = -1
+        self.assertEqual(counter.get_changed_fields(), frozenset())
+
+        counter.value = "2"
+        self.assertEqual(counter.value, 2)
+        self.assertEqual(counter.get_changed_fields(), {"value"})
+
+
+class TestModelCopy(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        class Address(BaseModel):
+            city: str
+
+        class Person(BaseModel):
+            name: MiniAnnotated[str, Attrib(max_length=10)]
+            age: MiniAnnotated[int, Attrib(gt=0)]
+            address: Address
+            tags: typing.List[str]
+
+            def validate_name(self, value, fd):
+                return value.title()
+
+        cls.Address = Address
+        cls.Person = Person
+
+    def _person(self):
+        return self.Person(
+            name="nafiu", age=12, address=self.Address(city="kumasi"), tags=["a"]
+        )
+
+    def test_copy_shares_unchanged_values(self):
+        person = self._person()
+
+        copied = person.copy(update={"age": "13"})
+
+        self.assertEqual(copied.age, 13)
+        self.assertEqual(person.age, 12)
+        self.assertIs(copied.address, person.address)
+        self.assertIs(copied.tags, person.tags)
+
+        deep = person.copy(deep=True)
+        self.assertEqual(deep, person)
+        self.assertIsNot(deep.address, person.address)
+
+    def test_copy_validates_only_updated_fields(self):
+        person = self._person()
+
+        copied = person.copy(update={"name": "shaibu", "address": {"city": "accra"}})
+        self.assertEqual(copied.name, "Shaibu")
+        self.assertIsInstance(copied.address, self.Address)
+
+        with patch.object(
+            self.Person, "_validate_field", autospec=True
+        ) as validate_field:
+            person.copy(update={"age": 20})
+        validate_field.assert_called_once()
+        self.assertEqual(validate_field.call_args[0][1].name, "age")
+
+        with self.assertRaises(ValidationError):
+            person.copy(update={"age": -1})
+
+        with self.assertRaises(TypeError):
+            person.copy(update={"unknown": 1})
+
+    def test_copy_runs_model_init_with_initvars(self):
+        class Account(BaseModel):
+            owner: str
+            secret: InitVar[str]
+
+            def __model_init__(self, secret):
+                self.secret_length = len(secret)
+
+        account = Account(owner="nafiu", secret="abc")
+
+        copied = account.copy(update={"owner": "shaibu", "secret": "abcdef"})
+        self.assertEqual(copied.owner, "shaibu")
+        self.assertEqual(copied.secret_length, 6)
+
+        with self.assertRaises(ValueError):
+            account.copy(update={"owner": "shaibu"})
@@ -0,0 +1,99 @@
+import json
+import typing
+from array import array
+
+import pytest
+
+from pydantic_mini import BaseModel, MiniAnnotated, Attrib, ModelBatch
+from pydantic_mini.exceptions import ValidationError
+
+
+class Reading(BaseModel):
+    sensor: str
+    value: float
+    count: int
+    active: bool
+    tags: MiniAnnotated[typing.List[str], Attrib(default_factory=list)]
+
+
+class Score(BaseModel):
+    name: str
+    points: MiniAnnotated[int, Attrib(ge=0)]
+
+
+ROWS = [
+    {"sensor": "a", "value": 1.5, "count": 1, "active": True, "tags": ["x"]},
+    {"sensor": "b", "value": 2.5, "count": 2, "active": False},
+    {"sensor": "c", "value": 3.5, "count": 3, "active": True, "tags": ["y", "z"]},
+]
+
+
+def test_loads_batch_mode_returns_columnar_batch():
+    batch = Reading.loads(ROWS, _format="dict", batch=True)
+
+    assert isinstance(batch, ModelBatch)
+    assert len(batch) == 3
+    assert batch.field_names == ("sensor", "value", "count", "active", "tags")
+    assert batch.column("value") == array("d", [1.5, 2.5, 3.5])
+    assert batch.column("count") == array("q", [1, 2, 3])
+    assert isinstance(batch.column("sensor"), list)
+
+
+def test_batch_indexing_materialises_rows():
+    batch = Reading.loads(ROWS, _format="dict", batch=True)
+
+    row = batch[1]
+    assert isinstance(row, Reading)
+    assert row == Reading(sensor="b", value=2.5, count=2, active=False)
+    assert row.active is False
+    assert batch[-1].tags == ["y", "z"]
+
+    with pytest.raises(IndexError):
+        batch[3]
+
+
+def test_batch_iteration_and_slicing():
+    batch = Reading.loads(json.dumps(ROWS), _format="json", batch=True)
+
+    assert [row.sensor for row in batch] == ["a", "b", "c"]
+
+    sliced = batch[1:]
+    assert isinstance(sliced, ModelBatch)
+    assert len(sliced) == 2
+    assert sliced.column("count") == array("q", [2, 3])
+    assert sliced[0].sensor == "b"
+
+
+def test_batch_dump():
+    batch = Reading.loads(ROWS, _format="dict", batch=True)
+
+    dumped = batch.dump("dict")
+    assert dumped[0] == {
+        "sensor": "a",
+        "value": 1.5,
+        "count": 1,
+        "active": True,
+        "tags": ["x"],
+    }
+    assert json.loads(batch.dump("json"))[2]["tags"] == ["y", "z"]
+
+
+def test_batch_falls_back_to_list_for_large_ints():
+    batch = ModelBatch(Score)
+    batch.append(Score(name="a", points=1))
+    batch.append(Score(name="b", points=2**70))
+
+    assert isinstance(batch.column("points"), list)
+    assert batch[1].points == 2**70
+
+
+def test_batch_validates_records():
+    with pytest.raises(ValidationError):
+        Score.loads(
+            [{"name": "a", "points": 1}, {"name": "b", "points": -1}],
+            _format="dict",
+            batch=True,
+        )
+
+    with pytest.raises(TypeError):
+        ModelBatch(Score).append(Reading(sensor="a", value=1.0, count=1, active=True))
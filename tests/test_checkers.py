@@ -0,0 +1,157 @@
+import re
+import typing
+
+import pytest
+
+from pydantic_mini import BaseModel, register_type_checker
+from pydantic_mini.checkers import compile_type_checker, unregister_type_checker
+
+
+class Point(BaseModel):
+    x: int
+    y: int
+
+
+class Meters:
+    def __init__(self, value):
+        self.value = value
+
+
+class Shape(BaseModel):
+    name: str
+    size: Meters
+
+
+def test_checker_is_compiled_once_per_annotation():
+    annotation = typing.Optional[typing.List[int]]
+    assert compile_type_checker(annotation) is compile_type_checker(annotation)
+
+
+@pytest.mark.parametrize(
+    "annotation, valid, invalid",
+    [
+        (int, [1, True], ["1", 1.0, None]),
+        (typing.Any, [None, object()], []),
+        (typing.Optional[str], ["a", None], [1]),
+        (typing.Union[int, str], [1, "a"], [1.5]),
+        (typing.List[int], [[], [1, 2]], [[1, "2"]]),
+        (typing.List[typing.List[int]], [[[1], []]], [[[1, "2"]]]),
+        (typing.List[typing.Any], [[None, 1]], []),
+        (typing.Optional[typing.List[str]], [None, ["a"]], [["a", 1]]),
+        (Point, [Point(x=1, y=2)], [{"x": 1, "y": 2}]),
+        (typing.Literal["a", 1], ["a", 1], ["b", True, 1.0, None]),
+        (typing.Literal[1, None], [1, None], [0]),
+    ],
+)
+def test_compiled_checkers(annotation, valid, invalid):
+    checker = compile_type_checker(annotation)
+
+    assert all(checker(value) for value in valid)
+    assert not any(checker(value) for value in invalid)
+
+
+def test_registered_checker_replaces_isinstance():
+    with pytest.raises(TypeError, match="should be of type"):
+        Shape(name="box", size=3)
+
+    register_type_checker(Meters, lambda value: isinstance(value, (Meters, int)))
+    try:
+        assert Shape(name="box", size=3).size == 3
+        assert compile_type_checker(typing.Optional[Meters])(3)
+    finally:
+        unregister_type_checker(Meters)
+
+    with pytest.raises(TypeError):
+        Shape(name="box", size=3)
+
+
+def test_register_type_checker_requires_callable():
+    with pytest.raises(TypeError, match="callable"):
+        register_type_checker(Meters, "not callable")
+
+
+class Item(BaseModel):
+    name: str
+    qty: int
+
+
+class Order(BaseModel):
+    items: typing.Dict[str, Item]
+    pair: typing.Tuple[int, str]
+    scores: typing.Tuple[float, ...]
+    tags: typing.Set[str]
+    matrix: typing.List[typing.List[int]]
+    lookup: typing.Optional[typing.Dict[str, typing.List[Item]]] = None
+
+
+def _order(**overrides):
+    values = dict(
+        items={"a": {"name": "apple", "qty": 1}},
+        pair=[1, "x"],
+        scores=[1, 2.5],
+        tags=["red", "red"],
+        matrix=[[1, 2], (3,)],
+    )
+    values.update(overrides)
+    return Order(**values)
+
+
+@pytest.mark.parametrize(
+    "annotation, valid, invalid",
+    [
+        (typing.Dict[str, int], [{"a": 1}], [{"a": "1"}, {1: 1}, [("a", 1)]]),
+        (typing.Tuple[int, str], [(1, "a")], [(1, 2), (1,), [1, "a"]]),
+        (typing.Tuple[int, ...], [(), (1, 2, 3)], [(1, "2")]),
+        (typing.Set[int], [{1, 2}], [[1, 2], {1, "2"}]),
+        (typing.List[str], [["a"]], ["abc", ("a",)]),
+    ],
+)
+def test_collection_shapes(annotation, valid, invalid):
+    checker = compile_type_checker(annotation)
+
+    assert all(checker(value) for value in valid)
+    assert not any(checker(value) for value in invalid)
+
+
+def test_nested_collections_are_coerced():
+    order = _order(lookup={"fruit": [{"name": "pear", "qty": 2}]})
+
+    assert order.items == {"a": Item(name="apple", qty=1)}
+    assert order.pair == (1, "x")
+    assert order.scores == (1.0, 2.5)
+    assert order.tags == {"red"}
+    assert order.matrix == [[1, 2], [3]]
+    assert order.lookup["fruit"][0] == Item(name="pear", qty=2)
+
+
+def test_valid_collections_are_not_rebuilt():
+    items = {"a": Item(name="apple", qty=1)}
+    matrix = [[1, 2], [3]]
+
+    order = _order(items=items, matrix=matrix)
+
+    assert order.items is items
+    assert order.matrix is matrix
+
+
+@pytest.mark.parametrize(
+    "overrides, location",
+    [
+        ({"matrix": [[1], [2, "x"]]}, "matrix[1][1]"),
+        ({"items": {"a": Item(name="a", qty=1), "b": 3}}, "items['b']"),
+        ({"pair": ("one", "x")}, "pair[0]"),
+        ({"scores": (1.0, "high")}, "scores[1]"),
+        ({"lookup": {"k": [Item(name="a", qty=1), None]}}, "lookup['k'][1]"),
+    ],
+)
+def test_collection_errors_report_failing_index(overrides, location):
+    with pytest.raises(TypeError, match=re.escape(f"at {location}.")):
+        _order(**overrides)
+
+
+def test_collection_field_rejects_wrong_container():
+    with pytest.raises(TypeError, match="should be of type"):
+        _order(pair=(1, "x", 2))
+
+    with pytest.raises(TypeError, match="but got str"):
+        _order(matrix="12")
@@ -0,0 +1,247 @@
+import re
+import enum
+import uuid
+import typing
+import decimal
+import datetime
+
+import pytest
+
+from pydantic_mini import BaseModel, MiniAnnotated, Attrib
+from pydantic_mini.coercers import compile_coercer, get_discriminator_map
+
+
+class Color(enum.Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+class Level(enum.IntEnum):
+    LOW = 1
+    HIGH = 2
+
+
+class Shade(enum.Enum):
+    DARK = "dark"
+
+    @classmethod
+    def _missing_(cls, value):
+        if isinstance(value, str) and value.lower() == "dark":
+            return cls.DARK
+        return None
+
+
+class Settings(BaseModel):
+    enabled: bool
+    retries: int
+    ratio: float
+    label: str
+    color: Color
+    level: typing.Optional[Level] = None
+
+
+@pytest.mark.parametrize(
+    "annotation, value, expected",
+    [
+        (bool, "false", False),
+        (bool, " TRUE ", True),
+        (bool, "off", False),
+        (bool, "1", True),
+        (bool, 0, False),
+        (int, "42", 42),
+        (int, 3.0, 3),
+        (int, decimal.Decimal("7"), 7),
+        (float, "2.5", 2.5),
+        (float, 2, 2.0),
+        (str, 12, "12"),
+        (str, b"x", "x"),
+        (str, bytearray("né", "utf-8"), "né"),
+        (Color, "blue", Color.BLUE),
+        (Level, 2, Level.HIGH),
+        (Shade, "DARK", Shade.DARK),
+    ],
+)
+def test_scalar_coercions(annotation, value, expected):
+    result = compile_coercer(annotation)(value)
+
+    assert result == expected
+    assert type(result) is type(expected)
+
+
+@pytest.mark.parametrize(
+    "annotation, value",
+    [
+        (bool, "maybe"),
+        (bool, 2),
+        (int, "1.5"),
+        (int, 1.5),
+        (float, "abc"),
+        (float, True),
+        (str, [1]),
+        (str, b"\xff"),
+        (Color, "green"),
+        (Color, ["red"]),
+        (Level, None),
+    ],
+)
+def test_values_that_cannot_be_coerced_are_returned_unchanged(annotation, value):
+    assert compile_coercer(annotation)(value) is value
+
+
+def test_values_of_the_right_type_are_returned_as_is():
+    for annotation, value in [(int, True), (str, "x"), (Color, Color.RED)]:
+        assert compile_coercer(annotation)(value) is value
+
+
+def test_model_fields_are_coerced():
+    settings = Settings(
+        enabled="false", retries="3", ratio="0.5", label=7, color="red", level=1
+    )
+
+    assert settings.enabled is False
+    assert settings.retries == 3
+    assert settings.ratio == 0.5
+    assert settings.label == "7"
+    assert settings.color is Color.RED
+    assert settings.level is Level.LOW
+
+    with pytest.raises(TypeError, match="enabled"):
+        Settings(enabled="maybe", retries=1, ratio=1.0, label="x", color="red")
+
+
+UTC = datetime.timezone.utc
+
+
+@pytest.mark.parametrize(
+    "annotation, value, expected",
+    [
+        (
+            datetime.datetime,
+            "2024-01-02T03:04:05",
+            datetime.datetime(2024, 1, 2, 3, 4, 5),
+        ),
+        (
+            datetime.datetime,
+            "2024-01-02T03:04:05Z",
+            datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC),
+        ),
+        (datetime.datetime, "20240102T030405", datetime.datetime(2024, 1, 2, 3, 4, 5)),
+        (datetime.datetime, 0, datetime.datetime(1970, 1, 1, tzinfo=UTC)),
+        (datetime.date, " 2024-01-02 ", datetime.date(2024, 1, 2)),
+        (datetime.date, "2024/01/02", datetime.date(2024, 1, 2)),
+        (datetime.time, "03:04", datetime.time(3, 4)),
+        (uuid.UUID, "00000000-0000-0000-0000-000000000007", uuid.UUID(int=7)),
+        (uuid.UUID, uuid.UUID(int=7).bytes, uuid.UUID(int=7)),
+        (decimal.Decimal, "1.10", decimal.Decimal("1.10")),
+        (decimal.Decimal, 0.1, decimal.Decimal("0.1")),
+    ],
+)
+def test_stdlib_type_coercions(annotation, value, expected):
+    result = compile_coercer(annotation)(value)
+
+    assert result == expected
+    assert type(result) is type(expected)
+
+
+@pytest.mark.parametrize(
+    "annotation, value",
+    [
+        (datetime.datetime, "yesterday"),
+        (datetime.datetime, True),
+        (datetime.date, ""),
+        (uuid.UUID, "not-a-uuid"),
+        (decimal.Decimal, "1,5"),
+    ],
+)
+def test_invalid_stdlib_values_are_returned_unchanged(annotation, value):
+    assert compile_coercer(annotation)(value) is value
+
+
+def test_detected_datetime_format_is_reused():
+    coerce = compile_coercer(typing.List[datetime.datetime])
+
+    values = coerce(["2024/01/02 03:04:05", "2024/02/03 04:05:06"])
+
+    assert values == [
+        datetime.datetime(2024, 1, 2, 3, 4, 5),
+        datetime.datetime(2024, 2, 3, 4, 5, 6),
+    ]
+
+
+class Kind(enum.Enum):
+    CAT = "cat"
+    DOG = "dog"
+
+
+class CatEvent(BaseModel):
+    kind: typing.Literal[Kind.CAT]
+    lives: int = 9
+
+
+class DogEvent(BaseModel):
+    name: str
+    kind: Kind = Kind.DOG
+
+
+class BirdEvent(BaseModel):
+    kind: MiniAnnotated[str, Attrib(default="bird")]
+
+
+Event = typing.Union[CatEvent, DogEvent, BirdEvent]
+
+
+class EventLog(BaseModel):
+    last: MiniAnnotated[typing.Optional[Event], Attrib(discriminator="kind")]
+    events: MiniAnnotated[
+        typing.List[Event], Attrib(discriminator="kind", default_factory=list)
+    ]
+
+
+def test_discriminator_map_from_literals_and_defaults():
+    mapping = get_discriminator_map(Event, "kind")
+
+    assert mapping == {
+        Kind.CAT: CatEvent,
+        "cat": CatEvent,
+        Kind.DOG: DogEvent,
+        "dog": DogEvent,
+        "bird": BirdEvent,
+    }
+    assert get_discriminator_map(Event, "kind") is mapping
+
+
+def test_discriminator_dispatches_dicts_to_models():
+    log = EventLog(
+        last={"kind": "bird"},
+        events=[{"kind": "dog", "name": "Rex"}, {"kind": "cat", "lives": 3}],
+    )
+
+    assert log.last == BirdEvent(kind="bird")
+    assert log.events == [DogEvent(name="Rex"), CatEvent(kind=Kind.CAT, lives=3)]
+    assert EventLog(last=None).last is None
+
+
+@pytest.mark.parametrize(
+    "values, message",
+    [
+        ({"last": {"kind": "cow"}}, "no model for 'kind' value 'cow' at last."),
+        (
+            {"last": None, "events": [{"kind": "cat"}, {"name": "x"}]},
+            "no model for 'kind' value None at events[1].",
+        ),
+    ],
+)
+def test_discriminator_errors(values, message):
+    with pytest.raises(TypeError, match=re.escape(message)):
+        EventLog(**values)
+
+
+def test_discriminator_rejects_ambiguous_models():
+    class Other(BaseModel):
+        kind: str = "cat"
+
+    with pytest.raises(TypeError, match="same discriminator value 'cat'"):
+        get_discriminator_map(typing.Union[CatEvent, Other], "kind")
+
+    with pytest.raises(TypeError, match="has no discriminator field 'type'"):
+        get_discriminator_map(Event, "type")
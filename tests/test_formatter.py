@@ -1,12 +1,18 @@
 import pytest
+import csv
 import json
+import uuid
 import typing
-from dataclasses import dataclass, is_dataclass
-from pydantic_mini import BaseModel, MiniAnnotated, Attrib
+import decimal
+import datetime
+from enum import Enum
+from dataclasses import InitVar, dataclass, is_dataclass
+from pydantic_mini import BaseModel, MiniAnnotated, Attrib, ValidationError
 from pydantic_mini.formatters import (
     DictModelFormatter,
     JSONModelFormatter,
     CSVModelFormatter,
+    BinaryModelFormatter,
 )
 
 
@@ -183,3 +189,533 @@ def test_csv_single_instance_decode():
 
     assert len(lines) == 2  # Header + 1 Row
     assert lines[1].startswith("1,Solo,1")
+
+
+def _write_inventory_csv(path, rows, line_ending="\n"):
+    lines = ["id,name,quantity"] + [
+        f"{item_id},{name},{quantity}" for item_id, name, quantity in rows
+    ]
+    path.write_bytes((line_ending.join(lines) + line_ending).encode("utf-8"))
+    return str(path)
+
+
+def test_csv_encode_with_mmap_matches_text_reader(tmp_path):
+    rows = [(i, f"Item {i} é", i * 10) for i in range(1, 200)]
+    file = _write_inventory_csv(tmp_path / "items.csv", rows, line_ending="\r\n")
+
+    mapped = InventoryItem.loads(file, _format="csv", use_mmap=True, encoding="utf-8")
+    plain = InventoryItem.loads(file, _format="csv", use_mmap=False, encoding="utf-8")
+
+    assert mapped == plain
+    assert len(mapped) == 199
+    assert mapped[-1].name == "Item 199 é"
+
+
+def test_csv_mmap_works_with_batch_loads(tmp_path):
+    file = _write_inventory_csv(tmp_path / "items.csv", [(1, "Widget", 5)])
+
+    batch = InventoryItem.loads(file, _format="csv", batch=True, use_mmap=True)
+
+    assert len(batch) == 1
+    assert batch[0].name == "Widget"
+
+
+def test_iter_mmap_lines_across_chunk_boundaries(tmp_path):
+    import mmap
+    from pydantic_mini.formatters import iter_mmap_lines
+
+    text = 'a,b\r\n"multi\nline",é\r\nx,ü\n\nlast'
+    path = tmp_path / "lines.csv"
+    path.write_bytes(text.encode("utf-8"))
+
+    expected = ["a,b\r\n", '"multi\n', 'line",é\r\n', "x,ü\n", "\n", "last"]
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for chunk_size in (1, 2, 3, 4, 5, 64):
+            assert list(iter_mmap_lines(mm, "utf-8", chunk_size)) == expected
+
+
+def test_csv_explicit_dialect_and_header(tmp_path):
+    path = tmp_path / "items.csv"
+    path.write_text("id;name;quantity\n1;Widget;5\n2;Gadget;7\n", encoding="utf-8")
+
+    class Semicolon(csv.excel):
+        delimiter = ";"
+
+    items = InventoryItem.loads(
+        str(path), _format="csv", dialect=Semicolon, has_header=True
+    )
+
+    assert [(item.id, item.name, item.quantity) for item in items] == [
+        (1, "Widget", 5),
+        (2, "Gadget", 7),
+    ]
+
+
+def test_csv_without_header(tmp_path):
+    path = tmp_path / "items.csv"
+    path.write_text("Widget,5,1\nGadget,7,2\n", encoding="utf-8")
+
+    named = InventoryItem.loads(
+        str(path), _format="csv", dialect="excel", fieldnames=["name", "quantity", "id"]
+    )
+    assert [(item.id, item.name) for item in named] == [(1, "Widget"), (2, "Gadget")]
+
+    # without fieldnames the columns are in the order of the model fields
+    path.write_text("1,Widget,5\n", encoding="utf-8")
+    items = InventoryItem.loads(
+        str(path), _format="csv", dialect="excel", has_header=False
+    )
+    assert (items[0].id, items[0].name, items[0].quantity) == (1, "Widget", 5)
+
+
+@pytest.mark.parametrize("use_mmap", [True, False])
+def test_csv_columns_projection_of_wide_file(tmp_path, use_mmap):
+    path = tmp_path / "wide.csv"
+    header = [f"c{i}" for i in range(40)]
+    rows = [[f"{r}-{i}" for i in range(40)] for r in range(3)]
+    path.write_text(
+        "\n".join(",".join(row) for row in [header] + rows) + "\n", encoding="utf-8"
+    )
+
+    class Narrow(BaseModel):
+        id: str
+        name: str
+        quantity: str
+
+    items = Narrow.loads(
+        str(path),
+        _format="csv",
+        dialect="excel",
+        has_header=True,
+        use_mmap=use_mmap,
+        encoding="utf-8",
+        columns={"id": "c0", "name": "c39", "quantity": 20},
+    )
+
+    assert [(item.id, item.name, item.quantity) for item in items] == [
+        (f"{r}-0", f"{r}-39", f"{r}-20") for r in range(3)
+    ]
+
+
+def test_csv_columns_errors(tmp_path):
+    file = _write_inventory_csv(tmp_path / "items.csv", [(1, "Widget", 5)])
+
+    with pytest.raises(ValueError, match="Column 'qty' of field 'quantity' not found"):
+        InventoryItem.loads(file, _format="csv", columns={"quantity": "qty"})
+
+    with pytest.raises(ValueError, match="'price' is not a field of InventoryItem"):
+        InventoryItem.loads(file, _format="csv", columns=["id", "price"])
+
+
+class Color(Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+class Tag(BaseModel):
+    label: str
+    weight: float
+
+
+class Record(BaseModel):
+    id: int
+    score: float
+    active: bool
+    name: str
+    color: Color
+    tags: typing.List[Tag]
+    created: datetime.datetime
+    ref: uuid.UUID
+    note: typing.Optional[str] = None
+    parent: typing.Optional["Record"] = None
+
+
+def _record(**overrides):
+    values = dict(
+        id=1,
+        score=0.5,
+        active=True,
+        name="né",
+        color=Color.BLUE,
+        tags=[Tag(label="a", weight=1.0)],
+        created=datetime.datetime(2024, 1, 2, 3, 4, 5),
+        ref=uuid.UUID(int=7),
+    )
+    values.update(overrides)
+    return Record(**values)
+
+
+def test_binary_round_trip_single_and_list():
+    record = _record(parent=_record(id=2, note="child"))
+
+    payload = record.dump("binary")
+    assert isinstance(payload, bytes)
+    assert Record.loads(payload, _format="binary") == record
+
+    records = [_record(id=i) for i in range(3)]
+    loaded = Record.loads(BinaryModelFormatter().decode(records), _format="binary")
+    assert loaded == records
+    assert len(payload) < len(record.dump("json"))
+
+
+def test_binary_loads_rejects_other_schema():
+    payload = Tag(label="a", weight=1.0).dump("binary")
+
+    with pytest.raises(ValueError, match="fingerprint"):
+        Skill.loads(payload, _format="binary")
+
+    with pytest.raises(ValueError):
+        Tag.loads(payload[:-1], _format="binary")
+
+
+def test_binary_loads_with_validation():
+    class Limited(BaseModel):
+        value: MiniAnnotated[int, Attrib(lt=10)]
+
+    payload = BinaryModelFormatter().decode(
+        Limited._build_without_validation({"value": 11})
+    )
+
+    assert Limited.loads(payload, _format="binary").value == 11
+    with pytest.raises(ValidationError):
+        Limited.loads(payload, _format="binary", validate=True)
+
+
+def test_binary_validation_covers_nested_models():
+    class Positive(BaseModel):
+        x: MiniAnnotated[int, Attrib(gt=0)]
+
+    class Holder(BaseModel):
+        inner: Positive
+        items: typing.List[Positive]
+
+    tampered = Holder._build_without_validation(
+        {"inner": Positive._build_without_validation({"x": -5}), "items": []}
+    )
+    payload = tampered.dump("binary")
+
+    assert Holder.loads(payload, _format="binary").inner.x == -5
+    with pytest.raises(ValidationError):
+        Holder.loads(payload, _format="binary", validate=True)
+
+    tampered.inner, tampered.items = Positive(x=1), [tampered.inner]
+    with pytest.raises(ValidationError):
+        Holder.loads(tampered.dump("binary"), _format="binary", validate=True)
+
+
+def test_binary_loads_rejects_truncated_strings():
+    class Note(BaseModel):
+        text: str
+        created: datetime.datetime
+
+    payload = Note(text="abcdef", created=datetime.datetime(2024, 1, 2)).dump("binary")
+
+    with pytest.raises(ValueError, match="Truncated binary payload"):
+        Note.loads(payload[:-3], _format="binary")
+
+
+def test_binary_empty_list(tmp_path):
+    payload = BinaryModelFormatter().decode([])
+
+    assert Tag.loads(payload, _format="binary") == []
+    assert Record.loads(payload, _format="binary") == []
+
+    path = tmp_path / "tags.bin"
+    assert Tag.dump_to(path, [], _format="binary") == 0
+    assert Tag.loads(path.read_bytes(), _format="binary") == []
+
+
+def test_binary_loads_run_model_init():
+    class Scaled(BaseModel):
+        value: int
+        factor: InitVar[int] = 10
+
+        def __model_init__(self, factor):
+            self.scaled = self.value * factor
+
+    class Wrapper(BaseModel):
+        inner: Scaled
+
+    payload = Wrapper(inner=Scaled(value=2, factor=3)).dump("binary")
+
+    for validate in (False, True):
+        loaded = Wrapper.loads(payload, _format="binary", validate=validate)
+        assert loaded.inner.scaled == 20
+
+    class Required(BaseModel):
+        value: int
+        factor: InitVar[int]
+
+        def __model_init__(self, factor):
+            self.scaled = self.value * factor
+
+    payload = Required(value=2, factor=3).dump("binary")
+    with pytest.raises(TypeError, match="factor"):
+        Required.loads(payload, _format="binary")
+
+
+def test_binary_unsupported_field_type():
+    class Loose(BaseModel):
+        value: typing.Union[int, str]
+
+    with pytest.raises(TypeError, match="not supported"):
+        Loose(value=1).dump("binary")
+
+
+class Settings(BaseModel):
+    name: str
+    retries: int
+
+    class Config:
+        frozen = True
+        loads_cache_size = 2
+
+
+def test_loads_cache_returns_cached_instance():
+    Settings.loads_cache_clear()
+    payload = '{"name": "hook", "retries": 3}'
+
+    first = Settings.loads(payload, _format="json")
+    assert Settings.loads(payload, _format="json") is first
+    assert Settings.loads(payload.encode("utf-8"), _format="json") is first
+
+    data = {"retries": 3, "name": "hook"}
+    from_dict = Settings.loads(data, _format="dict")
+    assert Settings.loads({"name": "hook", "retries": 3}, _format="dict") is from_dict
+    assert Settings.loads(data, _format="dict", use_cache=False) is not from_dict
+
+    info = Settings.loads_cache_info()
+    assert (info.hits, info.misses, info.entries) == (3, 2, 2)
+
+
+def test_loads_cache_evicts_least_recently_used():
+    Settings.loads_cache_clear()
+    payloads = [json.dumps({"name": name, "retries": 1}) for name in "abc"]
+
+    a = Settings.loads(payloads[0], _format="json")
+    Settings.loads(payloads[1], _format="json")
+    assert Settings.loads(payloads[0], _format="json") is a
+    Settings.loads(payloads[2], _format="json")
+
+    info = Settings.loads_cache_info()
+    assert info.evictions == 1
+    assert Settings.loads(payloads[0], _format="json") is a
+    assert Settings.loads(payloads[1], _format="json") is not None
+    assert Settings.loads_cache_info().misses == 4
+
+
+def test_loads_cache_byte_bound_and_list_payloads():
+    class Small(BaseModel):
+        value: int
+
+        class Config:
+            frozen = True
+            loads_cache_size = 10
+            loads_cache_max_bytes = 40
+
+    payload = '[{"value": 1}, {"value": 2}]'
+    first = Small.loads(payload, _format="json")
+    second = Small.loads(payload, _format="json")
+
+    assert second == first and second is not first
+    assert second[0] is first[0]
+    assert Small.loads_cache_info().bytes <= 40
+
+    Small.loads('[{"value": 1}, {"value": 2}, {"value": 3}]', _format="json")
+    assert Small.loads_cache_info().entries == 1
+
+
+def test_loads_cache_keys_keep_value_types():
+    class Loose(BaseModel):
+        value: typing.Any
+
+        class Config:
+            frozen = True
+            loads_cache_size = 10
+
+    inputs = [[1], (1,), {1: "a"}, {"1": "a"}, 1, 1.0, True, "1"]
+    loaded = [Loose.loads({"value": value}, _format="dict") for value in inputs]
+
+    for value, instance in zip(inputs, loaded):
+        assert type(instance.value) is type(value) and instance.value == value
+    assert Loose.loads_cache_info().entries == len(inputs)
+    assert Loose.loads({"value": {1: "a"}}, _format="dict") is loaded[2]
+
+    # values without a canonical form are not cached
+    first = Loose.loads({"value": {1, 2}}, _format="dict")
+    assert Loose.loads({"value": {1, 2}}, _format="dict") is not first
+
+
+def test_loads_cache_skips_batch_rows():
+    pytest.importorskip("numpy")
+
+    class Limited(BaseModel):
+        name: str
+        count: MiniAnnotated[int, Attrib(gt=0)]
+
+        class Config:
+            frozen = True
+            loads_cache_size = 10
+
+    rows = [{"name": "a", "count": 1}, {"name": "b", "count": -5}]
+    with pytest.raises(ValidationError, match="not greater than"):
+        Limited.loads(rows, _format="dict", batch=True)
+
+    assert Limited.loads_cache_info().entries == 0
+    with pytest.raises(ValidationError, match="not greater than"):
+        Limited.loads(rows[1], _format="dict")
+
+
+def test_loads_cache_requires_frozen_model():
+    with pytest.raises(TypeError, match="frozen"):
+
+        class Mutable(BaseModel):
+            value: int
+
+            class Config:
+                loads_cache_size = 10
+
+    assert User.loads_cache_info() is None
+
+
+class Payment(BaseModel):
+    ref: uuid.UUID
+    amount: decimal.Decimal
+    paid_at: datetime.datetime
+    due: datetime.date
+
+
+def test_csv_loads_parses_stdlib_types(tmp_path):
+    path = tmp_path / "payments.csv"
+    path.write_text(
+        "ref,amount,paid_at,due\n"
+        "00000000-0000-0000-0000-000000000001,10.50,2024-01-02 03:04:05,2024-02-01\n"
+    )
+
+    expected = Payment(
+        ref=uuid.UUID(int=1),
+        amount=decimal.Decimal("10.50"),
+        paid_at=datetime.datetime(2024, 1, 2, 3, 4, 5),
+        due=datetime.date(2024, 2, 1),
+    )
+
+    assert Payment.loads(str(path), _format="csv") == [expected]
+    assert list(Payment.loads(str(path), _format="csv", batch=True)) == [expected]
+
+
+def test_dump_to_csv_path_matches_decode(tmp_path):
+    items = [InventoryItem(id=i, name=f"Item {i}", quantity=i * 2) for i in range(5)]
+    path = tmp_path / "out.csv"
+
+    written = InventoryItem.dump_to(path, (item for item in items), encoding="utf-8")
+
+    assert written == 5
+    assert path.read_bytes().decode("utf-8") == CSVModelFormatter().decode(items)
+    assert InventoryItem.loads(str(path), _format="csv", encoding="utf-8") == items
+
+
+def test_dump_to_text_and_binary_file_objects():
+    import io
+
+    items = [InventoryItem(id=1, name="Widget, large", quantity=3)]
+
+    text = io.StringIO()
+    InventoryItem.dump_to(text, items)
+    assert text.getvalue() == 'id,name,quantity\r\n1,"Widget, large",3\r\n'
+
+    raw = io.BytesIO()
+    InventoryItem.dump_to(raw, items, encoding="utf-8")
+    assert not raw.closed
+    assert raw.getvalue().decode("utf-8") == text.getvalue()
+
+
+def test_dump_to_streams_generator_rows():
+    import io
+
+    produced = []
+
+    def generate():
+        for i in range(3):
+            produced.append(i)
+            yield Skill(name=f"s{i}", level=i)
+
+    sink = io.StringIO()
+    assert Skill.dump_to(sink, generate()) == 3
+    assert produced == [0, 1, 2]
+    assert sink.getvalue().splitlines() == ["name,level", "s0,0", "s1,1", "s2,2"]
+
+
+def test_dump_to_writes_header_of_model_without_instances():
+    import io
+
+    sink = io.StringIO()
+    assert Skill.dump_to(sink, []) == 0
+    assert sink.getvalue() == "name,level\r\n"
+
+    sink = io.StringIO()
+    Skill.dump_to(sink, iter([]), exclude=["level"])
+    assert sink.getvalue() == "name\r\n"
+
+
+@pytest.mark.parametrize("_format", ["csv", "json", "dict", "binary"])
+def test_dump_to_rejects_instances_of_other_models(_format):
+    import io
+
+    sink = io.BytesIO() if _format == "binary" else io.StringIO()
+    with pytest.raises(TypeError, match="Expected an instance of 'Skill', got User"):
+        Skill.dump_to(sink, [User(id=1, username="a")], _format=_format)
+
+
+def test_dump_to_other_formats_write_decoded_payload(tmp_path):
+    path = tmp_path / "skills.json"
+
+    Skill.dump_to(path, [Skill(name="Go", level=7)], _format="json")
+
+    assert Skill.loads(path.read_text(), _format="json") == [Skill(name="Go", level=7)]
+
+
+def test_json_dump_uses_declared_types():
+    record = _record(parent=_record(id=2, tags=[]), note=None)
+
+    data = json.loads(record.dump("json"))
+
+    assert data["color"] == "blue"
+    assert data["created"] == "2024-01-02T03:04:05"
+    assert data["ref"] == str(uuid.UUID(int=7))
+    assert data["tags"] == [{"label": "a", "weight": 1.0}]
+    assert data["parent"]["id"] == 2 and data["parent"]["tags"] == []
+    assert Record.loads(record.dump("json"), _format="json") == record
+
+
+def test_json_dump_compact_and_untyped_values():
+    class Loose(BaseModel):
+        payload: typing.Any
+        mapping: typing.Dict[Color, typing.List[datetime.date]]
+
+    loose = Loose(
+        payload={"amount": decimal.Decimal("1.5"), "when": datetime.time(1, 2)},
+        mapping={Color.RED: [datetime.date(2024, 1, 2)]},
+    )
+
+    dumped = loose.dump("json", compact=True)
+
+    assert " " not in dumped
+    assert json.loads(dumped) == {
+        "payload": {"amount": "1.5", "when": "01:02:00"},
+        "mapping": {"red": ["2024-01-02"]},
+    }
+
+
+def test_json_dump_to_text_and_binary_sinks():
+    import io
+
+    skills = [Skill(name="Go", level=7), Skill(name="Zig", level=2)]
+
+    text = io.StringIO()
+    assert Skill.dump_to(text, iter(skills), _format="json") == 2
+    assert text.getvalue() == JSONModelFormatter().decode(skills)
+
+    raw = io.BytesIO()
+    Skill.dump_to(raw, skills, _format="json", compact=True)
+    assert raw.getvalue() == (b'[{"name":"Go","level":7},{"name":"Zig","level":2}]')
+    assert Skill.loads(raw.getvalue().decode(), _format="json") == skills
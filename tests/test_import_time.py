@@ -0,0 +1,119 @@
+import os
+import sys
+import subprocess
+
+import pytest
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+# Modules that ``import pydantic_mini`` must not import; they are imported on first use
+LAZY_MODULES = [
+    "array",
+    "asyncio",
+    "csv",
+    "datetime",
+    "decimal",
+    "json",
+    "mmap",
+    "locale",
+    "pickle",
+    "hashlib",
+    "logging",
+    "tempfile",
+    "uuid",
+    "pydantic_mini.accelerators",
+    "pydantic_mini.async_validation",
+    "pydantic_mini.batch",
+    "pydantic_mini.binary",
+    "pydantic_mini.cache",
+    "pydantic_mini.checkers",
+    "pydantic_mini.coercers",
+    "pydantic_mini.encoders",
+    "pydantic_mini.formatters",
+    "pydantic_mini.json_backends",
+    "pydantic_mini.projection",
+    "pydantic_mini.recursive",
+    "pydantic_mini.schema_cache",
+]
+
+# Budget of the cumulative import time of pydantic_mini, in milliseconds. Wall-clock
+# times depend on the machine, so the budget is only checked when the environment
+# variable is set, e.g. to 75, the import time of version 1.2.0 before any import
+# was deferred, which was 55-78 ms on the machines it was measured on.
+IMPORT_BUDGET_MS = os.environ.get("PYDANTIC_MINI_IMPORT_BUDGET_MS")
+
+
+def _import_times(statement="import pydantic_mini"):
+    """Return the cumulative import time of each module in microseconds, by name."""
+    pythonpath = os.environ.get("PYTHONPATH")
+    env = dict(
+        os.environ,
+        PYTHONPATH=SRC if not pythonpath else os.pathsep.join([SRC, pythonpath]),
+    )
+    env.pop("PYDANTIC_MINI_SCHEMA_CACHE_DIR", None)
+    # time imports from bytecode, as installed packages are, not from source
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_import_does_not_load_formatters():
+    # the interpreter may import some of the modules at startup, e.g. from site
+    startup = _import_times("pass")
+    imported = _import_times()
+
+    assert "pydantic_mini.base" in imported
+    assert [
+        name for name in LAZY_MODULES if name in imported and name not in startup
+    ] == []
+
+
+def test_lazy_names_are_imported_on_first_use():
+    statement = (
+        "import sys; "
+        "startup = set(sys.modules); "
+        "import pydantic_mini; "
+        "assert 'pydantic_mini.checkers' not in sys.modules; "
+        "from pydantic_mini import register_type_checker; "
+        "assert 'pydantic_mini.checkers' in sys.modules; "
+        "Event = type('Event', (pydantic_mini.BaseModel,), "
+        "{'__annotations__': {'when': int}}); "
+        "assert 'datetime' in startup or 'datetime' not in sys.modules; "
+        "Event(when=1); "
+        "assert 'datetime' in sys.modules; "
+        "assert 'pydantic_mini.formatters' not in sys.modules; "
+        "from pydantic_mini import ModelBatch; "
+        "assert pydantic_mini.formatters.BaseModelFormatter; "
+        "assert 'csv' in sys.modules; "
+        "assert 'ModelBatch' in dir(pydantic_mini)"
+    )
+    _import_times(statement)
+
+    with pytest.raises(AttributeError, match="has no attribute 'missing'"):
+        import pydantic_mini
+
+        pydantic_mini.missing
+
+
+@pytest.mark.skipif(
+    IMPORT_BUDGET_MS is None,
+    reason="set PYDANTIC_MINI_IMPORT_BUDGET_MS to check the import time",
+)
+def test_import_time_budget():
+    # the fastest of a few runs, to leave out noise from other processes and the
+    # compilation of the bytecode on the first run
+    elapsed_ms = min(_import_times()["pydantic_mini"] for _ in range(3)) / 1000
+
+    assert elapsed_ms < float(IMPORT_BUDGET_MS)
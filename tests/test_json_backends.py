@@ -0,0 +1,219 @@
+import io
+import json
+import typing
+import datetime
+
+import pytest
+
+from pydantic_mini import BaseModel, MiniAnnotated, Attrib
+from pydantic_mini import json_backends
+from pydantic_mini.json_backends import (
+    JSONBackend,
+    StdlibJSONBackend,
+    get_json_backend,
+    register_json_backend,
+    set_default_json_backend,
+)
+
+BACKENDS = ["json", "orjson", "ujson", "simdjson"]
+
+DOCUMENTS = [
+    {"name": "né ☃", "count": 3, "ratio": 0.25, "ok": True, "missing": None},
+    [1, -2, 3.5, "x", [], {}],
+    {"nested": {"list": [{"a": 1}, {"b": [True, False]}]}},
+    "text",
+    12345678901234,
+]
+
+
+class Event(BaseModel):
+    name: str
+    at: datetime.datetime
+    tags: MiniAnnotated[typing.List[str], Attrib(default_factory=list)]
+
+
+class OrjsonEvent(BaseModel):
+    name: str
+
+    class Config:
+        json_backend = "orjson"
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    try:
+        return get_json_backend(request.param)
+    except ImportError:
+        pytest.skip(f"{request.param} is not installed")
+
+
+@pytest.mark.parametrize("document", DOCUMENTS)
+def test_backend_round_trips_like_stdlib(backend, document):
+    for compact in (False, True):
+        dumped = backend.dumps(document, compact)
+        assert isinstance(dumped, str)
+        assert json.loads(dumped) == document
+        assert json.loads(backend.dumpb(document, compact)) == document
+
+    text = json.dumps(document)
+    for data in (text, text.encode("utf-8"), bytearray(text.encode("utf-8"))):
+        assert backend.loads(data) == document
+    assert backend.loads(memoryview(text.encode("utf-8"))) == document
+
+
+@pytest.mark.parametrize("data", ['{"a": 1', "[1, 2,]", "", b"\x00"])
+def test_backend_raises_json_decode_error(backend, data):
+    with pytest.raises(json.JSONDecodeError):
+        backend.loads(data)
+
+
+def test_model_dump_and_loads_match_across_backends(backend):
+    event = Event(name="launch", at=datetime.datetime(2024, 1, 2, 3, 4), tags=["é"])
+    stdlib = event.dump("json")
+
+    dumped = event.dump("json", json_backend=backend.name)
+    assert json.loads(dumped) == json.loads(stdlib)
+
+    payload = stdlib.encode("utf-8")
+    assert Event.loads(payload, _format="json", json_backend=backend.name) == event
+
+    sink = io.BytesIO()
+    Event.dump_to(sink, [event, event], _format="json", json_backend=backend.name)
+    assert json.loads(sink.getvalue()) == [json.loads(stdlib)] * 2
+
+
+class Keyed(BaseModel):
+    counts: typing.Dict[int, str]
+    flags: typing.Dict[bool, float]
+    extra: typing.Any
+
+
+@pytest.mark.parametrize("compact", [False, True])
+@pytest.mark.parametrize("ensure_ascii", [True, False])
+def test_dumps_are_identical_across_backends(backend, compact, ensure_ascii):
+    keyed = Keyed(
+        counts={1: "né", -2: "☃ \U0001f600"},
+        flags={True: 0.5, False: -1.0},
+        extra={None: ["a/b", '\u00e9\n"q"\x7f'], 2.5: {}, 3: [2**70, -(2**64)]},
+    )
+    options = {"compact": compact, "ensure_ascii": ensure_ascii}
+    stdlib = get_json_backend("json")
+
+    dumped = keyed.dump("json", json_backend=backend.name, **options)
+
+    assert dumped == keyed.dump("json", **options)
+    assert ('": ' in dumped) is not compact
+    assert ("né" in dumped) is not ensure_ascii
+    assert ("\\u00e9" in dumped) is ensure_ascii
+    assert json.loads(dumped)["counts"] == {"1": "né", "-2": "☃ \U0001f600"}
+    assert json.loads(dumped)["extra"]["null"] == ["a/b", 'é\n"q"\x7f']
+    assert json.loads(dumped)["extra"]["3"] == [2**70, -(2**64)]
+
+    sink = io.BytesIO()
+    Keyed.dump_to(sink, [keyed], _format="json", json_backend=backend.name, **options)
+    assert sink.getvalue().decode("utf-8") == f"[{dumped}]"
+
+    data = json.loads(dumped)
+    expected = stdlib.dumps(data, compact, ensure_ascii)
+    assert backend.dumps(data, compact, ensure_ascii) == expected
+    assert backend.dumpb(data, compact, ensure_ascii) == expected.encode("utf-8")
+
+
+def test_default_dump_escapes_non_ascii_characters():
+    event = Event(name="José", at=datetime.datetime(2024, 1, 1))
+
+    assert event.dump("json").startswith('{"name": "Jos\\u00e9"')
+    assert event.dump("json", ensure_ascii=False).startswith('{"name": "José"')
+
+
+@pytest.mark.parametrize(
+    "document", ["NaN", "[Infinity, -Infinity]", "1e400", '"\\ud800"', "-0.0"]
+)
+def test_backend_loads_documents_accepted_by_stdlib(backend, document):
+    expected = json.loads(document)
+
+    for data in (document, document.encode("utf-8"), memoryview(document.encode())):
+        assert json.dumps(backend.loads(data)) == json.dumps(expected)
+
+
+def test_backend_selected_by_config_and_default(monkeypatch):
+    pytest.importorskip("orjson")
+
+    assert get_json_backend() is get_json_backend("json")
+    assert OrjsonEvent(name="x").dump("json", compact=True) == '{"name":"x"}'
+    assert OrjsonEvent(name="x").dump("json") == '{"name": "x"}'
+
+    monkeypatch.setattr(json_backends, "_default_backend", "json")
+    set_default_json_backend("orjson")
+    assert get_json_backend().name == "orjson"
+    event = Event(name="x", at=datetime.datetime(2024, 1, 1))
+    assert event.dump("json", compact=True) == (
+        '{"name":"x","at":"2024-01-01T00:00:00","tags":[]}'
+    )
+
+
+def test_unknown_and_custom_backends(monkeypatch):
+    with pytest.raises(ValueError, match="Unknown JSON backend"):
+        Event.loads("{}", _format="json", json_backend="nope")
+
+    class UpperBackend(StdlibJSONBackend):
+        name = "upper"
+
+        def dumps(self, obj, compact=False, ensure_ascii=True):
+            return super().dumps(obj, compact, ensure_ascii).upper()
+
+    monkeypatch.setattr(json_backends, "_BACKEND_FACTORIES", {})
+    monkeypatch.setattr(json_backends, "_BACKENDS", {})
+    register_json_backend("upper", UpperBackend)
+
+    assert isinstance(get_json_backend("upper"), JSONBackend)
+    assert OrjsonEvent(name="x").dump("json", json_backend="upper") == '{"NAME": "X"}'
+
+
+def test_loads_from_buffers_paths_and_files(backend, tmp_path):
+    events = [
+        Event(name="é", at=datetime.datetime(2024, 1, 2), tags=["a"]),
+        Event(name="b", at=datetime.datetime(2024, 1, 3)),
+    ]
+    text = json.dumps([json.loads(event.dump("json")) for event in events])
+    data = text.encode("utf-8")
+    path = tmp_path / "events.json"
+    path.write_bytes(data)
+
+    sources = [
+        data,
+        bytearray(data),
+        memoryview(data),
+        path,
+        io.BytesIO(data),
+        io.StringIO(text),
+    ]
+    for source in sources:
+        loaded = Event.loads(source, _format="json", json_backend=backend.name)
+        assert loaded == events, type(source)
+
+    batch = Event.loads(path, _format="json", batch=True, json_backend=backend.name)
+    assert list(batch) == events
+
+
+def test_loads_rejects_unsupported_source():
+    with pytest.raises(TypeError, match="JSON source"):
+        Event.loads(123, _format="json")
+
+
+def test_loads_cache_hashes_buffers_in_place(tmp_path):
+    class Frozen(BaseModel):
+        name: str
+
+        class Config:
+            frozen = True
+            loads_cache_size = 4
+
+    data = b'{"name": "x"}'
+    path = tmp_path / "frozen.json"
+    path.write_bytes(data)
+
+    first = Frozen.loads(memoryview(data), _format="json")
+    assert Frozen.loads(path, _format="json") is first
+    assert Frozen.loads(bytearray(data), _format="json") is first
+    assert Frozen.loads_cache_info().bytes == len(data)
@@ -0,0 +1,172 @@
+import json
+import typing
+from collections import OrderedDict
+
+import pytest
+
+from pydantic_mini import BaseModel, MiniAnnotated, Attrib
+from pydantic_mini.projection import get_projection_plan
+
+
+class Author(BaseModel):
+    name: str
+    email: str
+
+
+class Comment(BaseModel):
+    text: str
+    author: Author
+
+
+class Article(BaseModel):
+    id: int
+    title: str
+    body: str
+    author: Author
+    comments: typing.List[Comment]
+    views: MiniAnnotated[int, Attrib(gt=0)] = 1
+
+
+def _article():
+    return Article(
+        id=1,
+        title="Hello",
+        body="Long text",
+        author=Author(name="Ann", email="ann@example.com"),
+        comments=[
+            Comment(text="Nice", author=Author(name="Bob", email="bob@example.com"))
+        ],
+    )
+
+
+def test_plan_is_compiled_once_per_spec():
+    plan = get_projection_plan(Article, include=("id", "author.name"))
+
+    assert plan is get_projection_plan(Article, include=("id", "author.name"))
+    # unhashable specs share the plan of the same parsed spec
+    assert plan is get_projection_plan(Article, include=["author.name", "id"])
+    assert plan is get_projection_plan(
+        Article, include={"id": True, "author": {"name"}}
+    )
+    assert plan.names == ("id", "author")
+    assert plan.children["author"].names == ("name",)
+    assert get_projection_plan(Article) is None
+
+
+def test_plan_errors():
+    with pytest.raises(ValueError, match="'missing' is not a field of Article"):
+        get_projection_plan(Article, include=["missing"])
+
+    with pytest.raises(ValueError, match="'nope' is not a field of Author"):
+        get_projection_plan(Article, exclude=["author.nope"])
+
+    with pytest.raises(
+        ValueError, match="Field 'title' of Article does not hold a model"
+    ):
+        get_projection_plan(Article, include=["title.length"])
+
+
+def test_dump_dict_include_and_exclude():
+    article = _article()
+
+    assert article.dump("dict", include=["id", "author.name"]) == {
+        "id": 1,
+        "author": {"name": "Ann"},
+    }
+    assert article.dump("dict", exclude=["body", "comments.author", "author"]) == {
+        "id": 1,
+        "title": "Hello",
+        "comments": [{"text": "Nice"}],
+        "views": 1,
+    }
+    # a whole field wins over paths below it
+    assert article.dump("dict", include=["author.name", "author"]) == {
+        "author": {"name": "Ann", "email": "ann@example.com"}
+    }
+
+
+def test_dump_json_and_csv_projection():
+    article = _article()
+
+    data = json.loads(
+        article.dump("json", include={"title": True, "comments": {"author": {"name"}}})
+    )
+    assert data == {"title": "Hello", "comments": [{"author": {"name": "Bob"}}]}
+
+    csv_output = Article.get_formatter_by_name("csv", exclude=["author", "comments"])
+    lines = csv_output.decode([article]).splitlines()
+    assert lines == ["id,title,body,views", "1,Hello,Long text,1"]
+
+
+def test_excluded_fields_are_not_visited():
+    class Exploding:
+        def __deepcopy__(self, memo):
+            raise AssertionError("excluded field was visited")
+
+    class Holder(BaseModel):
+        name: str
+        payload: typing.Any = None
+
+    holder = Holder(name="x", payload=Exploding())
+
+    assert holder.dump("dict", exclude=["payload"]) == {"name": "x"}
+
+
+def test_loads_validates_only_selected_fields():
+    data = {
+        "id": 1,
+        "title": "Hello",
+        "body": 42,
+        "author": {"name": "Ann", "email": "ann@example.com"},
+        "comments": "not a list",
+        "views": -5,
+    }
+
+    article = Article.loads(data, _format="dict", include=["id", "author.name"])
+
+    assert article.id == 1
+    assert isinstance(article.author, Author)
+    assert article.author.name == "Ann"
+    # fields left out keep the values they were given
+    assert article.body == 42
+    assert article.views == -5
+
+    with pytest.raises(TypeError, match="Field 'comments' should be of type"):
+        Article.loads(data, _format="dict")
+
+
+def test_loads_projection_does_not_leak_into_other_loads():
+    data = {"name": "Ann", "email": ["ann@example.com"]}
+
+    Author.loads(data, _format="dict", exclude=["email"])
+
+    with pytest.raises(TypeError, match="Field 'email' should be of type"):
+        Author.loads(data, _format="dict")
+
+
+def test_narrowed_plans_are_bounded(monkeypatch):
+    from pydantic_mini import encoders, projection
+
+    class Wide(BaseModel):
+        a: int = 0
+        b: int = 0
+        c: int = 0
+        d: int = 0
+
+        class Config:
+            track_changes = True
+
+    monkeypatch.setattr(projection, "_SELECTIONS", OrderedDict())
+    monkeypatch.setattr(projection, "_SELECTIONS_MAXSIZE", 3)
+    converters = len(encoders._MODEL_CONVERTERS)
+
+    for changed in ["a", "b", "c", "d", "ab", "cd", "abcd"]:
+        wide = Wide()
+        for name in changed:
+            setattr(wide, name, 1)
+        expected = {name: 1 for name in changed}
+        assert json.loads(wide.dump("json", only_changed=True)) == expected
+        assert wide.dump("dict", only_changed=True) == expected
+
+    assert len(projection._SELECTIONS) == 3
+    assert len(encoders._MODEL_CONVERTERS) == converters
@@ -0,0 +1,217 @@
+import re
+import sys
+import json
+import typing
+
+import pytest
+
+from pydantic_mini import BaseModel, MiniAnnotated, Attrib, ValidationError
+from pydantic_mini.recursive import is_recursive_model
+
+
+class TreeNode(BaseModel):
+    value: int
+    children: MiniAnnotated[typing.List["TreeNode"], Attrib(default_factory=list)]
+
+
+class Pair(BaseModel):
+    name: str
+    halves: typing.Optional[typing.Tuple["Pair", ...]] = None
+    by_key: typing.Optional[typing.Dict[str, "Pair"]] = None
+
+
+class Forest(BaseModel):
+    trees: typing.List[TreeNode]
+
+
+class Flat(BaseModel):
+    name: str
+
+
+class Shallow(BaseModel):
+    value: int
+    children: MiniAnnotated[typing.List["Shallow"], Attrib(default_factory=list)]
+
+    class Config:
+        max_depth = 3
+
+
+# deeper than the interpreter recursion limit
+DEPTH = 3 * sys.getrecursionlimit()
+
+# a tree level is two JSON levels, an object and its list of children, and the
+# json module of some Python versions recurses once per JSON level
+JSON_DEPTH = sys.getrecursionlimit() // 4
+
+
+def _chain(depth):
+    root = node = {"value": 0, "children": []}
+    for value in range(1, depth):
+        child = {"value": value, "children": []}
+        node["children"].append(child)
+        node = child
+    return root
+
+
+def _values(root):
+    values = []
+    while True:
+        values.append(root.value if isinstance(root, TreeNode) else root["value"])
+        children = root.children if isinstance(root, TreeNode) else root["children"]
+        if not children:
+            return values
+        root = children[0]
+
+
+def test_recursive_models_are_detected():
+    assert is_recursive_model(TreeNode)
+    assert is_recursive_model(Pair)
+    assert is_recursive_model(Forest)
+    assert not is_recursive_model(Flat)
+
+
+def test_deep_tree_loads_and_dumps_without_recursion():
+    root = TreeNode.loads(_chain(DEPTH), _format="dict")
+
+    assert _values(root) == list(range(DEPTH))
+    dumped = root.dump("dict")
+    assert _values(dumped) == list(range(DEPTH))
+    assert _values(TreeNode.loads(dumped, _format="dict")) == list(range(DEPTH))
+    assert _values(TreeNode(**_chain(DEPTH))) == list(range(DEPTH))
+
+
+def test_nested_tree_round_trips_through_json():
+    root = TreeNode.loads(_chain(JSON_DEPTH), _format="dict")
+    document = root.dump("json")
+    assert _values(TreeNode.loads(document, _format="json")) == list(range(JSON_DEPTH))
+
+
+def test_recursive_dump_matches_asdict():
+    data = {
+        "trees": [
+            {"value": 1, "children": [{"value": 2, "children": []}]},
+            {"value": 3, "children": []},
+        ]
+    }
+    forest = Forest.loads(data, _format="dict")
+
+    assert forest.dump("dict") == data
+    assert json.loads(forest.dump("json")) == data
+
+    pair = Pair(
+        name="a",
+        halves=({"name": "b"}, {"name": "c"}),
+        by_key={"d": {"name": "d"}},
+    )
+    assert pair.halves == (Pair(name="b"), Pair(name="c"))
+    assert pair.dump("dict")["halves"] == (
+        {"name": "b", "halves": None, "by_key": None},
+        {"name": "c", "halves": None, "by_key": None},
+    )
+    assert json.loads(pair.dump("json"))["by_key"]["d"]["name"] == "d"
+
+
+def test_max_depth():
+    Shallow.loads(_chain(4), _format="dict")
+
+    with pytest.raises(ValidationError, match="nested deeper than max_depth 3"):
+        Shallow.loads(_chain(5), _format="dict")
+
+    node = Shallow(value=0)
+    for _ in range(4):
+        node = Shallow(value=0, children=[node])
+    with pytest.raises(ValueError, match="nested deeper than max_depth 3"):
+        node.dump("dict")
+
+
+def test_cycles_are_rejected():
+    data = {"value": 0, "children": []}
+    data["children"].append(data)
+    with pytest.raises(ValidationError, match="contains itself"):
+        TreeNode.loads(data, _format="dict")
+
+    node = TreeNode(value=0)
+    node.children.append(node)
+    with pytest.raises(ValueError, match="holds itself"):
+        node.dump("dict")
+
+
+class Address(BaseModel):
+    city: str
+
+
+class Person(BaseModel):
+    home: Address
+    work: Address
+    others: typing.Dict[str, Address]
+
+
+def test_shared_instances_are_dumped_once_with_reuse():
+    address = Address(city="Accra")
+    person = Person(home=address, work=address, others={"a/b~": address})
+
+    data = person.dump("dict")
+    assert data["home"] == data["work"] and data["home"] is not data["work"]
+
+    data = person.dump("dict", references="reuse")
+    assert data["home"] == {"city": "Accra"}
+    assert data["home"] is data["work"] is data["others"]["a/b~"]
+
+
+def test_shared_instances_are_dumped_as_json_pointers_with_ref():
+    address = Address(city="Accra")
+    person = Person(home=Address(city="Kumasi"), work=address, others={"a/b~": address})
+
+    assert json.loads(person.dump("json", references="ref")) == {
+        "home": {"city": "Kumasi"},
+        "work": {"city": "Accra"},
+        "others": {"a/b~": {"$ref": "#/work"}},
+    }
+
+    # pointer tokens escape "~" and "/"
+    person = Person(home=address, work=address, others={"a/b~": Address(city="Ho")})
+    person.others["x"] = person.others["a/b~"]
+    assert person.dump("dict", references="ref") == {
+        "home": {"city": "Accra"},
+        "work": {"$ref": "#/home"},
+        "others": {"a/b~": {"city": "Ho"}, "x": {"$ref": "#/others/a~1b~0"}},
+    }
+
+
+def test_cycles_are_dumped_as_references_with_ref():
+    root = TreeNode(value=0)
+    child = TreeNode(value=1, children=[TreeNode(value=2)])
+    root.children.extend([child, child])
+    child.children[0].children.append(root)
+
+    assert json.loads(root.dump("json", references="ref")) == {
+        "value": 0,
+        "children": [
+            {
+                "value": 1,
+                "children": [{"value": 2, "children": [{"$ref": "#"}]}],
+            },
+            {"$ref": "#/children/0"},
+        ],
+    }
+
+    for references in (None, "copy", "reuse"):
+        with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "Instance of 'TreeNode' at children[0].children[0].children[0] "
+                "is the instance at the root, which holds itself"
+            ),
+        ):
+            root.dump("dict", references=references)
+
+
+def test_references_option_errors():
+    address = Address(city="Accra")
+    person = Person(home=address, work=address, others={})
+
+    with pytest.raises(ValueError, match="references must be one of"):
+        person.dump("dict", references="pointer")
+
+    with pytest.raises(ValueError, match="cannot be combined with include"):
+        person.dump("json", references="ref", include=["home"])
@@ -0,0 +1,140 @@
+import os
+import sys
+import uuid
+import importlib
+import textwrap
+
+import pytest
+
+from pydantic_mini import ValidationError
+from pydantic_mini.schema_cache import (
+    clear_schema_cache,
+    schema_cache_info,
+    set_schema_cache_dir,
+)
+
+MODELS = """
+from __future__ import annotations
+
+import typing
+
+from pydantic_mini import BaseModel, MiniAnnotated, Attrib
+from {aliases} import Tags
+
+
+class Address(BaseModel):
+    city: str
+    zip: MiniAnnotated[str, Attrib(max_length=5)] = "00000"
+
+
+class Person(BaseModel):
+    name: str
+    age: MiniAnnotated[int, Attrib(gt=0)]
+    address: typing.Optional[Address]
+    tags: Tags = ()
+    nickname = "none"
+"""
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    set_schema_cache_dir(tmp_path / "cache")
+    clear_schema_cache()
+    yield tmp_path
+    set_schema_cache_dir(None)
+
+
+def _write(path, source):
+    path.write_text(textwrap.dedent(source))
+    # a new mtime, even within the resolution of the file system
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    importlib.invalidate_caches()
+
+
+def _import(name):
+    sys.modules.pop(name, None)
+    return importlib.import_module(name)
+
+
+def _write_models(directory, tags="typing.Tuple[str, ...]"):
+    suffix = uuid.uuid4().hex
+    aliases = f"aliases_{suffix}"
+    _write(directory / f"{aliases}.py", f"import typing\nTags = {tags}\n")
+    _write(directory / f"models_{suffix}.py", MODELS.format(aliases=aliases))
+    return f"models_{suffix}", aliases
+
+
+def _check(module):
+    person = module.Person(name="Ann", age=3, address={"city": "Accra"})
+    assert person.address == module.Address(city="Accra", zip="00000")
+    assert person.tags == ()
+    assert person.nickname == "none"
+    with pytest.raises(ValidationError):
+        module.Person(name="Ann", age=-1, address=None)
+    with pytest.raises(ValidationError):
+        module.Address(city="Accra", zip="123456")
+
+
+def test_models_are_read_from_the_cache(cache_dir):
+    name, _ = _write_models(cache_dir)
+
+    first = _import(name)
+    assert schema_cache_info() == (0, 2, 2)
+    second = _import(name)
+    assert schema_cache_info() == (2, 2, 2)
+
+    for model in ("Address", "Person"):
+        annotations = getattr(first, model).__annotations__
+        cached = getattr(second, model).__annotations__
+        assert list(cached) == list(annotations)
+        assert repr(cached).replace(name, "") == repr(annotations).replace(name, "")
+    _check(first)
+    _check(second)
+
+
+def test_editing_the_source_or_an_alias_invalidates_entries(cache_dir):
+    name, aliases = _write_models(cache_dir)
+    _import(name)
+
+    # the models are unchanged, but a name used by Person now means another type
+    _write(cache_dir / f"{aliases}.py", "import typing\nTags = typing.List[str]\n")
+    _import(aliases)
+    module = _import(name)
+    assert schema_cache_info() == (1, 3, 3)
+    assert module.Person(name="Ann", age=3, address=None, tags=["a"]).tags == ["a"]
+
+    path = cache_dir / f"{name}.py"
+    _write(path, path.read_text().replace("max_length=5", "max_length=6"))
+    module = _import(name)
+    assert schema_cache_info() == (1, 5, 5)
+    assert module.Address(city="Accra", zip="123456").zip == "123456"
+
+
+def test_models_with_unrestorable_values_are_not_cached(cache_dir):
+    path = cache_dir / f"lambdas_{uuid.uuid4().hex}.py"
+    _write(
+        path,
+        """
+        from pydantic_mini import BaseModel, MiniAnnotated, Attrib
+
+
+        class Coded(BaseModel):
+            code: MiniAnnotated[str, Attrib(pre_formatter=lambda value: value.upper())]
+        """,
+    )
+
+    assert _import(path.stem).Coded(code="ab").code == "AB"
+    assert _import(path.stem).Coded(code="ab").code == "AB"
+    assert schema_cache_info() == (0, 2, 0)
+
+
+def test_cache_is_disabled_by_default(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    clear_schema_cache()
+    name, _ = _write_models(tmp_path)
+
+    _check(_import(name))
+    assert schema_cache_info() == (0, 0, 0)
+    assert not (tmp_path / "cache").exists()